@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# модули лежат в корне репозитория, пакета нет
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tyap import load_language_parser  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def language_parser():
+    return load_language_parser()
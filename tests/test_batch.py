@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from tyap_runtime import CollectSink, ExecutionError, Interpreter, Limits, compile_program, run_batch
+
+NAMES = ["a", "b", "c"]
+# граничные значения int64 и float: пакет должен давать тот же результат, что Interpreter
+VALUES = [0, 1, -1, 2, 3, 7, -5, 100, 2 ** 31, 2 ** 53 + 1, 2 ** 62, 2 ** 63 - 1, -2 ** 63, 10 ** 20,
+          0.5, -2.5, 1e300, float("inf"), float("nan"), True, False]
+LIMITS = Limits(instructions=2000)
+
+
+class ProgramGenerator:
+    """Случайные программы языка (по LANGUAGE_GRAMMAR) с одной группой переменных"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def program(self):
+        rng = self.rng
+        statements = "".join(self.statement(0) + "; " for _ in range(rng.randrange(1, 6)))
+        return f"program var a, b, c: {rng.choice('%!$')}; begin read(a, b); {statements}end."
+
+    def statement(self, depth):
+        rng = self.rng
+        r = rng.random()
+        if depth > 2 or r < 0.35:
+            return f"{rng.choice(NAMES)} ass {self.expression(depth)}"
+        if r < 0.5:
+            otherwise = f" else {self.statement(depth + 1)}" if rng.random() < 0.5 else ""
+            return f"if {self.expression(depth)} then {self.statement(depth + 1)}{otherwise}"
+        if r < 0.6:
+            return f"while {self.expression(depth)} do {self.statement(depth + 1)}"
+        if r < 0.7:
+            return (f"for {rng.choice(NAMES)} ass {self.expression(depth)} to {self.expression(depth)} "
+                    f"do {self.statement(depth + 1)}")
+        if r < 0.8:
+            body = "".join(self.statement(depth + 1) + "; " for _ in range(rng.randrange(3)))
+            return f"begin {body}end"
+        if r < 0.85:
+            return f"read({', '.join(rng.sample(NAMES, rng.randrange(1, 3)))})"
+        return f"write({', '.join(self.expression(depth) for _ in range(rng.randrange(1, 3)))})"
+
+    def expression(self, depth):
+        rng = self.rng
+        if rng.random() < 0.1:
+            return f"not {self.factor(depth)}"
+        text = self.sum(depth)
+        if rng.random() < 0.3:
+            text += f" {rng.choice(['=', '<', '>', '<=', '>='])} {self.sum(depth)}"
+        return text
+
+    def sum(self, depth):
+        text = self.product(depth)
+        while self.rng.random() < 0.3:
+            text += f" {self.rng.choice(['+', '-', 'or'])} {self.product(depth)}"
+        return text
+
+    def product(self, depth):
+        text = self.factor(depth)
+        while self.rng.random() < 0.3:
+            text += f" {self.rng.choice(['*', '/', 'and'])} {self.factor(depth)}"
+        return text
+
+    def factor(self, depth):
+        rng = self.rng
+        r = rng.random()
+        if depth > 3 or r < 0.4:
+            return rng.choice(NAMES)
+        if r < 0.6:
+            return rng.choice(["0", "1", "2", "10", "3.5", "4611686018427387904", "9223372036854775807"])
+        if r < 0.65:
+            return rng.choice(["true", "false"])
+        return f"({self.expression(depth + 1)})"
+
+
+def scalar_outcome(program, inputs):
+    sink = CollectSink()
+    try:
+        Interpreter(program, LIMITS).run(list(inputs), sink)
+    except ExecutionError as e:
+        return sink.rows, str(e)
+    return sink.rows, None
+
+
+def batch_outcomes(program, inputs, scalar_threshold):
+    results = run_batch(program, [list(values) for values in inputs], scalar_threshold=scalar_threshold,
+                        limits=LIMITS)
+    return [(result.sink.rows, None if result.error is None else str(result.error)) for result in results]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_batch_matches_scalar(seed):
+    rng = random.Random(seed)
+    program = compile_program(ProgramGenerator(rng).program())
+    inputs = [[rng.choice(VALUES) for _ in range(rng.randrange(1, 5))] for _ in range(60)]
+    expected = [scalar_outcome(program, values) for values in inputs]
+    for scalar_threshold in (0.0, 0.05, 1.0):
+        # repr: nan != nan, а вывод должен совпадать и в этом случае
+        assert repr(batch_outcomes(program, inputs, scalar_threshold)) == repr(expected)
+
+
+@pytest.mark.parametrize("text, inputs", [
+    ("program var a, b: %; begin read(a, b); a ass a * b; write(a); a ass a + a; write(a); end.",
+     [[3, 4], [2 ** 40, 2 ** 40], [2 ** 62, 2], [-2 ** 63, -1], [2 ** 63 - 1, 1]]),
+    ("program var a: %; begin a ass 100000000000000000000; write(a + 1); end.", [[], []]),
+    ("program var a, b: %; begin read(a, b); a ass a * 1.5; write(a); end.",
+     [[1, 0], [float("inf"), 0], [float("nan"), 0], [1e300, 0], [10 ** 20, 0]]),
+    ("program var i, a: %; begin read(a); for i ass a to 9223372036854775807 do write(i); end.",
+     [[2 ** 63 - 3], [2 ** 63 - 1]]),
+    ("program var a, b: %; begin read(a, b); write(a / b, a < 0.5, a = 9007199254740993.0); end.",
+     [[2 ** 53 + 1, 3], [9007199254740993, 1], [1, 0]]),
+])
+def test_int64_edge_cases(text, inputs):
+    program = compile_program(text)
+    expected = [scalar_outcome(program, values) for values in inputs]
+    for scalar_threshold in (0.0, 1.0):
+        assert repr(batch_outcomes(program, inputs, scalar_threshold)) == repr(expected)
+
+
+def test_unrepresentable_value_is_execution_error():
+    program = compile_program("program var a, b: %; begin read(a, b); a ass a * 1.0; write(a); end.")
+    with pytest.raises(ExecutionError, match="variable a"):
+        Interpreter(program).run([float("inf"), 0])
+    with pytest.raises(ExecutionError, match="variable a"):
+        Interpreter(program).run([float("nan"), 0])
@@ -0,0 +1,82 @@
+import copy
+import random
+
+import pytest
+
+from tyap import CompressedTable, LL1Parser, load_language_parser
+from tyap_bench import sample_sentence
+
+
+def assert_same_lookups(table, compressed, terminals):
+    for nt, row in table.items():
+        compressed_row = compressed[nt]
+        for terminal in list(terminals) + ["$", "нет такого терминала"]:
+            assert compressed.lookup(nt, terminal) == row.get(terminal)
+            assert (terminal in compressed_row) == (terminal in row)
+            if terminal in row:
+                assert compressed_row[terminal] == row[terminal]
+            else:
+                with pytest.raises(KeyError):
+                    compressed_row[terminal]
+        assert set(compressed_row) == set(row)
+        assert len(compressed_row) == len(row)
+    # нетерминал без строки - пустая строка, как у defaultdict(dict)
+    assert len(compressed["нет такого нетерминала"]) == 0
+    assert compressed.lookup("нет такого нетерминала", "$") is None
+    assert set(compressed) == set(table)
+
+
+def test_language_table(language_parser):
+    table = language_parser.table
+    assert_same_lookups(table, CompressedTable(table, language_parser.terminals), language_parser.terminals)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_tables(seed):
+    # разреженные таблицы с повторяющимися строками и частыми значениями по умолчанию
+    rng = random.Random(seed)
+    terminals = [f"t{i}" for i in range(rng.randrange(1, 40))]
+    productions = [[f"s{i}"] for i in range(rng.randrange(1, 10))]
+    shapes = []
+    for _ in range(rng.randrange(1, 6)):
+        density = rng.random()
+        shapes.append({t: rng.choice(productions) for t in terminals if rng.random() < density})
+    table = {f"N{i}": dict(rng.choice(shapes)) for i in range(rng.randrange(1, 60))}
+    for row in table.values():
+        if row and rng.random() < 0.3:
+            row[rng.choice(list(row))] = rng.choice(productions)
+    assert_same_lookups(table, CompressedTable(table, terminals), terminals)
+
+
+def parse_outcome(parser, tokens):
+    try:
+        return parser.parse(tokens), parser.parse_with_recovery(tokens), parser.parse_to_tree(tokens).to_nested()
+    except SyntaxError as e:
+        return str(e), parser.parse_with_recovery(tokens)
+
+
+def test_parsers_agree_on_sentences(language_parser):
+    compressed = copy.copy(language_parser)
+    compressed.compress_table()
+    assert isinstance(compressed.table, CompressedTable)
+    assert isinstance(language_parser.table, dict)
+    rng = random.Random(1)
+    terminals = list(language_parser.terminals)
+    checked = 0
+    while checked < 300:
+        tokens = sample_sentence(language_parser, rng, 40)
+        if tokens is None:
+            continue
+        checked += 1
+        assert parse_outcome(compressed, tokens) == parse_outcome(language_parser, tokens)
+        # искаженная цепочка: ошибки и восстановление тоже должны совпадать
+        mutated = list(tokens)
+        mutated[rng.randrange(len(mutated))] = rng.choice(terminals)
+        assert parse_outcome(compressed, mutated) == parse_outcome(language_parser, mutated)
+
+
+def test_compress_is_idempotent():
+    parser = load_language_parser()
+    table = parser.compress_table()
+    assert parser.compress_table() is table
+    assert isinstance(parser, LL1Parser)
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from tyap import IncrementalParser, LexerFA
+
+PROGRAM = """program var a, b, s: %;
+begin
+    read(a, b);
+    s ass 0;
+    while a > 0 do
+    begin
+        s ass s + a * b;
+        if s > 100 then s ass s - 100 else s ass s + 1;
+        a ass a - 1;
+    end;
+    write(s, a);
+end.
+"""
+
+# (что заменить, на что) - правки внутри операторов, на границах и ломающие разбор
+EDITS = [
+    ("s ass 0", "s ass 10"),
+    ("a * b", "(a + 1) * b"),
+    ("s - 100", "s - 100 - b"),
+    ("write(s, a)", "write(s)"),
+    ("read(a, b);", "read(a, b);\n    b ass b * 2;"),
+    ("a ass a - 1;", ""),
+    ("if s > 100", "if s > 100 + 1"),
+    ("while a > 0", "while a >"),
+    ("s ass s + 1", "s ass s +"),
+    ("begin\n    read", "begin read"),
+]
+
+
+def full_parse(parser, text):
+    """Токены и дерево разбора всего текста или текст синтаксической ошибки"""
+    tokens = LexerFA(verbose=False).tokenize(text).tokens
+    try:
+        return tokens, parser.parse_to_tree(tokens).to_nested()
+    except SyntaxError as e:
+        return tokens, str(e)
+
+
+def incremental_edit(incremental, start, end, new_text):
+    try:
+        tree = incremental.edit(start, end, new_text)
+    except SyntaxError as e:
+        return incremental.tokens, str(e)
+    return incremental.tokens, tree.compacted().to_nested()
+
+
+def test_edits_match_full_reparse(language_parser):
+    incremental = IncrementalParser(language_parser, PROGRAM)
+    for old, new in EDITS:
+        text = incremental.text
+        start = text.index(old)
+        expected = full_parse(language_parser, text[:start] + new + text[start + len(old):])
+        assert incremental_edit(incremental, start, start + len(old), new) == expected
+        assert incremental.text == text[:start] + new + text[start + len(old):]
+        if isinstance(expected[1], str):
+            # вернуть исходный текст правки
+            assert incremental_edit(incremental, start, start + len(new), old) == full_parse(language_parser, text)
+
+
+def test_local_edit_is_incremental(language_parser):
+    incremental = IncrementalParser(language_parser, PROGRAM)
+    start = PROGRAM.index("s ass 0") + len("s ass ")
+    incremental.edit(start, start + 1, "42")
+    assert incremental.last_mode == "incremental"
+    assert incremental.tree.compacted().to_nested() == full_parse(language_parser, incremental.text)[1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_match_full_reparse(language_parser, seed):
+    rng = random.Random(seed)
+    pieces = ["a", "b", "s", "1", "23", "+", "-", "*", " ", ";", "(", ")", "ass", "<", "not", "x"]
+    incremental = IncrementalParser(language_parser, PROGRAM)
+    body = PROGRAM.index("begin")
+    modes = set()
+    for _ in range(60):
+        text = incremental.text
+        if rng.random() < 0.5:
+            # замена имени или числа в теле: программа остается правильной
+            candidates = [i for i, token in enumerate(incremental.tokens)
+                          if token in ("идентификатор", "число") and incremental.token_offsets[i] > body]
+            start = incremental.token_offsets[rng.choice(candidates)]
+            end = start + 1
+            while end < len(text) and text[end].isalnum():
+                end += 1
+            new = rng.choice(["a", "b", "s", "7", "100"])
+        else:
+            start = rng.randrange(len(text) + 1)
+            end = min(len(text), start + rng.randrange(4))
+            new = "".join(rng.choice(pieces) for _ in range(rng.randrange(3)))
+        expected = full_parse(language_parser, text[:start] + new + text[end:])
+        assert incremental_edit(incremental, start, end, new) == expected
+        modes.add(incremental.last_mode)
+        if isinstance(expected[1], str):
+            # вернуться к разбираемой программе
+            assert incremental_edit(incremental, start, start + len(new), text[start:end]) == \
+                full_parse(language_parser, text)
+    assert "incremental" in modes
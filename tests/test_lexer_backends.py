@@ -0,0 +1,54 @@
+import os
+import random
+
+import pytest
+
+from tyap import DATA_TYPES, DELIMITERS, KEYWORDS, LexerFA, _numpy
+
+# без NumPy backend="numpy" разбирает автоматом, и сравнение ничего не проверяет
+BACKENDS = ["regex", pytest.param("numpy", marks=pytest.mark.skipif(_numpy() is None, reason="NumPy not installed"))]
+
+FIELDS = ("tokens", "token_types", "token_offsets", "line_starts", "identifier_table",
+          "identifier_hash", "token_values", "constants")
+
+PIECES = (sorted(KEYWORDS) + sorted(DELIMITERS) + sorted(DATA_TYPES)
+          + ["a", "b1", "x_y", "Abc", "0", "7", "42", "3.14", "1e5", "2.5E-3", "1.", ".5", "12e",
+             "{ comment }", "{", "}", "<=", ">=", "<", ">", ":", "=", " ", "  ", "\n", "\t", "@", "#", "_"])
+
+
+def lex(backend, text):
+    """Поля LexResult или тип и текст исключения"""
+    try:
+        result = LexerFA(verbose=False, backend=backend).tokenize(text)
+    except Exception as e:
+        return type(e).__name__, str(e)
+    return {field: getattr(result, field) for field in FIELDS}
+
+
+def random_text(rng):
+    # куски без разделителей, чтобы проверить и склейку лексем
+    separators = ["", " ", "\n"]
+    return "".join(rng.choice(PIECES) + rng.choice(separators) for _ in range(rng.randrange(1, 40)))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("seed", range(20))
+def test_backend_matches_fa_on_random_text(backend, seed):
+    rng = random.Random(seed)
+    for _ in range(50):
+        text = random_text(rng)
+        assert lex(backend, text) == lex("fa", text), text
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_matches_fa_on_programs(backend):
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_programs.tyap")
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert lex(backend, text) == lex("fa", text)
+
+
+@pytest.mark.skipif(_numpy() is None, reason="NumPy not installed")
+def test_numpy_backend_falls_back_on_non_ascii():
+    text = "program var б: %; begin б ass 1; end."
+    assert lex("numpy", text) == lex("fa", text)
@@ -0,0 +1,82 @@
+import pytest
+
+import tyap_server
+from tyap_runtime import CollectSink, Interpreter, LimitExceeded, Limits, compile_program, run_batch
+
+FOREVER = "program var a: %; begin a ass 1; write(a); while a > 0 do a ass a + 1; end."
+OUTPUT_LOOP = "program var a: %; begin read(a); while a > 0 do write(a); end."
+COUNTDOWN = "program var a: %; begin read(a); while a > 0 do a ass a - 1; write(a); end."
+
+
+def run(text, limits, inputs=()):
+    sink = CollectSink()
+    with pytest.raises(LimitExceeded) as info:
+        Interpreter(compile_program(text), limits).run(list(inputs), sink)
+    return info.value, sink
+
+
+def test_instruction_limit():
+    error, sink = run(FOREVER, Limits(instructions=1000))
+    assert error.limit == "instructions"
+    assert error.budget == 1000 and error.used > 1000
+    # вывод до ошибки сохраняется
+    assert sink.rows == [(1,)]
+
+
+def test_instruction_count_is_per_iteration_cost():
+    program = compile_program(COUNTDOWN)
+    # условие a > 0 (3 узла) и тело a ass a - 1 (4 узла): 7 инструкций на итерацию
+    assert Interpreter(program, Limits(instructions=70)).run([10]).rows == [(0,)]
+    with pytest.raises(LimitExceeded, match="instructions 77 > 76"):
+        Interpreter(program, Limits(instructions=76)).run([11])
+
+
+def test_seconds_limit():
+    error, _ = run(FOREVER, Limits(seconds=0.05))
+    assert error.limit == "seconds"
+    assert error.used >= 0.05    # округляется до миллисекунд
+
+
+def test_memory_limit():
+    error, sink = run(OUTPUT_LOOP, Limits(memory=100000), [1])
+    assert error.limit == "memory"
+    assert error.used > 100000
+    assert sink.rows and set(sink.rows) == {(1,)}
+
+
+def test_no_limit_is_hit_by_finishing_program():
+    program = compile_program(COUNTDOWN)
+    assert Interpreter(program, Limits(10 ** 6, 10.0, 10 ** 6)).run([100]).rows == [(0,)]
+
+
+@pytest.mark.parametrize("limits", [Limits(instructions=300), Limits(memory=20000)])
+@pytest.mark.parametrize("scalar_threshold", [0.0, 0.05, 1.0])
+def test_batch_limits_match_scalar(limits, scalar_threshold):
+    program = compile_program("program var a, b: %; begin read(a); b ass 0; "
+                              "while a > 0 do begin a ass a - 1; b ass b + 1; write(b); end; end.")
+    inputs = [[n] for n in (0, 1, 5, 20, 40, 100, 1000)]
+    expected = []
+    for values in inputs:
+        sink = CollectSink()
+        try:
+            Interpreter(program, limits).run(values, sink)
+            expected.append((sink.rows, None))
+        except LimitExceeded as e:
+            expected.append((sink.rows, str(e)))
+    results = run_batch(program, inputs, scalar_threshold=scalar_threshold, limits=limits)
+    assert [(r.sink.rows, None if r.error is None else str(r.error)) for r in results] == expected
+    assert any(error is not None for _, error in expected)
+
+
+def test_server_reports_limit():
+    response = tyap_server.process_request({"id": 7, "op": "run", "program": FOREVER,
+                                            "limits": {"instructions": 500}})
+    assert response["ok"] is False
+    assert response["limit"] == "instructions"
+    assert response["output"] == "1\n"
+
+
+def test_server_limits_cannot_exceed_defaults():
+    limits = tyap_server.request_limits({"limits": {"instructions": 10 ** 12, "seconds": -1}})
+    assert limits.instructions == tyap_server.RUN_LIMITS.instructions
+    assert limits.seconds == tyap_server.RUN_LIMITS.seconds
@@ -1,16 +1,50 @@
 # Полная связка: Lexer + LL(1) Parser с тестами
-from collections import defaultdict, deque
-import hashlib
-from typing import List, Dict, Tuple, Set
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections import Counter, defaultdict, deque, namedtuple
+from collections.abc import Mapping
 from copy import deepcopy
-from typing import List, Dict, Set
+
+# typing нужен только для аннотаций (они не вычисляются), поэтому не импортируется при запуске
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Set, Tuple
+
+
+def ordered_set(items=()) -> Dict:
+    """
+    Упорядоченное множество на основе dict (значения не используются).
+    Порядок обхода совпадает с порядком добавления и не зависит от PYTHONHASHSEED,
+    поэтому результаты преобразований побайтно совпадают между запусками.
+    """
+    return dict.fromkeys(items)
+
+
+def ordered_symbols(symbols, productions) -> Dict:
+    """
+    Упорядочивает символы: сначала в порядке появления в правилах (нетерминалы -
+    в порядке ключей productions, затем символы из правых частей), остальные - по алфавиту.
+    """
+    symbols = set(symbols)
+    result = ordered_set(nt for nt in productions if nt in symbols)
+    for rhs_list in productions.values():
+        for rhs in rhs_list:
+            for symbol in rhs:
+                if symbol in symbols:
+                    result.setdefault(symbol)
+    for symbol in sorted(symbols):
+        result.setdefault(symbol)
+    return result
+
 
 class Grammar:
     def __init__(self, grammar: Dict):
-        self.non_terminals = set(grammar['nonterminals'])
-        self.terminals = set(grammar['terminals'])
-        self.start_symbol = grammar['start_symbol']
         self.productions = deepcopy(grammar['productions'])
+        self.non_terminals = ordered_symbols(grammar['nonterminals'], self.productions)
+        self.terminals = ordered_symbols(grammar['terminals'], self.productions)
+        self.start_symbol = grammar['start_symbol']
 
     def toDict(self):
         return {
@@ -21,13 +55,13 @@ class Grammar:
         }
         
     def _collect_terminals(self):
-        """Собирает все терминальные символы из правил"""
-        terminals = set()
+        """Собирает все терминальные символы из правил (в порядке появления)"""
+        terminals = ordered_set()
         for rhs_list in self.productions.values():
             for rhs in rhs_list:
                 for symbol in rhs:
                     if symbol not in self.non_terminals and symbol:
-                        terminals.add(symbol)
+                        terminals.setdefault(symbol)
         return terminals
     
     def check_language_existence(self):
@@ -84,7 +118,9 @@ class Grammar:
                             break
         
         new_productions = {}
-        for A in generating:
+        for A in self.non_terminals:
+            if A not in generating:
+                continue
             new_rhs = []
             for production in self.productions[A]:
                 if all((sym not in self.non_terminals) or (sym in generating) for sym in production):
@@ -115,7 +151,7 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = generating
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
     def eliminate_unreachable(self):
@@ -127,7 +163,7 @@ class Grammar:
         print("\n2.2 Устранение недостижимых символов (алгоритм 4.3):")
         unreachable_before = set(self.non_terminals)
         
-        reachable = set([self.start_symbol])
+        reachable = ordered_set([self.start_symbol])
         changed = True
         
         while changed:
@@ -136,12 +172,14 @@ class Grammar:
                 for production in self.productions.get(A, []):
                     for sym in production:
                         if sym in self.non_terminals and sym not in reachable:
-                            reachable.add(sym)
+                            reachable.setdefault(sym)
                             changed = True
         
         # Удаляем недостижимые нетерминалы и правила
         new_productions = {}
-        for A in reachable:
+        for A in self.non_terminals:
+            if A not in reachable:
+                continue
             new_rhs = []
             for production in self.productions[A]:
                 if all((sym not in self.non_terminals) or (sym in reachable) for sym in production):
@@ -173,17 +211,11 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = set(new_productions.keys())
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
-    def remove_epsilon_rules(self):
-        print("\n2.3 Устранение ε-правил (алгоритм 4.4):")
-        # Список нетерминалов, для которых ε-альтернатива должна сохраняться
-        preserve_nullable = {
-            "оператор_список", "сумма_хвост", "произведение_хвост", "описание_хвост",
-            "ввода_хвост", "вывода_хвост", "текст_комментария", "ид_хвост"
-        }
-
+    def nullable_symbols(self) -> Set[str]:
+        """Множество ε-порождающих нетерминалов"""
         nullable = set()
         changed = True
         while changed:
@@ -194,17 +226,44 @@ class Grammar:
                         if head not in nullable:
                             nullable.add(head)
                             changed = True
+        return nullable
+
+    def remove_epsilon_rules(self, preserve_nullable=None):
+        print("\n2.3 Устранение ε-правил (алгоритм 4.4):")
+        # Список нетерминалов, для которых ε-альтернатива должна сохраняться
+        if preserve_nullable is None:
+            preserve_nullable = {
+                "оператор_список", "сумма_хвост", "произведение_хвост", "описание_хвост",
+                "ввода_хвост", "вывода_хвост", "текст_комментария", "ид_хвост"
+            }
+
+        nullable = self.nullable_symbols()
 
         print(f" Множество ε-порождающих нетерминалов: {', '.join(sorted(nullable))}")
 
+        # нетерминалы, остающиеся ε-порождающими (сохраненное ε-правило или правая часть
+        # из таких же нетерминалов): вариант правила без них не нужен и делает грамматику
+        # неоднозначной (A -> X A | X | ε при X =>* ε)
+        kept = set()
+        changed = True
+        while changed:
+            changed = False
+            for head, bodies in self.productions.items():
+                if head not in kept and any((not body and head in preserve_nullable)
+                                            or (body and all(sym in kept for sym in body)) for body in bodies):
+                    kept.add(head)
+                    changed = True
+        nullable -= kept
+
         new_productions = {}
         for head, bodies in self.productions.items():
-            new_bodies = set()
+            # упорядоченное множество: порядок правил не зависит от хеширования кортежей
+            new_bodies = ordered_set()
             for body in bodies:
                 if not body:
                     # сохраняем ε-правило, если оно разрешено
                     if head in preserve_nullable:
-                        new_bodies.add(tuple())
+                        new_bodies.setdefault(tuple())
                     continue
                 nullable_indices = [i for i, sym in enumerate(body) if sym in nullable]
                 for mask in range(1 << len(nullable_indices)):
@@ -213,11 +272,11 @@ class Grammar:
                     for i, sym in enumerate(body):
                         if i not in nullable_indices or include[nullable_indices.index(i)]:
                             new_body.append(sym)
-                    new_bodies.add(tuple(new_body))
+                    new_bodies.setdefault(tuple(new_body))
             new_productions[head] = [list(b) for b in new_bodies]
 
         # Восстанавливаем ε-правила, если они должны быть, но были удалены
-        for nt in preserve_nullable:
+        for nt in sorted(preserve_nullable):
            if nt in self.productions and [] in self.productions[nt]:
                 new_productions.setdefault(nt, []).append([])
 
@@ -250,19 +309,19 @@ class Grammar:
         # Шаг 1: для каждого A вычислить множество N_A
         N_sets = {}
         for A in self.non_terminals:
-            N_current = set([A])
+            N_current = ordered_set([A])
             changed = True
             while changed:
                 changed = False
-                to_add = set()
+                to_add = ordered_set()
                 for B in N_current:
                     for production in self.productions.get(B, []):
                         if len(production) == 1 and production[0] in self.non_terminals:
                             C = production[0]
                             if C not in N_current:
-                                to_add.add(C)
+                                to_add.setdefault(C)
                 if to_add:
-                    N_current |= to_add
+                    N_current.update(to_add)
                     changed = True
             N_sets[A] = N_current
         
@@ -292,7 +351,7 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = set(new_productions.keys())
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
     def eliminate_left_factoring(self):
@@ -307,8 +366,7 @@ class Grammar:
         productions_count_before = sum(len(prods) for prods in self.productions.values())
         nonterminals_count_before = len(self.non_terminals)
         
-        import copy
-        new_productions = copy.deepcopy(self.productions)
+        new_productions = deepcopy(self.productions)
         changed = True
         new_nt_index = 0
         
@@ -389,7 +447,7 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = set(new_productions.keys())
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
     def eliminate_immediate_left_recursion(self):
@@ -407,7 +465,6 @@ class Grammar:
         productions_count_before = sum(len(prods) for prods in self.productions.values())
         nonterminals_count_before = len(self.non_terminals)
         
-        import copy
         new_productions = {}
         new_nt_index = 0
         
@@ -449,9 +506,522 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = set(new_productions.keys())
+        self.non_terminals = ordered_set(new_productions)
+        self.terminals = self._collect_terminals()
+
+    def _left_corner_edges(self, productions):
+        """Ребра графа левых углов: A -> B, если есть правило A -> B gamma (B - нетерминал)"""
+        edges = {}
+        for A, prods in productions.items():
+            row = edges.setdefault(A, {})
+            for prod in prods:
+                if prod and prod[0] in productions:
+                    row[prod[0]] = row.get(prod[0], 0) + 1
+        return edges
+
+    def _left_recursive_components(self, productions):
+        """
+        Компоненты сильной связности графа левых углов (итеративный алгоритм Тарьяна),
+        содержащие цикл. Только в них возможна левая рекурсия, прямая или косвенная.
+        """
+        edges = self._left_corner_edges(productions)
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in productions:
+            if root in index:
+                continue
+            work = [(root, iter(edges[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for succ in successors:
+                    if succ not in index:
+                        index[succ] = lowlink[succ] = counter
+                        counter += 1
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(edges[succ])))
+                        advanced = True
+                        break
+                    if succ in on_stack:
+                        lowlink[node] = min(lowlink[node], index[succ])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in edges[node]:
+                        components.append(component)
+
+        # порядок компонент и их элементов - как в productions
+        position = {A: i for i, A in enumerate(productions)}
+        for component in components:
+            component.sort(key=position.get)
+        components.sort(key=lambda c: position[c[0]])
+        return components
+
+    def _left_recursion_order(self, component, productions):
+        """
+        Порядок нетерминалов компоненты для алгоритма Пола.
+        Правило Ai -> Aj gamma при j < i требует подстановки всех правил Aj, поэтому
+        вес ребра Ai -> Aj = (число таких правил) * |правила Aj|, и ищется порядок с
+        минимальным суммарным весом обратных ребер (жадная эвристика Идса-Лина-Смита
+        для задачи о минимальном множестве обратных дуг): стоки уходят в конец,
+        источники - в начало, иначе в начало ставится вершина с максимальной
+        разностью исходящего и входящего веса.
+        """
+        members = set(component)
+        edges = self._left_corner_edges({A: productions[A] for A in component})
+        out_weight = {A: {} for A in component}
+        in_weight = {A: {} for A in component}
+        for A in component:
+            for B, count in edges[A].items():
+                if B in members and B != A:
+                    weight = count * len(productions[B])
+                    out_weight[A][B] = weight
+                    in_weight[B][A] = weight
+
+        def remove(v):
+            remaining.remove(v)
+            for B in out_weight.pop(v):
+                in_weight[B].pop(v, None)
+            for A in in_weight.pop(v):
+                out_weight[A].pop(v, None)
+
+        remaining = list(component)
+        head, tail = [], []
+        while remaining:
+            sinks = [v for v in remaining if not out_weight[v]]
+            if sinks:
+                for v in sinks:
+                    remove(v)
+                tail = sinks + tail
+                continue
+            sources = [v for v in remaining if not in_weight[v]]
+            if sources:
+                for v in sources:
+                    remove(v)
+                head.extend(sources)
+                continue
+            best = max(remaining, key=lambda v: sum(out_weight[v].values()) - sum(in_weight[v].values()))
+            remove(best)
+            head.append(best)
+        return head + tail
+
+    def eliminate_left_recursion(self):
+        """
+        Устранение левой рекурсии в общем случае, в том числе косвенной (алгоритм Пола).
+        Для упорядоченных нетерминалов A1..An каждой компоненты левой рекурсии:
+        правила Ai -> Aj gamma (j < i) заменяются на Ai -> delta gamma для всех Aj -> delta,
+        после чего устраняется прямая левая рекурсия Ai, как в алгоритме 4.7.
+
+        Подстановки выполняются только внутри компонент сильной связности графа левых
+        углов, порядок внутри компоненты выбирается эвристикой _left_recursion_order.
+        Ожидается грамматика без ε-правил в левой позиции и без циклов A =>+ A
+        (после remove_epsilon_rules и eliminate_chain_rules).
+
+        Возвращает статистику роста грамматики.
+        """
+        print("\n2.7 Устранение косвенной левой рекурсии (алгоритм Пола):")
+        rules_before = sum(len(prods) for prods in self.productions.values())
+        nonterminals_before = len(self.productions)
+
+        new_productions = {A: [list(prod) for prod in prods] for A, prods in self.productions.items()}
+        components = self._left_recursive_components(new_productions)
+        new_nt_index = 0
+        substitutions = 0
+
+        if not components:
+            print(" Левая рекурсия отсутствует")
+
+        for component in components:
+            order = self._left_recursion_order(component, new_productions)
+            component_rules_before = sum(len(new_productions[A]) for A in component)
+            created = []
+
+            for i, Ai in enumerate(order):
+                # подстановка правил Aj, j < i
+                for Aj in order[:i]:
+                    bodies = []
+                    for prod in new_productions[Ai]:
+                        if prod and prod[0] == Aj:
+                            substitutions += 1
+                            for delta in new_productions[Aj]:
+                                body = delta + prod[1:]
+                                if body not in bodies:
+                                    bodies.append(body)
+                        elif prod not in bodies:
+                            bodies.append(prod)
+                    new_productions[Ai] = bodies
+
+                # прямая левая рекурсия Ai (правила Ai -> Ai бесполезны и отбрасываются)
+                recursive = [prod[1:] for prod in new_productions[Ai] if prod and prod[0] == Ai and len(prod) > 1]
+                if recursive:
+                    non_recursive = [prod for prod in new_productions[Ai] if not prod or prod[0] != Ai]
+                    new_nt = f"{Ai}_rec{new_nt_index}"
+                    while new_nt in new_productions:
+                        new_nt_index += 1
+                        new_nt = f"{Ai}_rec{new_nt_index}"
+                    new_nt_index += 1
+                    created.append(new_nt)
+
+                    new_productions[Ai] = [beta + [new_nt] for beta in non_recursive]
+                    new_productions[new_nt] = [alpha + [new_nt] for alpha in recursive]
+                    new_productions[new_nt].append([])
+
+            component_rules_after = sum(len(new_productions[A]) for A in component + created)
+            print(f" Компонента {{{', '.join(component)}}}: порядок {' < '.join(order)}, "
+                  f"правил {component_rules_before} -> {component_rules_after}")
+
+        rules_after = sum(len(prods) for prods in new_productions.values())
+        nonterminals_after = len(new_productions)
+        print(f" Подстановок: {substitutions}")
+        print(f" Правил: {rules_before} -> {rules_after}, нетерминалов: {nonterminals_before} -> {nonterminals_after}")
+
+        print(" Новые правила без левой рекурсии:")
+        for A in sorted(new_productions.keys()):
+            productions = new_productions[A]
+            print(f"  {A} -> ", end="")
+            for i, prod in enumerate(productions):
+                if i > 0:
+                    print(" | ", end="")
+                print(" ".join(prod) if prod else "ε", end="")
+            print()
+
+        self.productions = new_productions
+        self.non_terminals = ordered_set(new_productions)
+        self.terminals = self._collect_terminals()
+
+        return {
+            "components": len(components),
+            "substitutions": substitutions,
+            "rules_before": rules_before,
+            "rules_after": rules_after,
+            "nonterminals_before": nonterminals_before,
+            "nonterminals_after": nonterminals_after,
+        }
+
+    def compact(self, keep=(), conflict_policy="dangling_else"):
+        """
+        Сжатие преобразованной грамматики: каждый убранный нетерминал - на один шаг
+        раскрытия меньше в LL1Parser.parse.
+          - нетерминалы с одинаковыми наборами правил объединяются;
+          - сквозные нетерминалы A -> B и A -> B | ε (при B =>* ε) заменяются на B;
+          - нетерминалы с единственным нерекурсивным правилом подставляются в правые части.
+        Замена принимается, только если в строках таблицы LL(1) затронутых нетерминалов
+        конфликтов не больше, чем было, и в каждой прежней ячейке выбрано то же правило
+        (после замены), что и до нее. Стартовый символ и нетерминалы из keep не убираются.
+
+        FIRST при таких заменах не меняется, FOLLOW меняется только при объединении
+        (FOLLOW(B) пополняется FOLLOW(A) и распространяется дальше), поэтому таблица
+        целиком строится один раз, а для каждой замены пересчитываются только строки
+        нетерминалов, чьи правила или FOLLOW изменились.
+
+        После сжатия self.origins[nt] - исходные нетерминалы, которые представляет nt,
+        self.inlined[A] - правая часть, подставленная вместо исходного нетерминала A.
+        """
+        print("\n2.8 Сжатие грамматики:")
+        protected = set(keep) | {self.start_symbol}
+        nonterminals_before = len(self.productions)
+        if not hasattr(self, "origins"):
+            self.origins = {nt: [nt] for nt in self.productions}
+            self.inlined = {}
+
+        # FIRST/FOLLOW от политики не зависят; строки таблицы с conflict_policy строятся
+        # ниже, поэтому конфликты промежуточной грамматики не приводят к ValueError
+        parser = LL1Parser(self.toDict(), "first")
+        first = parser.first
+        follow = {A: set(parser.follow[A]) for A in self.productions}
+        # строки таблицы строятся тем же _set_table_entry, что и в LL1Parser
+        scratch = LL1Parser.__new__(LL1Parser)
+        scratch.conflict_policy = conflict_policy
+
+        def table_row(A, prods, follow_A):
+            """Строка таблицы разбора A и число конфликтных ячеек в ней"""
+            scratch.table = defaultdict(dict)
+            scratch.conflicts = []
+            conflict_index = {}
+            for prod in prods:
+                cells = set()
+                for symbol in prod:
+                    cells |= first[symbol] - {'ε'}
+                    if 'ε' not in first[symbol]:
+                        break
+                else:
+                    cells |= follow_A
+                for terminal in sorted(cells):
+                    scratch._set_table_entry(A, terminal, prod, conflict_index)
+            return scratch.table[A], len(scratch.conflicts)
+
+        def follow_edges(A, prods):
+            """Нетерминалы B != A, для которых FOLLOW(B) ⊇ FOLLOW(A)"""
+            edges = set()
+            for prod in prods:
+                for symbol in reversed(prod):
+                    if symbol in self.productions and symbol != A:
+                        edges.add(symbol)
+                    if 'ε' not in first[symbol]:
+                        break
+            return edges
+
+        rows = {}
+        row_conflicts = {}
+        edges = {}
+        uses = defaultdict(set)    # символ -> нетерминалы, в правилах которых он встречается
+        for A, prods in self.productions.items():
+            rows[A], row_conflicts[A] = table_row(A, prods, follow[A])
+            edges[A] = follow_edges(A, prods)
+            for prod in prods:
+                for symbol in prod:
+                    uses[symbol].add(A)
+        before = sum(row_conflicts.values())
+
+        def replace(A, target, rules, rewrite, same_rules=False):
+            """
+            Удаляет A: rules - новые правила нетерминалов, где встречался A, rewrite(prod) -
+            правило prod после замены, target - нетерминал, в который переименован A
+            (None при подстановке), same_rules - у A и target одинаковые правила.
+            Возвращает False, если замена меняет выбор правил в таблице.
+            """
+            new_edges = {B: follow_edges(B, prods) for B, prods in rules.items()}
+            new_follow = {}
+            if target is not None:
+                new_follow[target] = follow[target] | follow[A]
+                stack = [target]
+                while stack:
+                    B = stack.pop()
+                    for C in new_edges.get(B, edges[B]):
+                        current = new_follow.get(C, follow[C])
+                        if not new_follow[B] <= current:
+                            new_follow[C] = current | new_follow[B]
+                            stack.append(C)
+
+            new_rows = {}
+            for B in set(rules) | set(new_follow):
+                row, count = table_row(B, rules.get(B, self.productions[B]), new_follow.get(B, follow[B]))
+                if count > row_conflicts[B]:
+                    return False
+                expected = list(rows[B].items())
+                if B == target and same_rules:
+                    expected += rows[A].items()
+                if any(row.get(terminal) != rewrite(prod) for terminal, prod in expected):
+                    return False
+                new_rows[B] = row, count
+
+            for B, prods in [(A, self.productions[A])] + [(B, self.productions[B]) for B in rules]:
+                for prod in prods:
+                    for symbol in prod:
+                        uses[symbol].discard(B)
+            for B, prods in rules.items():
+                for prod in prods:
+                    for symbol in prod:
+                        uses[symbol].add(B)
+            for table in (self.productions, follow, edges, rows, row_conflicts):
+                del table[A]
+            uses.pop(A, None)
+            self.productions.update(rules)
+            follow.update(new_follow)
+            edges.update(new_edges)
+            for B, (row, count) in new_rows.items():
+                rows[B], row_conflicts[B] = row, count
+            return True
+
+        def renamed(A, target):
+            def rewrite(prod):
+                return [target if symbol == A else symbol for symbol in prod]
+            rules = {}
+            for B in uses[A] | {target}:
+                if B != A:
+                    bodies = ordered_set(tuple(rewrite(prod)) for prod in self.productions[B])
+                    rules[B] = [list(body) for body in bodies]
+            return rules, rewrite
+
+        def inlined(A):
+            body = self.productions[A][0]
+            def rewrite(prod):
+                return [symbol for item in prod for symbol in (body if item == A else [item])]
+            return {B: [rewrite(prod) for prod in self.productions[B]] for B in uses[A] if B != A}, rewrite
+
+        merged = []
+        inlined_names = []
+        changed = True
+        while changed:
+            changed = False
+            # одинаковые наборы правил и сквозные нетерминалы
+            candidates = []
+            groups = {}
+            for A, prods in self.productions.items():
+                groups.setdefault(tuple(map(tuple, prods)), []).append(A)
+            for group in groups.values():
+                target = next((A for A in group if A in protected), group[0])
+                candidates.extend((A, target, True) for A in group if A != target and A not in protected)
+            for A, prods in self.productions.items():
+                bodies = [prod for prod in prods if prod]
+                if (A not in protected and len(bodies) == 1 and len(bodies[0]) == 1
+                        and bodies[0][0] in self.productions and bodies[0][0] != A
+                        and (len(prods) == 1 or (len(prods) == 2 and 'ε' in first[bodies[0][0]]))):
+                    candidates.append((A, bodies[0][0], False))
+            for A, target, same_rules in candidates:
+                if A not in self.productions or target not in self.productions:
+                    continue
+                rules, rewrite = renamed(A, target)
+                if replace(A, target, rules, rewrite, same_rules):
+                    self.origins[target] += self.origins.pop(A)
+                    merged.append(f"{A} -> {target}")
+                    changed = True
+
+            # подстановка нетерминалов с единственным правилом
+            for A in list(self.productions):
+                prods = self.productions.get(A)
+                if A in protected or prods is None or len(prods) != 1 or A in prods[0]:
+                    continue
+                rules, rewrite = inlined(A)
+                if replace(A, None, rules, rewrite):
+                    for name in self.origins.pop(A):
+                        self.inlined[name] = list(prods[0])
+                    inlined_names.append(A)
+                    changed = True
+
+        self.non_terminals = ordered_set(self.productions)
+        self.terminals = self._collect_terminals()
+        print(f" Объединены: {', '.join(merged) or 'нет'}")
+        print(f" Подставлены: {', '.join(inlined_names) or 'нет'}")
+        print(f" Нетерминалов: {nonterminals_before} -> {len(self.productions)}, "
+              f"конфликтов LL(1): {before} -> {sum(row_conflicts.values())}")
+        print(" Новые правила:")
+        for A in sorted(self.productions.keys()):
+            productions = self.productions[A]
+            print(f"  {A} -> ", end="")
+            for i, prod in enumerate(productions):
+                if i > 0:
+                    print(" | ", end="")
+                print(" ".join(prod) if prod else "ε", end="")
+            print()
+
+    def eliminate_mixed_rules(self):
+        """
+        Устранение смешанных цепочек: S -> A a B преобразуется в S -> A N_a B; N_a -> a.
+        Заменяются терминалы во всех правых частях длиной больше 1 (в том числе из одних
+        терминалов, как требует НФХ); N_a заводится только для замененных терминалов.
+        """
+        print("\nУстранение смешанных цепочек:")
+        terminal_to_nt = {}
+        new_productions = {}
+        for A, prods in self.productions.items():
+            new_rhs = []
+            for prod in prods:
+                if len(prod) > 1:
+                    new_prod = []
+                    for symbol in prod:
+                        if symbol not in self.non_terminals:
+                            if symbol not in terminal_to_nt:
+                                new_nt = f"N_{symbol}"
+                                while new_nt in self.non_terminals:
+                                    new_nt += "'"
+                                terminal_to_nt[symbol] = new_nt
+                            symbol = terminal_to_nt[symbol]
+                        new_prod.append(symbol)
+                    prod = new_prod
+                new_rhs.append(prod)
+            new_productions[A] = new_rhs
+        for term, nt in terminal_to_nt.items():
+            new_productions[nt] = [[term]]
+
+        self.productions = new_productions
+        self.non_terminals = ordered_set(new_productions)
+        self.terminals = self._collect_terminals()
+
+        print("Новые правила после устранения смешанных цепочек:")
+        for A in sorted(self.productions.keys()):
+            prods = self.productions[A]
+            print(f"{A} → ", end="")
+            print(" | ".join(" ".join(p) for p in prods))
+
+    def eliminate_long_rules(self):
+        """
+        Разбиение длинных правил: A -> X1 X2 ... Xn (n > 2) заменяется цепочкой
+        A -> X1 A_bin1, A_bin1 -> X2 A_bin2, ..., A_bin(n-2) -> X(n-1) Xn.
+        Одинаковые хвосты правых частей получают общий нетерминал.
+        """
+        print("\n3.2 Разбиение длинных правил:")
+        new_productions = {A: [] for A in self.productions}
+        tail_to_nt = {}
+        new_nt_index = 0
+
+        def tail_symbol(A, tail):
+            nonlocal new_nt_index
+            if len(tail) == 1:
+                return tail[0]
+            if tail not in tail_to_nt:
+                new_nt_index += 1
+                new_nt = f"{A}_bin{new_nt_index}"
+                while new_nt in self.non_terminals:
+                    new_nt += "'"
+                tail_to_nt[tail] = new_nt
+                new_productions[new_nt] = [[tail[0], tail_symbol(A, tail[1:])]]
+            return tail_to_nt[tail]
+
+        for A, prods in self.productions.items():
+            for prod in prods:
+                if len(prod) > 2:
+                    prod = [prod[0], tail_symbol(A, tuple(prod[1:]))]
+                new_productions[A].append(prod)
+
+        print(f" Добавлено нетерминалов: {len(tail_to_nt)}")
+        self.productions = new_productions
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
+    def to_cnf(self):
+        """
+        Приведение к нормальной форме Хомского: все правила вида A -> B C или A -> a,
+        ε-правило допускается только для нового стартового символа S', который не
+        встречается в правых частях. Используется CYKRecognizer.
+        """
+        print("\n3. Приведение к нормальной форме Хомского:")
+        if not self.check_language_existence():
+            raise ValueError("Язык грамматики пуст")
+        self.eliminate_non_generating()
+        self.eliminate_unreachable()
+
+        start_nullable = self.start_symbol in self.nullable_symbols()
+        if start_nullable or any(self.start_symbol in prod for prods in self.productions.values() for prod in prods):
+            new_start = f"{self.start_symbol}'"
+            while new_start in self.non_terminals:
+                new_start += "'"
+            self.productions = {new_start: [[self.start_symbol]], **self.productions}
+            self.non_terminals = ordered_set(self.productions)
+            self.start_symbol = new_start
+
+        self.remove_epsilon_rules(preserve_nullable=())
+        self.productions = {A: [prod for prod in prods if prod] for A, prods in self.productions.items()}
+        if start_nullable:
+            self.productions[self.start_symbol].append([])
+        self.eliminate_chain_rules()
+        self.eliminate_non_generating()
+        self.eliminate_unreachable()
+        self.eliminate_mixed_rules()
+        self.eliminate_long_rules()
+        return self
+
     def print_grammar(self):
         """Выводит текущие правила грамматики в читаемом формате"""
         print("\nТекущая грамматика:")
@@ -472,7 +1042,8 @@ class Grammar:
 # ---------- Лексер ----------
 KEYWORDS = {
     "program", "var", "begin", "end", "read", "write",
-    "if", "then", "else", "while", "do", "true", "false", "for", "to", "ass"
+    "if", "then", "else", "while", "do", "true", "false", "for", "to", "ass",
+    "not", "and", "or"
 }
 
 DELIMITERS = {
@@ -483,28 +1054,210 @@ DATA_TYPES = {"%", "!", "$"}
 
 MULTI_CHAR_DELIMS = {"<=", ">="}
 
-class LexerFA:
+LEXER_BACKENDS = ("fa", "regex", "numpy")
+
+_MASTER_PATTERN = None
+
+# классы символов ASCII для backend="numpy"; LETTER, DIGIT и UNDERSCORE идут подряд:
+# это символы, продолжающие идентификатор
+(CHAR_SPACE, CHAR_LETTER, CHAR_DIGIT, CHAR_UNDERSCORE, CHAR_DATA_TYPE, CHAR_DOUBLE,
+ CHAR_DELIM, CHAR_OTHER) = range(8)
+
+_CHAR_CLASSES = None
+
+# группа шаблона -> (тип лексемы, подпись в отладочном выводе)
+REGEX_DELIM_KINDS = {
+    "DELIM": ("DELIM", "DELIMITER"),
+    "DOUBLE": ("DELIM", "SINGLE-DELIMITER"),
+    "MULTI": ("DELIM", "MULTI-DELIMITER"),
+    "DATA_TYPE": ("DATA_TYPE", "DATA_TYPE"),
+}
+
+
+def master_pattern():
+    """
+    Общий шаблон re для лексера (backend="regex"): пропуск пробелов и комментариев,
+    затем одна альтернатива с именованной группой на каждую категорию лексем, в том же
+    порядке проверок, что и в LexerFA. Ключевые слова распознаются как WORD и
+    отделяются от идентификаторов по KEYWORDS (поиск в множестве быстрее, чем
+    перебор альтернатив шаблона). Компилируется при первом обращении.
+    """
+    global _MASTER_PATTERN
+    if _MASTER_PATTERN is None:
+        import re
+
+        def char_class(chars):
+            return "[" + re.escape("".join(sorted(chars))) + "]"
+
+        singles = {d for d in DELIMITERS if len(d) == 1} - {"{", ":", "<", ">"}
+        multi = "|".join(re.escape(d) for d in sorted(MULTI_CHAR_DELIMS))
+        # незакрытый комментарий длится до конца текста
+        skip = r"(?:\s+|\{[^}]*\}?)*"
+        parts = [
+            ("WORD", r"[^\W\d_]\w*"),
+            ("NUM", r"\d+(?:\.\d+)?(?:[eE][+-]?\d+)?"),
+            ("DATA_TYPE", char_class(DATA_TYPES)),
+            ("MULTI", multi),
+            ("DOUBLE", r"[:<>]"),
+            ("DELIM", char_class(singles)),
+            ("END", r"\Z"),
+            ("ERR", r"."),
+        ]
+        groups = "|".join(f"(?P<{name}>{regex})" for name, regex in parts)
+        _MASTER_PATTERN = re.compile(f"{skip}(?:{groups})", re.DOTALL)
+    return _MASTER_PATTERN
+
+
+def _numpy():
+    """NumPy - необязательная зависимость: без него backend="numpy" разбирает автоматом"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def char_classes(np):
+    """
+    Таблица классов символов ASCII (массив uint8 из 128 элементов) в порядке проверок
+    состояния START автомата LexerFA. '{' сюда не входит: комментарии вырезаются отдельно.
+    """
+    global _CHAR_CLASSES
+    if _CHAR_CLASSES is None:
+        table = []
+        for code in range(128):
+            c = chr(code)
+            if c.isspace():
+                table.append(CHAR_SPACE)
+            elif c.isalpha():
+                table.append(CHAR_LETTER)
+            elif c.isdigit():
+                table.append(CHAR_DIGIT)
+            elif c == '_':
+                table.append(CHAR_UNDERSCORE)
+            elif c in DATA_TYPES:
+                table.append(CHAR_DATA_TYPE)
+            elif c in {':', '<', '>'}:
+                table.append(CHAR_DOUBLE)
+            elif c in DELIMITERS and c != '{':
+                table.append(CHAR_DELIM)
+            else:
+                table.append(CHAR_OTHER)
+        _CHAR_CLASSES = np.array(table, dtype=np.uint8)
+    return _CHAR_CLASSES
+
+
+def number_value(literal):
+    """
+    Значение числового литерала: int для целых, float при дробной части или порядке.
+    isdigit() считает цифрами и символы вроде '²', которые int() не принимает: такие
+    цифры заменяются ASCII-цифрами того же значения. ValueError, если literal - не число.
+    """
+    if not literal.isascii():
+        import unicodedata
+        literal = "".join(str(unicodedata.digit(c)) if c.isdigit() else c for c in literal)
+    if '.' in literal or 'e' in literal or 'E' in literal:
+        return float(literal)
+    return int(literal)
+
+
+def exponent_prefix_length(text, i):
+    """Длина 'e', 'e+' или 'e-' в позиции i, если за ними следует цифра порядка, иначе 0"""
+    length = 2 if text[i + 1:i + 2] in ('+', '-') else 1
+    return length if text[i + length:i + length + 1].isdigit() else 0
+
+
+class LexResult:
+    """Результат лексического анализа одного текста"""
+
     def __init__(self):
+        self.tokens = []
+        self.token_types = []
+        self.token_offsets = []    # смещение начала каждого токена в тексте
+        self.line_starts = [0]     # смещения начал строк, для перевода смещения в (строка, столбец)
+        self.identifier_table = {}
+        self.identifier_hash = {}
+        self.token_values = []     # индекс идентификатора (ID) или константы в constants (NUM), иначе None
+        self.constants = []        # пул числовых констант: int или float
+        self.constant_index = {}   # (тип, значение) -> индекс в constants
+
+    def get_token_positions(self):
+        """Позиции токенов в виде (строка, столбец), нумерация с 1"""
+        return [self.offset_to_position(offset) for offset in self.token_offsets]
+
+    def offset_to_position(self, offset):
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+
+class LexerFA:
+    def __init__(self, verbose=True, backend="fa"):
+        """
+        backend: "fa" - посимвольный конечный автомат, "regex" - общий шаблон re
+        (цикл сканирования выполняется в C), "numpy" - классификация всех символов
+        сразу массивами NumPy (для очень больших текстов). Поток лексем у них одинаковый.
+        """
+        if backend not in LEXER_BACKENDS:
+            raise ValueError(f"Unknown lexer backend: {backend}")
+        self.verbose = verbose
+        self.backend = backend
         self.identifier_table = {}
         self.identifier_hash = {}
         self.tokens = []
         self.token_types = []
+        self.token_offsets = []    # смещение начала каждого токена в тексте
+        self.line_starts = [0]     # смещения начал строк, для перевода смещения в (строка, столбец)
+        self.token_values = []
+        self.constants = []
 
     def hash_id(self, ident):
+        import hashlib  # отложенный импорт: нужен только при первом новом идентификаторе
         return int("0x" + hashlib.sha1(ident.encode()).hexdigest(), 16) % 997
 
     def add_identifier(self, ident):
-        idx = self.hash_id(ident)
-        if ident not in self.identifier_hash:
-            self.identifier_hash[ident] = idx
-            self.identifier_table[idx] = ident
-            print(f"[HASH] Added identifier '{ident}' with hash {idx}")
+        return self._add_identifier(self, ident)
+
+    def _add_identifier(self, tables, ident):
+        """
+        Индекс идентификатора в таблицах tables (LexResult или сам лексер - объект
+        с identifier_hash и identifier_table); новый идентификатор добавляется в них
+        """
+        idx = tables.identifier_hash.get(ident)
+        if idx is None:
+            idx = self.hash_id(ident)
+            tables.identifier_hash[ident] = idx
+            tables.identifier_table[idx] = ident
+            if self.verbose:
+                print(f"[HASH] Added identifier '{ident}' with hash {idx}")
         return idx
 
-    def lex(self, text):
+    def tokenize(self, text) -> "LexResult":
+        """
+        Лексический анализ без изменения состояния лексера: все результаты, включая
+        таблицу идентификаторов, создаются заново при каждом вызове и возвращаются
+        в LexResult. Один экземпляр можно использовать из нескольких потоков.
+        """
+        if self.backend == "regex":
+            result = self._tokenize_regex(text)
+            if result is not None:
+                return result
+        elif self.backend == "numpy":
+            result = self._tokenize_numpy(text)
+            if result is not None:
+                return result
+        return self._tokenize_fa(text)
+
+    def _tokenize_fa(self, text) -> "LexResult":
+        result = LexResult()
+        verbose = self.verbose
         i = 0
+        start = 0
         state = 'START'
         buffer = ''
+        newline = text.find('\n')
+        while newline != -1:
+            result.line_starts.append(newline + 1)
+            newline = text.find('\n', newline + 1)
         while i < len(text):
             c = text[i]
             if state == 'START':
@@ -512,10 +1265,12 @@ class LexerFA:
                     i += 1
                     continue
                 elif c.isalpha():
+                    start = i
                     buffer = c
                     state = 'ID'
                     i += 1
                 elif c.isdigit():
+                    start = i
                     buffer = c
                     state = 'NUM'
                     i += 1
@@ -523,21 +1278,31 @@ class LexerFA:
                     state = 'COMMENT'
                     i += 1
                 elif c in DATA_TYPES:
-                    self.tokens.append(c)
-                    self.token_types.append('DATA_TYPE')
-                    print(f"[LEX] DATA_TYPE: '{c}'")
+                    start = i
+                    result.tokens.append(c)
+                    result.token_types.append('DATA_TYPE')
+                    result.token_offsets.append(start)
+                    result.token_values.append(None)
+                    if verbose:
+                        print(f"[LEX] DATA_TYPE: '{c}'")
                     i += 1
                 elif c in {':', '<', '>'}:
+                    start = i
                     buffer = c
                     state = 'POSSIBLE_DOUBLE'
                     i += 1
                 elif c in DELIMITERS:
-                    self.tokens.append(c)
-                    self.token_types.append('DELIM')
-                    print(f"[LEX] DELIMITER: '{c}'")
+                    start = i
+                    result.tokens.append(c)
+                    result.token_types.append('DELIM')
+                    result.token_offsets.append(start)
+                    result.token_values.append(None)
+                    if verbose:
+                        print(f"[LEX] DELIMITER: '{c}'")
                     i += 1
                 else:
-                    print(f"[ERR] Unknown character: '{c}'")
+                    if verbose:
+                        print(f"[ERR] Unknown character: '{c}'")
                     i += 1
 
             elif state == 'ID':
@@ -545,26 +1310,27 @@ class LexerFA:
                     buffer += c
                     i += 1
                 else:
-                    if buffer in KEYWORDS:
-                        self.tokens.append(buffer)
-                        self.token_types.append('KW')
-                        print(f"[LEX] KEYWORD: '{buffer}'")
-                    else:
-                        idx = self.add_identifier(buffer)
-                        self.tokens.append('идентификатор')
-                        self.token_types.append('ID')
-                        print(f"[LEX] IDENTIFIER: '{buffer}' (index {idx})")
+                    self._emit_word(result, buffer, start)
                     buffer = ''
                     state = 'START'
 
-            elif state == 'NUM':
+            elif state in ('NUM', 'FRAC', 'EXP'):
+                # NUM - целая часть, FRAC - дробная, EXP - порядок. '.' и 'e' входят в число,
+                # только если за ними следует цифра: '10.' в конце программы - число и точка
                 if c.isdigit():
                     buffer += c
                     i += 1
+                elif c == '.' and state == 'NUM' and text[i + 1:i + 2].isdigit():
+                    buffer += c
+                    state = 'FRAC'
+                    i += 1
+                elif c in 'eE' and state != 'EXP' and exponent_prefix_length(text, i):
+                    length = exponent_prefix_length(text, i)
+                    buffer += text[i:i + length]
+                    state = 'EXP'
+                    i += length
                 else:
-                    self.tokens.append('число')
-                    self.token_types.append('NUM')
-                    print(f"[LEX] NUMBER: '{buffer}'")
+                    self._emit_number(result, buffer, start)
                     buffer = ''
                     state = 'START'
 
@@ -575,106 +1341,792 @@ class LexerFA:
 
             elif state == 'POSSIBLE_DOUBLE':
                 if (buffer + c) in MULTI_CHAR_DELIMS:
-                    self.tokens.append(buffer + c)
-                    self.token_types.append('DELIM')
-                    print(f"[LEX] MULTI-DELIMITER: '{buffer + c}'")
+                    result.tokens.append(buffer + c)
+                    result.token_types.append('DELIM')
+                    result.token_offsets.append(start)
+                    result.token_values.append(None)
+                    if verbose:
+                        print(f"[LEX] MULTI-DELIMITER: '{buffer + c}'")
                     i += 1
                 else:
-                    self.tokens.append(buffer)
-                    self.token_types.append('DELIM')
-                    print(f"[LEX] SINGLE-DELIMITER: '{buffer}'")
+                    result.tokens.append(buffer)
+                    result.token_types.append('DELIM')
+                    result.token_offsets.append(start)
+                    result.token_values.append(None)
+                    if verbose:
+                        print(f"[LEX] SINGLE-DELIMITER: '{buffer}'")
                 buffer = ''
                 state = 'START'
 
         # Конец
         if state == 'ID':
-            if buffer in KEYWORDS:
-                self.tokens.append(buffer)
-                self.token_types.append('KW')
-                print(f"[LEX] KEYWORD: '{buffer}'")
+            self._emit_word(result, buffer, start)
+
+        elif state in ('NUM', 'FRAC', 'EXP'):
+            self._emit_number(result, buffer, start)
+
+        return result
+
+    def _emit_word(self, result, word, start):
+        """Ключевое слово или идентификатор (значение токена - индекс в таблице идентификаторов)"""
+        if word in KEYWORDS:
+            result.tokens.append(word)
+            result.token_types.append('KW')
+            result.token_offsets.append(start)
+            result.token_values.append(None)
+            if self.verbose:
+                print(f"[LEX] KEYWORD: '{word}'")
+        else:
+            idx = self._add_identifier(result, word)
+            result.tokens.append('идентификатор')
+            result.token_types.append('ID')
+            result.token_offsets.append(start)
+            result.token_values.append(idx)
+            if self.verbose:
+                print(f"[LEX] IDENTIFIER: '{word}' (index {idx})")
+
+    def _emit_number(self, result, literal, start):
+        """Числовая константа (значение токена - индекс в пуле констант)"""
+        idx = self._add_constant(result, literal)
+        result.tokens.append('число')
+        result.token_types.append('NUM')
+        result.token_offsets.append(start)
+        result.token_values.append(idx)
+        if self.verbose:
+            print(f"[LEX] NUMBER: '{literal}' (constant {idx})")
+
+    def _add_constant(self, result, literal):
+        """Значение литерала вычисляется один раз; одинаковые значения делят одну запись пула"""
+        value = number_value(literal)
+        key = (type(value), value)    # 10 и 10.0 - разные константы
+        idx = result.constant_index.get(key)
+        if idx is None:
+            idx = len(result.constants)
+            result.constants.append(value)
+            result.constant_index[key] = idx
+        return idx
+
+    def _tokenize_regex(self, text) -> "LexResult":
+        """
+        Лексический анализ общим шаблоном master_pattern(). Классы \\d и [^\\W\\d_]
+        шире isdigit/isalpha только на редких числовых символах Unicode ('²', 'Ⅻ');
+        встретив такой символ, возвращает None, и разбор выполняет автомат. Поэтому
+        отладочный вывод накапливается в log и печатается только в конце.
+        """
+        result = LexResult()
+        verbose = self.verbose
+        newline = text.find('\n')
+        while newline != -1:
+            result.line_starts.append(newline + 1)
+            newline = text.find('\n', newline + 1)
+        append_token = result.tokens.append
+        append_type = result.token_types.append
+        append_offset = result.token_offsets.append
+        append_value = result.token_values.append
+        identifier_hash = result.identifier_hash
+        log = [] if verbose else None
+        end = len(text)
+        for m in master_pattern().finditer(text):
+            kind = m.lastgroup
+            value = m.group(kind)
+            if kind == 'WORD':
+                if value in KEYWORDS:
+                    append_token(value)
+                    append_type('KW')
+                    append_value(None)
+                    if verbose:
+                        log.append(f"[LEX] KEYWORD: '{value}'")
+                elif value[0].isalpha():
+                    idx = identifier_hash.get(value)
+                    if idx is None:
+                        idx = self.hash_id(value)
+                        identifier_hash[value] = idx
+                        result.identifier_table[idx] = value
+                        if verbose:
+                            log.append(f"[HASH] Added identifier '{value}' with hash {idx}")
+                    append_token('идентификатор')
+                    append_type('ID')
+                    append_value(idx)
+                    if verbose:
+                        log.append(f"[LEX] IDENTIFIER: '{value}' (index {idx})")
+                else:
+                    return None
+            elif kind == 'NUM':
+                tail = text[m.end():m.end() + 3]
+                if not tail.isascii() and any(c.isdigit() for c in tail):
+                    return None
+                idx = self._add_constant(result, value)
+                append_token('число')
+                append_type('NUM')
+                append_value(idx)
+                if verbose:
+                    log.append(f"[LEX] NUMBER: '{value}' (constant {idx})")
+            elif kind == 'END':
+                break
+            elif kind == 'ERR':
+                if verbose:
+                    log.append(f"[ERR] Unknown character: '{value}'")
+                continue
+            else:
+                # как и автомат, одиночный ':', '<' или '>' в самом конце текста не выдаётся
+                if kind == 'DOUBLE' and m.end() == end:
+                    break
+                token_type, label = REGEX_DELIM_KINDS[kind]
+                append_token(value)
+                append_type(token_type)
+                append_value(None)
+                if verbose:
+                    log.append(f"[LEX] {label}: '{value}'")
+            append_offset(m.start(kind))
+        if log:
+            print("\n".join(log))
+        return result
+
+    def _tokenize_numpy(self, text) -> "LexResult":
+        """
+        Лексический анализ массивами NumPy: текст переводится в массив кодов символов,
+        каждому символу сразу назначается класс (char_classes), комментарии и пары
+        '<=', '>=' находятся по позициям скобок и знаков, а границы лексем - по
+        границам серий символов идентификатора. Python обходит только готовые лексемы:
+        поиск ключевых слов, таблица идентификаторов и пул констант.
+
+        Серия, начинающаяся с цифры или '_', разбирается по шаблону числа, так как число
+        может продолжаться через '.', 'e+' и 'e-'. Без NumPy и для текстов не из ASCII
+        (isalpha/isdigit Unicode) возвращает None, и разбор выполняет автомат.
+        """
+        np = _numpy()
+        if np is None or not text.isascii():
+            return None
+        result = LexResult()
+        n = len(text)
+        if not n:
+            return result
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        result.line_starts.extend((np.flatnonzero(codes == ord('\n')) + 1).tolist())
+        classes = char_classes(np)[codes]
+
+        # Комментарии не вложены: '{' открывает комментарий, если перед ней нет другой
+        # '{' без закрывающей '}', то есть предыдущая фигурная скобка - не '{'
+        braces = np.flatnonzero((codes == ord('{')) | (codes == ord('}')))
+        if len(braces):
+            opening = codes[braces] == ord('{')
+            previous = np.concatenate(([False], opening[:-1]))
+            depth = np.zeros(n + 1, dtype=np.int32)
+            depth[braces[opening & ~previous]] += 1
+            depth[braces[~opening & previous] + 1] -= 1
+            classes[np.cumsum(depth[:n]) > 0] = CHAR_SPACE
+
+        kept = classes != CHAR_SPACE
+        word = (classes >= CHAR_LETTER) & (classes <= CHAR_UNDERSCORE)
+        follows_word = np.zeros(n, dtype=bool)
+        follows_word[1:] = word[:-1]
+        # '<' или '>' вместе со следующим '=' - одна лексема
+        paired = np.zeros(n, dtype=bool)
+        paired[:-1] = ((codes[:-1] == ord('<')) | (codes[:-1] == ord('>'))) & (codes[1:] == ord('=')) & kept[:-1]
+        kept[1:] &= ~paired[:-1]
+        starts = np.flatnonzero(kept & ~(word & follows_word))
+        ends = np.flatnonzero(kept & ~(word & np.append(word[1:], False))) + 1 + paired[starts]
+        # как и автомат, одиночный ':', '<' или '>' в самом конце текста не выдаётся
+        if len(starts) and starts[-1] == n - 1 and classes[n - 1] == CHAR_DOUBLE:
+            starts, ends = starts[:-1], ends[:-1]
+
+        verbose = self.verbose
+        pattern = master_pattern()
+        labels = {CHAR_DATA_TYPE: "DATA_TYPE", CHAR_DELIM: "DELIMITER", CHAR_DOUBLE: "SINGLE-DELIMITER"}
+        append_token = result.tokens.append
+        append_type = result.token_types.append
+        append_offset = result.token_offsets.append
+        append_value = result.token_values.append
+        identifier_hash = result.identifier_hash
+        position = 0    # конец последнего числа: лексемы до него уже вошли в число
+        for start, end, kind in zip(starts.tolist(), ends.tolist(), classes[starts].tolist()):
+            if end <= position:
+                continue
+            if kind == CHAR_LETTER and start >= position:
+                token = text[start:end]
+                if token in KEYWORDS:
+                    append_token(token)
+                    append_type('KW')
+                    append_value(None)
+                    if verbose:
+                        print(f"[LEX] KEYWORD: '{token}'")
+                else:
+                    idx = identifier_hash.get(token)
+                    if idx is None:
+                        idx = self._add_identifier(result, token)
+                    append_token('идентификатор')
+                    append_type('ID')
+                    append_value(idx)
+                    if verbose:
+                        print(f"[LEX] IDENTIFIER: '{token}' (index {idx})")
+                append_offset(start)
+            elif kind == CHAR_DELIM or kind == CHAR_DOUBLE or kind == CHAR_DATA_TYPE:
+                token = text[start:end]
+                append_token(token)
+                append_type('DATA_TYPE' if kind == CHAR_DATA_TYPE else 'DELIM')
+                append_offset(start)
+                append_value(None)
+                if verbose:
+                    label = "MULTI-DELIMITER" if end - start == 2 else labels[kind]
+                    print(f"[LEX] {label}: '{token}'")
+            elif kind == CHAR_OTHER:
+                if verbose:
+                    print(f"[ERR] Unknown character: '{text[start]}'")
             else:
-                idx = self.add_identifier(buffer)
-                self.tokens.append('идентификатор')
-                self.token_types.append('ID')
-                print(f"[LEX] IDENTIFIER: '{buffer}' (index {idx})")
+                i = max(start, position)
+                while i < end:
+                    c = text[i]
+                    if c == '_':
+                        if verbose:
+                            print(f"[ERR] Unknown character: '{c}'")
+                        i += 1
+                    elif c.isdigit():
+                        m = pattern.match(text, i)
+                        self._emit_number(result, m.group('NUM'), i)
+                        i = position = m.end()
+                    else:
+                        self._emit_word(result, text[i:end], i)
+                        i = end
+        return result
 
-        elif state == 'NUM':
-            self.tokens.append('число')
-            self.token_types.append('NUM')
-            print(f"[LEX] NUMBER: '{buffer}'")
+    def tokenize_parallel(self, text, workers=None, chunk_size=1 << 22) -> "LexResult":
+        """
+        Лексический анализ большого текста в пуле процессов: текст делится на части
+        примерно по chunk_size символов (split_source), части разбираются независимо
+        тем же backend, результаты сливаются в один LexResult (merge_lex_results).
+        Поток лексем, таблицы и пул констант совпадают с tokenize; отладочный вывод
+        в процессах пула не печатается. Текст из одной части разбирается здесь же.
+        """
+        bounds = split_source(text, chunk_size)
+        if len(bounds) <= 2:
+            return self.tokenize(text)
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+        chunks = (text[start:end] for start, end in zip(bounds, bounds[1:]))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return merge_lex_results(pool.map(_tokenize_chunk, repeat(self.backend), chunks, bounds[:-1]))
+
+    def lex(self, text):
+        """Лексический анализ text; результаты предыдущего вызова не накапливаются"""
+        result = self.tokenize(text)
+        self.tokens = result.tokens
+        self.token_types = result.token_types
+        self.token_offsets = result.token_offsets
+        self.line_starts = result.line_starts
+        self.identifier_table = result.identifier_table
+        self.identifier_hash = result.identifier_hash
+        self.token_values = result.token_values
+        self.constants = result.constants
+        return result
 
     def get_token_stream(self):
         return self.tokens
 
+    def get_token_positions(self):
+        """Позиции токенов в виде (строка, столбец), нумерация с 1"""
+        return [self.offset_to_position(offset) for offset in self.token_offsets]
+
+    def offset_to_position(self, offset):
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
     def get_identifier_table(self):
         return self.identifier_table
 
+    def get_constants(self):
+        return self.constants
 
-# ---------- LL(1) Parser ----------
-class LL1Parser:
-    def __init__(self, grammar: Dict):
-        self.nonterminals = grammar['nonterminals']
-        self.terminals = grammar['terminals']
-        self.start_symbol = grammar['start_symbol']
-        self.productions = grammar['productions']
-        self.first = defaultdict(set)
-        self.follow = defaultdict(set)
-        self.table = defaultdict(dict)
-        self.build()
 
-    def build(self):
-        self.compute_first_sets()
-        self.compute_follow_sets()
-        self.build_parse_table()
+# ---------- Параллельный лексический анализ ----------
+def split_source(text, chunk_size) -> List[int]:
+    """
+    Границы частей текста для LexerFA.tokenize_parallel: [0, ..., len(text)]. Каждая
+    часть, кроме последней, заканчивается переводом строки вне комментария, поэтому
+    лексемы не пересекают границ, а следующая часть начинается в состоянии START.
+    Комментарии не вложены, и перевод строки находится внутри комментария, если
+    последняя фигурная скобка после предыдущей границы - '{': просматривается только
+    текст текущей части.
+    """
+    bounds = [0]
+    target = chunk_size
+    while target < len(text):
+        newline = text.find('\n', target)
+        if newline == -1:
+            break
+        if text.rfind('{', bounds[-1], newline) > text.rfind('}', bounds[-1], newline):
+            close = text.find('}', newline)
+            if close == -1:
+                break
+            target = close + 1
+            continue
+        bounds.append(newline + 1)
+        target = newline + 1 + chunk_size
+    if bounds[-1] != len(text):
+        bounds.append(len(text))
+    return bounds
 
-    def compute_first_sets(self):
-        for t in self.terminals:
-            self.first[t] = {t}
-        changed = True
-        while changed:
-            changed = False
-            for nt in self.nonterminals:
-                for prod in self.productions.get(nt, []):
-                    before = len(self.first[nt])
-                    for symbol in prod:
-                        self.first[nt] |= self.first[symbol] - {'ε'}
-                        if 'ε' not in self.first[symbol]:
-                            break
-                    else:
-                        self.first[nt].add('ε')
-                    if len(self.first[nt]) > before:
-                        changed = True
 
-    def compute_follow_sets(self):
-        self.follow[self.start_symbol].add('$')
-        changed = True
-        while changed:
-            changed = False
-            for nt in self.nonterminals:
-                for prod in self.productions.get(nt, []):
-                    trailer = self.follow[nt].copy()
-                    for symbol in reversed(prod):
-                        if symbol in self.nonterminals:
-                            before = len(self.follow[symbol])
-                            self.follow[symbol] |= trailer
-                            if 'ε' in self.first[symbol]:
-                                trailer |= self.first[symbol] - {'ε'}
-                            else:
-                                trailer = self.first[symbol]
-                            if len(self.follow[symbol]) > before:
-                                changed = True
-                        else:
-                            trailer = self.first[symbol]
+def _tokenize_chunk(backend, text, base):
+    """
+    Разбор одной части в процессе пула. Смещения и начала строк переводятся в
+    смещения всего текста здесь же; numbers - позиции лексем NUM для перенумерации констант.
+    Результат передается в родительский процесс через pickle, поэтому одинаковые лексемы
+    сводятся к одному объекту строки, а смещения упаковываются в array: так его
+    распаковка, которая выполняется последовательно, заметно короче.
+    """
+    result = LexerFA(verbose=False, backend=backend).tokenize(text)
+    unique = {}
+    result.tokens = [unique.setdefault(token, token) for token in result.tokens]
+    result.token_offsets = array('q', [offset + base for offset in result.token_offsets])
+    result.line_starts = array('q', [start + base for start in result.line_starts])
+    numbers = [i for i, kind in enumerate(result.token_types) if kind == 'NUM']
+    return result, numbers
 
-    def build_parse_table(self):
+
+def merge_lex_results(parts) -> LexResult:
+    """
+    Слияние результатов частей (result, numbers) в порядке текста. Индекс идентификатора -
+    хеш имени, он одинаков во всех частях, поэтому таблицы идентификаторов просто
+    объединяются в порядке первого появления. Индексы констант локальны для части и
+    перенумеровываются в общий пул.
+    """
+    merged = LexResult()
+    merged.line_starts = []
+    for result, numbers in parts:
+        merged.line_starts.extend(result.line_starts[1:] if merged.line_starts else result.line_starts)
+        for ident, idx in result.identifier_hash.items():
+            if ident not in merged.identifier_hash:
+                merged.identifier_hash[ident] = idx
+                merged.identifier_table[idx] = ident
+        remap = []
+        for key, local in result.constant_index.items():
+            idx = merged.constant_index.get(key)
+            if idx is None:
+                idx = len(merged.constants)
+                merged.constants.append(result.constants[local])
+                merged.constant_index[key] = idx
+            remap.append(idx)
+        values = result.token_values
+        if remap != list(range(len(remap))):
+            for i in numbers:
+                values[i] = remap[values[i]]
+        merged.tokens.extend(result.tokens)
+        merged.token_types.extend(result.token_types)
+        merged.token_offsets.extend(result.token_offsets)
+        merged.token_values.extend(values)
+    return merged
+
+
+# ---------- Отпечаток потока лексем ----------
+def token_fingerprint(lexed: LexResult, text: str = None) -> str:
+    """
+    Отпечаток программы, не зависящий от пробелов, комментариев и имен: хеш потока
+    лексем, в котором идентификатор заменен номером его первого появления, а число -
+    значением константы (1 и 1.0 различаются). Имена переименованы взаимно однозначно,
+    поэтому у программ с одинаковым отпечатком совпадают разбор и поведение при исполнении.
+
+    Индекс идентификатора - хеш имени по модулю 997; если у разных имен он совпал,
+    имена берутся из text по смещениям лексем.
+    """
+    import hashlib
+    name_at = None
+    if len(lexed.identifier_table) != len(lexed.identifier_hash):
+        if text is None:
+            raise ValueError("Identifier hash collision: program text is required")
+        import re
+        word = re.compile(r"\w+")
+
+        def name_at(offset):
+            return word.match(text, offset).group()
+
+    constants = lexed.constants
+    ordinals = {}
+    parts = []
+    for token, value, offset in zip(lexed.tokens, lexed.token_values, lexed.token_offsets):
+        if value is None:
+            parts.append(token)
+        elif token == 'число':
+            parts.append(repr(constants[value]))
+        else:
+            key = value if name_at is None else name_at(offset)
+            ordinal = ordinals.get(key)
+            if ordinal is None:
+                ordinal = ordinals[key] = len(ordinals)
+            parts.append(f"#{ordinal}")
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def group_by_fingerprint(texts, lexer: "LexerFA" = None) -> Dict[str, List[int]]:
+    """
+    Номера программ из texts, сгруппированные по token_fingerprint в порядке первого
+    появления: разбирать и исполнять достаточно первую программу каждой группы.
+    """
+    lexer = lexer or LexerFA(verbose=False)
+    groups = {}
+    for i, text in enumerate(texts):
+        groups.setdefault(token_fingerprint(lexer.tokenize(text), text), []).append(i)
+    return groups
+
+
+# ---------- Дерево разбора ----------
+NO_NODE = -1
+
+
+class ParseTree:
+    """
+    Конкретное дерево разбора в арене: вместо объекта на каждый узел - параллельные
+    столбцы array('i'), индекс узла = номер строки:
+      kind          - номер символа грамматики (symbols[kind] - имя)
+      first_child   - первый потомок или NO_NODE
+      next_sibling  - следующий брат или NO_NODE
+      token_index   - номер токена для листьев-терминалов, иначе NO_NODE
+    Узел занимает 16 байт, поэтому память остается ограниченной и для очень больших программ.
+    """
+
+    def __init__(self, symbols: List[str]):
+        self.symbols = symbols
+        self.kind = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.token_index = array('i')
+        self.root = NO_NODE
+
+    def __len__(self):
+        return len(self.kind)
+
+    def add_node(self, kind: int) -> int:
+        self.kind.append(kind)
+        self.first_child.append(NO_NODE)
+        self.next_sibling.append(NO_NODE)
+        self.token_index.append(NO_NODE)
+        return len(self.kind) - 1
+
+    def symbol(self, node: int) -> str:
+        return self.symbols[self.kind[node]]
+
+    def children(self, node: int) -> List[int]:
+        result = []
+        child = self.first_child[node]
+        while child != NO_NODE:
+            result.append(child)
+            child = self.next_sibling[child]
+        return result
+
+    def preorder(self, node: int = None):
+        """Обход в прямом порядке без рекурсии"""
+        stack = [self.root if node is None else node]
+        if stack[0] == NO_NODE:
+            return
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(self.children(node)))
+
+    def token_span(self, node: int):
+        """(первый, последний) номер токена поддерева или None для пустого поддерева"""
+        first = last = None
+        for sub in self.preorder(node):
+            index = self.token_index[sub]
+            if index != NO_NODE:
+                if first is None:
+                    first = index
+                last = index
+        return None if first is None else (first, last)
+
+    def memory_size(self) -> int:
+        """Размер столбцов арены в байтах"""
+        return sum(column.itemsize * len(column)
+                   for column in (self.kind, self.first_child, self.next_sibling, self.token_index))
+
+    def compacted(self) -> "ParseTree":
+        """
+        Копия дерева без недостижимых узлов (остаются после замены поддеревьев).
+        Узлы копируются в прямом порядке, поэтому потомки по-прежнему идут после родителя.
+        """
+        result = ParseTree(self.symbols)
+        if self.root == NO_NODE:
+            return result
+        new_index = {}
+        for node in self.preorder():
+            new_index[node] = result.add_node(self.kind[node])
+            result.token_index[new_index[node]] = self.token_index[node]
+        for node, copy_node in new_index.items():
+            child = self.first_child[node]
+            if child != NO_NODE:
+                result.first_child[copy_node] = new_index[child]
+            sibling = self.next_sibling[node]
+            if sibling != NO_NODE and sibling in new_index:
+                result.next_sibling[copy_node] = new_index[sibling]
+        result.root = new_index[self.root]
+        return result
+
+    def to_nested(self, node: int = None):
+        """Дерево в виде вложенных кортежей (символ, [потомки]) - для отладки и тестов"""
+        node = self.root if node is None else node
+        return (self.symbol(node), [self.to_nested(child) for child in self.children(node)])
+
+    def print_tree(self, tokens: List[str] = None):
+        depth = {self.root: 0}
+        for node in self.preorder():
+            for child in self.children(node):
+                depth[child] = depth[node] + 1
+            label = self.symbol(node)
+            index = self.token_index[node]
+            if index != NO_NODE and tokens is not None:
+                label += f" [{index}: {tokens[index]}]"
+            print("  " * depth[node] + label)
+
+
+# ---------- LL(1) Parser ----------
+# Конфликт таблицы разбора: все правила, претендующие на ячейку table[nonterminal][terminal]
+LL1Conflict = namedtuple("LL1Conflict", ["nonterminal", "terminal", "productions"])
+
+# Политики разрешения конфликтов:
+#   first   - остается правило, попавшее в ячейку первым
+#   last    - остается последнее правило (прежнее поведение)
+#   longest - остается самое длинное правило
+#   dangling_else - конфликт висячего else (в ячейке 'else' правило, начинающееся с else,
+#             и ε-правило) разрешается в пользу else: else привязывается к ближайшему if;
+#             любой другой конфликт - ValueError, как у error
+#   error   - после построения таблицы выбрасывается ValueError со списком конфликтов
+CONFLICT_POLICIES = ("first", "last", "longest", "dangling_else", "error")
+
+# Синтаксическая ошибка: индекс токена, позиция (строка, столбец) или None, токен,
+# ожидаемые терминалы и сообщение
+ParseError = namedtuple("ParseError", ["index", "position", "token", "expected", "message"])
+
+# Токены синхронизации для восстановления после ошибок (в дополнение к FOLLOW)
+SYNC_TOKENS = frozenset({";", "end", "."})
+
+
+def is_dangling_else(conflict: LL1Conflict) -> bool:
+    """Конфликт висячего else: в ячейке 'else' правило, начинающееся с else, и ε-правило"""
+    productions = conflict.productions
+    return (conflict.terminal == "else" and len(productions) == 2
+            and sum(1 for p in productions if p and p[0] == "else") == 1
+            and sum(1 for p in productions if not p or p == ['ε']) == 1)
+
+
+class ConflictTable:
+    """
+    Общая основа LL(1)-анализаторов (LL1Parser здесь и в tyap_deterministic_final):
+    запись ячеек таблицы разбора со сбором конфликтов, их разрешение по политике и отчет.
+    Использует атрибуты table, conflicts и conflict_policy наследника.
+    """
+
+    @staticmethod
+    def validate_policy(conflict_policy):
+        if not callable(conflict_policy) and conflict_policy not in CONFLICT_POLICIES:
+            raise ValueError(f"Неизвестная политика разрешения конфликтов: {conflict_policy}")
+
+    def check_conflicts(self):
+        """ValueError, если политика не допускает найденных конфликтов (error, dangling_else)"""
+        policy = self.conflict_policy
+        if (policy == "error" and self.conflicts
+                or policy == "dangling_else" and not all(map(is_dangling_else, self.conflicts))):
+            raise ValueError("Грамматика не является LL(1):\n" + self.format_conflicts())
+
+    def _set_table_entry(self, nt, terminal, prod, conflict_index):
+        row = self.table[nt]
+        existing = row.get(terminal)
+        if existing is None:
+            row[terminal] = prod
+            return
+        if existing is prod:
+            return
+
+        key = (nt, terminal)
+        conflict = conflict_index.get(key)
+        if conflict is None:
+            conflict = LL1Conflict(nt, terminal, [existing])
+            conflict_index[key] = conflict
+            self.conflicts.append(conflict)
+        conflict.productions.append(prod)
+
+        policy = self.conflict_policy
+        if callable(policy):
+            row[terminal] = policy(nt, terminal, existing, prod)
+        elif policy == "last":
+            row[terminal] = prod
+        elif policy == "longest" and len(prod) > len(existing):
+            row[terminal] = prod
+        elif policy == "dangling_else" and not (existing and existing[0] == terminal):
+            row[terminal] = prod
+
+    def format_conflicts(self) -> str:
+        """Текстовый отчет о конфликтах таблицы разбора"""
+        lines = []
+        for conflict in self.conflicts:
+            chosen = self.table[conflict.nonterminal].get(conflict.terminal)
+            lines.append(f" {conflict.nonterminal} при '{conflict.terminal}':")
+            for prod in conflict.productions:
+                mark = "*" if prod is chosen else " "
+                lines.append(f"  {mark} {conflict.nonterminal} -> {' '.join(prod) if prod else 'ε'}")
+        return "\n".join(lines)
+
+    def print_conflicts(self):
+        """Выводит конфликты таблицы разбора (выбранное правило помечено *)"""
+        if not self.conflicts:
+            print("\nКонфликты в таблице разбора отсутствуют")
+            return
+        print(f"\nКонфликты в таблице разбора ({len(self.conflicts)}), политика '{self.conflict_policy}':")
+        print(self.format_conflicts())
+
+
+class LL1Parser(ConflictTable):
+    def __init__(self, grammar: Dict, conflict_policy="dangling_else"):
+        self.validate_policy(conflict_policy)
+        self.productions = grammar['productions']
+        # фиксированный порядок обхода: таблица и отчет о конфликтах не зависят от PYTHONHASHSEED
+        self.nonterminals = ordered_symbols(grammar['nonterminals'], self.productions)
+        self.terminals = ordered_symbols(grammar['terminals'], self.productions)
+        self.start_symbol = grammar['start_symbol']
+        self.conflict_policy = conflict_policy
+        self.first = defaultdict(set)
+        self.follow = defaultdict(set)
+        self.table = defaultdict(dict)
+        self.conflicts = []
+        self.build()
+
+    @classmethod
+    def from_tables(cls, tables) -> LL1Parser:
+        """
+        Анализатор из предвычисленных таблиц (модуль, созданный generate_language_tables)
+        без вычисления FIRST/FOLLOW и построения таблицы.
+        """
+        parser = cls.__new__(cls)
+        parser.productions = tables.PRODUCTIONS
+        parser.nonterminals = ordered_set(tables.NONTERMINALS)
+        parser.terminals = ordered_set(tables.TERMINALS)
+        parser.start_symbol = tables.START_SYMBOL
+        parser.conflict_policy = tables.CONFLICT_POLICY
+        parser.first = defaultdict(set, {symbol: set(first) for symbol, first in tables.FIRST.items()})
+        parser.follow = defaultdict(set, {symbol: set(follow) for symbol, follow in tables.FOLLOW.items()})
+        parser.table = defaultdict(dict)
+        for nt, row in tables.TABLE.items():
+            prods = parser.productions[nt]
+            parser.table[nt] = {terminal: prods[index] for terminal, index in row.items()}
+        parser.conflicts = [LL1Conflict(nt, terminal, [parser.productions[nt][i] for i in indices])
+                            for nt, terminal, indices in tables.CONFLICTS]
+        parser.build_symbol_table()
+        return parser
+
+    def build(self):
+        self.compute_first_sets()
+        self.build_suffix_index()
+        self.compute_follow_sets()
+        self.build_parse_table()
+        self.build_symbol_table()
+
+    def build_symbol_table(self):
+        """Нумерация всех символов грамматики (для столбца kind в ParseTree)"""
+        symbol_ids = ordered_set(self.nonterminals)
+        symbol_ids.update(ordered_set(self.terminals))
+        for prods in self.productions.values():
+            for prod in prods:
+                symbol_ids.update(ordered_set(prod))
+        self.symbols = list(symbol_ids)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    def compute_first_sets(self):
+        for t in self.terminals:
+            self.first[t] = {t}
+        changed = True
+        while changed:
+            changed = False
+            for nt in self.nonterminals:
+                for prod in self.productions.get(nt, []):
+                    before = len(self.first[nt])
+                    for symbol in prod:
+                        self.first[nt] |= self.first[symbol] - {'ε'}
+                        if 'ε' not in self.first[symbol]:
+                            break
+                    else:
+                        self.first[nt].add('ε')
+                    if len(self.first[nt]) > before:
+                        changed = True
+
+    def build_suffix_index(self):
+        """
+        FIRST и ε-порождаемость всех суффиксов всех правил, строится один раз после
+        сходимости FIRST: suffix_first[nt][i][k] = (FIRST(prod[k:]) без 'ε', prod[k:] =>* ε)
+        для i-го правила nt, k = 0..len(prod). Используется при вычислении FOLLOW и
+        построении таблицы вместо повторного first_of_sequence.
+        """
+        empty = (frozenset(), True)
+        # FIRST без 'ε' для символов, не порождающих ε: общий frozenset для всех вхождений
+        non_nullable = {}
+        self.suffix_first = {}
         for nt in self.nonterminals:
+            rows = []
             for prod in self.productions.get(nt, []):
-                first_set = self.first_of_sequence(prod)
-                for terminal in first_set - {'ε'}:
-                    self.table[nt][terminal] = prod
-                if 'ε' in first_set:
-                    for terminal in self.follow[nt]:
-                        self.table[nt][terminal] = prod
+                suffixes = [empty]
+                for symbol in reversed(prod):
+                    first = self.first[symbol]
+                    if 'ε' in first:
+                        following, nullable = suffixes[-1]
+                        suffixes.append((frozenset(first - {'ε'}) | following, nullable))
+                    else:
+                        if symbol not in non_nullable:
+                            non_nullable[symbol] = (frozenset(first), False)
+                        suffixes.append(non_nullable[symbol])
+                suffixes.reverse()
+                rows.append(suffixes)
+            self.suffix_first[nt] = rows
+
+    def compute_follow_sets(self):
+        """
+        Для A -> α B β: FOLLOW(B) ⊇ FIRST(β) добавляется один раз по индексу суффиксов;
+        неподвижная точка нужна только для включений FOLLOW(B) ⊇ FOLLOW(A) при β =>* ε.
+        """
+        for nt in self.nonterminals:
+            self.follow[nt]
+        self.follow[self.start_symbol].add('$')
+        edges = ordered_set()
+        for nt in self.nonterminals:
+            for prod, suffixes in zip(self.productions.get(nt, []), self.suffix_first[nt]):
+                for k, symbol in enumerate(prod):
+                    if symbol in self.nonterminals:
+                        first, nullable = suffixes[k + 1]
+                        self.follow[symbol] |= first
+                        if nullable and symbol != nt:
+                            edges.setdefault((nt, symbol))
+        changed = True
+        while changed:
+            changed = False
+            for source, target in edges:
+                before = len(self.follow[target])
+                self.follow[target] |= self.follow[source]
+                if len(self.follow[target]) > before:
+                    changed = True
+
+    def build_parse_table(self):
+        """
+        Строит таблицу разбора. Конфликты не перезаписываются молча, а собираются
+        в self.conflicts (по одной записи LL1Conflict на ячейку) и разрешаются
+        согласно self.conflict_policy.
+        """
+        self.table = defaultdict(dict)
+        self.conflicts = []
+        conflict_index = {}
+        for nt in self.nonterminals:
+            for prod, suffixes in zip(self.productions.get(nt, []), self.suffix_first[nt]):
+                first, nullable = suffixes[0]
+                cells = first | self.follow[nt] if nullable else first
+                for terminal in sorted(cells):
+                    self._set_table_entry(nt, terminal, prod, conflict_index)
+
+        self.check_conflicts()
+
+    def compress_table(self) -> CompressedTable:
+        """
+        Заменяет таблицу-словарь на CompressedTable. Интерфейс отображения сохраняется,
+        поэтому разбор, восстановление после ошибок и генераторы модулей работают без
+        изменений. Вызывается после построения таблицы.
+        """
+        if not isinstance(self.table, CompressedTable):
+            self.table = CompressedTable(self.table, self.terminals)
+        return self.table
 
     def first_of_sequence(self, symbols: List[str]) -> Set[str]:
         result = set()
@@ -685,16 +2137,23 @@ class LL1Parser:
         result.add('ε')
         return result
 
-    def parse(self, tokens: List[str]) -> List[Tuple[str, List[str]]]:
+    def parse(self, tokens: List[str], trace=False) -> List[Tuple[str, List[str]]]:
+        """
+        Разбор по таблице. Список tokens не изменяется: маркер конца '$' подставляется
+        при выходе за его границу, все состояние разбора локально, поэтому один
+        экземпляр можно использовать из нескольких потоков одновременно.
+        trace=True печатает вершину стека и текущий токен на каждом шаге.
+        """
         stack = deque(["$", self.start_symbol])
-        tokens.append("$")
+        end = len(tokens)
         cursor = 0
         output = []
         
         while stack:
             top = stack.pop()
-            current_token = tokens[cursor]
-            print(top, current_token)
+            current_token = tokens[cursor] if cursor < end else "$"
+            if trace:
+                print(top, current_token)
             if top == current_token:
                 cursor += 1
             elif top in self.terminals:
@@ -708,21 +2167,1042 @@ class LL1Parser:
             else:
                 raise SyntaxError(f"Unexpected token: {current_token} at {top}")
 
-        if cursor != len(tokens):
+        if cursor != end + 1:
             raise SyntaxError("Input not fully consumed")
         return output
 
+    def parse_to_tree(self, tokens: List[str], start_symbol: str = None, follow_token: str = None) -> ParseTree:
+        """
+        Разбор с построением конкретного дерева прямо во время анализа: при раскрытии
+        нетерминала в арене создаются узлы правой части, при совпадении терминала листу
+        присваивается номер токена. Список шагов вывода не строится. Список tokens не изменяется.
 
-# ---------- Пример грамматики и тест ----------
-if __name__ == '__main__':
-    grammar = {
+        start_symbol позволяет разобрать фрагмент, выводимый из другого нетерминала;
+        follow_token - токен, следующий за фрагментом в полной программе (используется
+        как предпросмотр вместо '$', чтобы сработали ε-правила из FOLLOW).
+        """
+        symbol_ids = self.symbol_ids
+        tree = ParseTree(self.symbols)
+        start = self.start_symbol if start_symbol is None else start_symbol
+        end = "$" if follow_token is None else follow_token
+        tree.root = tree.add_node(symbol_ids[start])
+        stack = [(end, NO_NODE), (start, tree.root)]
+        cursor = 0
+
+        while stack:
+            top, node = stack.pop()
+            current_token = tokens[cursor] if cursor < len(tokens) else end
+            if not stack:
+                # дно стека: маркер конца фрагмента
+                if cursor != len(tokens):
+                    raise SyntaxError("Input not fully consumed")
+                break
+            if top == current_token:
+                if node != NO_NODE:
+                    tree.token_index[node] = cursor
+                cursor += 1
+            elif top not in self.nonterminals:
+                raise SyntaxError(f"Unexpected token: {current_token}, expected: {top}")
+            elif current_token in self.table[top]:
+                prod = self.table[top][current_token]
+                previous = NO_NODE
+                children = []
+                for sym in prod:
+                    if sym == 'ε':
+                        continue
+                    child = tree.add_node(symbol_ids[sym])
+                    if previous == NO_NODE:
+                        tree.first_child[node] = child
+                    else:
+                        tree.next_sibling[previous] = child
+                    previous = child
+                    children.append((sym, child))
+                stack.extend(reversed(children))
+            else:
+                raise SyntaxError(f"Unexpected token: {current_token} at {top}")
+
+        return tree
+
+    def parse_with_recovery(self, tokens: List[str], positions=None, sync_tokens=SYNC_TOKENS, max_errors=None):
+        """
+        Разбор с восстановлением после ошибок в режиме паники: вместо остановки на первой
+        ошибке собирает все синтаксические ошибки за один проход.
+
+        - на вершине терминал, не совпадающий с токеном: терминал считается пропущенным
+          во входе и снимается со стека;
+        - для нетерминала A нет правила: если токен входит в FOLLOW(A) или в sync_tokens
+          (';', 'end', ...), A снимается со стека, иначе токен пропускается.
+
+        Пока после ошибки не совпал ни один терминал, новые ошибки не регистрируются,
+        чтобы одна ошибка не порождала каскад. positions - позиции токенов
+        (LexerFA.get_token_positions()). Список tokens не изменяется.
+
+        Возвращает (шаги вывода, список ParseError).
+        """
+        stack = ["$", self.start_symbol]
+        cursor = 0
+        output = []
+        errors = []
+        recovering = False
+
+        def current():
+            return tokens[cursor] if cursor < len(tokens) else "$"
+
+        def report(message, expected):
+            nonlocal recovering
+            if not recovering:
+                position = positions[cursor] if positions is not None and cursor < len(positions) else None
+                errors.append(ParseError(cursor, position, current(), expected, message))
+            recovering = True
+
+        while stack:
+            if max_errors is not None and len(errors) >= max_errors:
+                break
+            top = stack[-1]
+            current_token = current()
+            if top == current_token:
+                stack.pop()
+                cursor += 1
+                recovering = False
+            elif top not in self.nonterminals:
+                report(f"Unexpected token: {current_token}, expected: {top}", [top])
+                stack.pop()
+            elif current_token in self.table[top]:
+                stack.pop()
+                prod = self.table[top][current_token]
+                output.append((top, prod))
+                for sym in reversed(prod):
+                    if sym != 'ε':
+                        stack.append(sym)
+            else:
+                report(f"Unexpected token: {current_token} at {top}", sorted(self.table[top]))
+                if current_token == "$" or current_token in self.follow[top] or current_token in sync_tokens:
+                    stack.pop()
+                else:
+                    cursor += 1
+
+        if cursor < len(tokens) and (max_errors is None or len(errors) < max_errors):
+            report("Input not fully consumed", ["$"])
+        return output, errors
+
+
+# ---------- Сжатая таблица разбора ----------
+def table_memory_size(table) -> int:
+    """Размер таблицы-словаря в байтах: внешний словарь и словари строк (без символов и правил)"""
+    import sys
+    return sys.getsizeof(table) + sum(sys.getsizeof(row) for row in table.values())
+
+
+class CompressedRow(Mapping):
+    """Строка CompressedTable: отображение терминал -> правило только для чтения"""
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: CompressedTable, row: int):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, terminal):
+        prod = self.table.lookup_row(self.row, terminal)
+        if prod is None:
+            raise KeyError(terminal)
+        return prod
+
+    def __contains__(self, terminal):
+        return self.table.lookup_row(self.row, terminal) is not None
+
+    def __iter__(self):
+        lookup_row = self.table.lookup_row
+        return (terminal for terminal in self.table.terminals if lookup_row(self.row, terminal) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class CompressedTable(Mapping):
+    """
+    Таблица LL(1) в виде гребенчатого вектора (row displacement):
+      - у каждой строки действие по умолчанию - самое частое значение строки, в том
+        числе "ошибка" (-1); хранятся только ячейки, отличные от него;
+      - одинаковые строки (после этого шага) хранятся один раз;
+      - ячейки строк укладываются в общие массивы value/check со сдвигом base[row]
+        так, чтобы не пересекаться; ячейка (row, column) занята, если
+        check[base[row] + column] == row, иначе действует default[row].
+    Поиск - O(1), все массивы - array('i'). Отображение nonterminal -> CompressedRow
+    повторяет интерфейс defaultdict(dict): для нетерминала без строки возвращается
+    пустая строка.
+    """
+
+    def __init__(self, table: Dict, terminals=()):
+        columns = ordered_set(terminals)
+        columns.setdefault('$')
+        for row in table.values():
+            columns.update(ordered_set(row))
+        self.terminals = list(columns)
+        self.column = {terminal: i for i, terminal in enumerate(self.terminals)}
+        self.productions = []
+        self.dict_size = table_memory_size(table)
+        self.cells = sum(len(row) for row in table.values())
+
+        prod_ids = {}
+        row_ids = {}
+        rows = []           # (default, ячейки-исключения) различных строк
+        row_of = {}
+        for nt, row in table.items():
+            cells = {}
+            for terminal, prod in row.items():
+                if id(prod) not in prod_ids:
+                    prod_ids[id(prod)] = len(self.productions)
+                    self.productions.append(prod)
+                cells[self.column[terminal]] = prod_ids[id(prod)]
+            counts = Counter(cells.values())
+            default, count = counts.most_common(1)[0] if counts else (-1, 0)
+            if len(self.terminals) - len(cells) >= count:
+                default = -1
+            exceptions = {column: value for column, value in cells.items() if value != default}
+            if default != -1:
+                exceptions.update((column, -1) for column in range(len(self.terminals)) if column not in cells)
+            key = (default, tuple(sorted(exceptions.items())))
+            if key not in row_ids:
+                row_ids[key] = len(rows)
+                rows.append(key)
+            row_of[nt] = row_ids[key]
+
+        # укладка: сначала самые заполненные строки, каждой - наименьший свободный сдвиг.
+        # Занятые позиции - биты целого occupied; бит o в candidates означает, что при
+        # сдвиге o свободны позиции всех ячеек строки (сдвиги за концом всегда свободны)
+        base = [0] * len(rows)
+        check = []
+        value = []
+        occupied = 0
+        for r in sorted(range(len(rows)), key=lambda r: -len(rows[r][1])):
+            exceptions = rows[r][1]
+            if not exceptions:
+                continue
+            span = exceptions[-1][0] + 1
+            free = ~occupied & ((1 << (len(check) + span)) - 1)
+            candidates = free
+            for column, _ in exceptions:
+                candidates &= free >> column
+            offset = (candidates & -candidates).bit_length() - 1
+            base[r] = offset
+            if len(check) < offset + span:
+                check.extend([-1] * (offset + span - len(check)))
+                value.extend([-1] * (offset + span - len(value)))
+            for column, cell in exceptions:
+                occupied |= 1 << (offset + column)
+                check[offset + column] = r
+                value[offset + column] = cell
+
+        self.base = array('i', base)
+        self.default = array('i', (default for default, _ in rows))
+        self.check = array('i', check)
+        self.value = array('i', value)
+        self._index_rows(row_of)
+
+    @classmethod
+    def from_arrays(cls, terminals, productions, row_of: Dict, base, default, check, value,
+                    dict_size=0, cells=0) -> CompressedTable:
+        """
+        Таблица поверх готовых массивов без копирования: подходят array('i') и
+        memoryview с форматом 'i' (например, буфер разделяемой памяти).
+        """
+        table = cls.__new__(cls)
+        table.terminals = list(terminals)
+        table.column = {terminal: i for i, terminal in enumerate(table.terminals)}
+        table.productions = productions
+        table.dict_size = dict_size
+        table.cells = cells
+        table.base = base
+        table.default = default
+        table.check = check
+        table.value = value
+        table._index_rows(row_of)
+        return table
+
+    def _index_rows(self, row_of: Dict):
+        # одна строка-представление на различную строку таблицы
+        views = [CompressedRow(self, r) for r in range(len(self.default))]
+        self.rows = {nt: views[r] for nt, r in row_of.items()}
+        self.empty_row = CompressedRow(self, -1)
+
+    def lookup_row(self, row: int, terminal: str):
+        """Правило в ячейке (row, terminal) или None"""
+        column = self.column.get(terminal)
+        if column is None or row < 0:
+            return None
+        index = self.base[row] + column
+        if index < len(self.check) and self.check[index] == row:
+            cell = self.value[index]
+        else:
+            cell = self.default[row]
+        return self.productions[cell] if cell >= 0 else None
+
+    def lookup(self, nonterminal: str, terminal: str):
+        return self.lookup_row(self[nonterminal].row, terminal)
+
+    def __getitem__(self, nonterminal):
+        return self.rows.get(nonterminal, self.empty_row)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def memory_size(self) -> int:
+        """Размер в байтах: массивы, словари столбцов и строк, объекты строк"""
+        import sys
+        arrays = sum(column.itemsize * len(column) for column in (self.base, self.default, self.check, self.value))
+        return (arrays + sys.getsizeof(self.column) + sys.getsizeof(self.rows) + sys.getsizeof(self.productions)
+                + sys.getsizeof(self.empty_row) * (len(self.default) + 1))
+
+    def format_stats(self) -> str:
+        size = self.memory_size()
+        return (f"Таблица LL(1): {len(self.rows)} строк ({len(self.default)} различных), "
+                f"{len(self.terminals)} столбцов, {self.cells} заполненных ячеек, "
+                f"ячеек-исключений {sum(1 for r in self.check if r != -1)}, вектор {len(self.check)}; "
+                f"словари {self.dict_size} байт, сжатая {size} байт (x{self.dict_size / size:.1f})")
+
+
+# ---------- Таблицы в разделяемой памяти ----------
+# Плоский буфер с таблицами LL(1): заголовок, целочисленные секции (int32) и строки
+# символов. Процессы пула подключают его из multiprocessing.shared_memory и читают
+# массивы таблицы через memoryview без копирования; в каждом процессе создаются только
+# строки символов и списки правил.
+SHARED_MAGIC = b"TYAPLL1\0"
+SHARED_SECTIONS = (
+    "meta",              # число символов, стартовый символ, размер словарей, заполненных ячеек
+    "nonterminals",      # номера символов в порядке parser.nonterminals
+    "terminals",         # номера символов в порядке parser.terminals
+    "columns",           # номера символов столбцов таблицы
+    "row_symbols",       # нетерминалы со строкой таблицы ...
+    "row_of",            # ... и номера их строк
+    "prod_owner",        # для каждого правила - нетерминал (правила в порядке parser.productions)
+    "prod_offsets",      # границы правых частей в prod_symbols
+    "prod_symbols",
+    "base", "default", "check", "value",
+    "follow_offsets",    # FOLLOW нетерминалов в порядке parser.nonterminals
+    "follow_symbols",
+)
+
+
+def pack_parser_tables(parser: LL1Parser) -> bytes:
+    """
+    Таблицы parser в виде плоского буфера для attach_parser_tables(). Таблица
+    сжимается (CompressedTable), если это еще не сделано; FIRST и список конфликтов
+    не сохраняются - они нужны только при построении и генерации модулей.
+    """
+    import struct
+    if not isinstance(parser.conflict_policy, str):
+        raise ValueError("Only named conflict policies can be stored in a shared buffer")
+    table = parser.table if isinstance(parser.table, CompressedTable) else CompressedTable(parser.table, parser.terminals)
+
+    symbols = ordered_set(parser.symbols)
+    symbols.update(ordered_set(table.terminals))
+    symbols.update(ordered_set(table.rows))
+    for follow in parser.follow.values():
+        symbols.update(ordered_set(sorted(follow)))
+    symbols.setdefault(parser.start_symbol)
+    symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+
+    sections = {name: array('i') for name in SHARED_SECTIONS}
+    sections["meta"].extend((len(symbols), symbol_ids[parser.start_symbol], table.dict_size, table.cells))
+    sections["nonterminals"].extend(symbol_ids[nt] for nt in parser.nonterminals)
+    sections["terminals"].extend(symbol_ids[t] for t in parser.terminals)
+    sections["columns"].extend(symbol_ids[t] for t in table.terminals)
+    for nt, row in table.rows.items():
+        sections["row_symbols"].append(symbol_ids[nt])
+        sections["row_of"].append(row.row)
+
+    prod_index = {}
+    sections["prod_offsets"].append(0)
+    for nt, prods in parser.productions.items():
+        for prod in prods:
+            prod_index[id(prod)] = len(prod_index)
+            sections["prod_owner"].append(symbol_ids[nt])
+            sections["prod_symbols"].extend(symbol_ids[symbol] for symbol in prod)
+            sections["prod_offsets"].append(len(sections["prod_symbols"]))
+    sections["base"].extend(table.base)
+    sections["default"].extend(prod_index[id(table.productions[cell])] if cell >= 0 else -1 for cell in table.default)
+    sections["check"].extend(table.check)
+    sections["value"].extend(prod_index[id(table.productions[cell])] if cell >= 0 else -1 for cell in table.value)
+    sections["follow_offsets"].append(0)
+    for nt in parser.nonterminals:
+        sections["follow_symbols"].extend(symbol_ids[t] for t in sorted(parser.follow.get(nt, ())))
+        sections["follow_offsets"].append(len(sections["follow_symbols"]))
+
+    strings = "\0".join([parser.conflict_policy, *symbols]).encode("utf-8")
+    header = SHARED_MAGIC + struct.pack(f"={len(SHARED_SECTIONS) + 1}i",
+                                        *(len(sections[name]) for name in SHARED_SECTIONS), len(strings))
+    return b"".join([header, *(sections[name].tobytes() for name in SHARED_SECTIONS), strings])
+
+
+def attach_parser_tables(buffer) -> LL1Parser:
+    """
+    LL1Parser поверх буфера pack_parser_tables() (bytes, memoryview или
+    SharedMemory.buf): массивы таблицы читаются из буфера без копирования, поэтому
+    буфер должен жить, пока используется анализатор.
+    """
+    import struct
+    view = memoryview(buffer)
+    if bytes(view[:len(SHARED_MAGIC)]) != SHARED_MAGIC:
+        raise ValueError("Not a parser table buffer")
+    offset = len(SHARED_MAGIC)
+    count = len(SHARED_SECTIONS) + 1
+    lengths = struct.unpack_from(f"={count}i", view, offset)
+    offset += 4 * count
+    sections = {}
+    for name, length in zip(SHARED_SECTIONS, lengths):
+        sections[name] = view[offset:offset + 4 * length].cast('i')
+        offset += 4 * length
+    policy, *symbols = bytes(view[offset:offset + lengths[-1]]).decode("utf-8").split("\0")
+
+    symbol_count, start, dict_size, cells = sections["meta"]
+    if symbol_count != len(symbols):
+        raise ValueError("Corrupted parser table buffer")
+    parser = LL1Parser.__new__(LL1Parser)
+    parser.nonterminals = ordered_set(symbols[i] for i in sections["nonterminals"])
+    parser.terminals = ordered_set(symbols[i] for i in sections["terminals"])
+    parser.start_symbol = symbols[start]
+    parser.conflict_policy = policy
+    parser.conflicts = []
+    parser.first = defaultdict(set)
+
+    parser.productions = {}
+    all_prods = []
+    offsets = sections["prod_offsets"]
+    prod_symbols = sections["prod_symbols"]
+    for i, owner in enumerate(sections["prod_owner"]):
+        prod = [symbols[k] for k in prod_symbols[offsets[i]:offsets[i + 1]]]
+        parser.productions.setdefault(symbols[owner], []).append(prod)
+        all_prods.append(prod)
+
+    parser.follow = defaultdict(set)
+    offsets = sections["follow_offsets"]
+    for i, nt in enumerate(parser.nonterminals):
+        parser.follow[nt] = {symbols[k] for k in sections["follow_symbols"][offsets[i]:offsets[i + 1]]}
+
+    row_of = {symbols[nt]: row for nt, row in zip(sections["row_symbols"], sections["row_of"])}
+    parser.table = CompressedTable.from_arrays(
+        (symbols[i] for i in sections["columns"]), all_prods, row_of,
+        sections["base"], sections["default"], sections["check"], sections["value"], dict_size, cells)
+    parser.build_symbol_table()
+    # представления буфера: view.release() отпускает его до закрытия (SharedParserTables)
+    parser.shared_views = [*sections.values(), view]
+    return parser
+
+
+# Подключенные сегменты и представления их памяти. Сегмент нельзя закрыть, пока на него
+# ссылаются массивы таблицы (BufferError), поэтому он живет до конца процесса, а при
+# выходе представления освобождаются раньше сегмента.
+_ATTACHED_SEGMENTS = []
+
+
+def _close_attached_segments():
+    while _ATTACHED_SEGMENTS:
+        shm, views = _ATTACHED_SEGMENTS.pop()
+        for view in views:
+            view.release()
+        shm.close()
+
+
+class SharedParserTables:
+    """
+    Буфер pack_parser_tables() в multiprocessing.shared_memory. Создается в главном
+    процессе; процессы пула получают имя (name) и вызывают attach(name). Сегмент
+    удаляется close() создателя.
+    """
+
+    def __init__(self, parser: LL1Parser):
+        from multiprocessing import shared_memory
+        data = pack_parser_tables(parser)
+        self.shm = shared_memory.SharedMemory(create=True, size=len(data))
+        self.shm.buf[:len(data)] = data
+        self.name = self.shm.name
+        self.size = len(data)
+
+    @staticmethod
+    def attach(name: str) -> LL1Parser:
+        """
+        Анализатор поверх сегмента name. Сегмент остается подключенным до завершения
+        процесса: массивы таблицы ссылаются на его память.
+        """
+        import atexit
+        from multiprocessing import shared_memory
+        try:
+            # Python 3.13+: сегмент удаляет только создатель
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+        parser = attach_parser_tables(shm.buf)
+        if not _ATTACHED_SEGMENTS:
+            atexit.register(_close_attached_segments)
+        _ATTACHED_SEGMENTS.append((shm, parser.shared_views))
+        return parser
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------- Инкрементальный разбор ----------
+def may_join(left: str, right: str) -> bool:
+    """Могут ли два соседних символа оказаться в одной лексеме"""
+    if not left or not right:
+        return False
+    if (left.isalnum() or left == '_') and (right.isalnum() or right == '_'):
+        return True
+    return (left + right) in MULTI_CHAR_DELIMS
+
+
+class IncrementalParser:
+    """
+    Инкрементальный разбор редактируемой программы. После правки текста заново
+    лексируется и разбирается только наименьший оператор (statement_symbol, по
+    умолчанию 'оператор'), целиком содержащий правку; его поддерево заменяется
+    в арене ParseTree, остальное дерево и токены переиспользуются.
+
+    Если правка выходит за пределы оператора, затрагивает соседнюю лексему или
+    незакрытый комментарий, либо фрагмент не разбирается как оператор, выполняется
+    полный разбор. Режим последнего разбора - в last_mode ('full' | 'incremental').
+    """
+
+    def __init__(self, parser: LL1Parser, text: str, statement_symbol: str = "оператор", lexer: "LexerFA" = None):
+        self.parser = parser
+        self.lexer = LexerFA(verbose=False) if lexer is None else lexer
+        self.statement_symbol = statement_symbol
+        self.statement_kind = parser.symbol_ids.get(statement_symbol, NO_NODE)
+        self.full_parse(text)
+
+    def full_parse(self, text: str) -> ParseTree:
+        lexed = self.lexer.tokenize(text)
+        self.text = text
+        self.tokens = list(lexed.tokens)
+        self.token_offsets = list(lexed.token_offsets)
+        self.identifier_table = dict(lexed.identifier_table)
+        self.tree = None
+        self.last_mode = "full"
+        self.tree = self.parser.parse_to_tree(self.tokens)
+        self.garbage = 0
+        self.span_first = array('i')
+        self.span_last = array('i')
+        self._compute_spans(0)
+        return self.tree
+
+    def edit(self, start: int, end: int, new_text: str) -> ParseTree:
+        """Заменяет text[start:end] на new_text и обновляет дерево разбора"""
+        new_full = self.text[:start] + new_text + self.text[end:]
+        if self.tree is None or not self._reparse_statement(start, end, new_text, new_full):
+            return self.full_parse(new_full)
+        self.last_mode = "incremental"
+        return self.tree
+
+    def _compute_spans(self, start_node: int):
+        """
+        Диапазоны токенов (span_first, span_last) для узлов с номерами >= start_node.
+        Потомки в арене всегда имеют больший номер, чем родитель, поэтому достаточно
+        одного прохода в обратном порядке номеров.
+        """
+        tree = self.tree
+        first, last = self.span_first, self.span_last
+        missing = len(tree) - len(first)
+        first.extend([NO_NODE] * missing)
+        last.extend([NO_NODE] * missing)
+        for node in range(len(tree) - 1, start_node - 1, -1):
+            index = tree.token_index[node]
+            if index != NO_NODE:
+                first[node] = last[node] = index
+                continue
+            f = l = NO_NODE
+            child = tree.first_child[node]
+            while child != NO_NODE:
+                if first[child] != NO_NODE:
+                    if f == NO_NODE:
+                        f = first[child]
+                    l = last[child]
+                child = tree.next_sibling[child]
+            first[node], last[node] = f, l
+
+    def _find_statement(self, ta: int, tb: int):
+        """Наименьший оператор, содержащий токены ta..tb: (узел, родитель, предыдущий брат)"""
+        tree = self.tree
+        first, last = self.span_first, self.span_last
+        best = (NO_NODE, NO_NODE, NO_NODE)
+        node, parent, previous = tree.root, NO_NODE, NO_NODE
+        while node != NO_NODE:
+            if tree.kind[node] == self.statement_kind:
+                best = (node, parent, previous)
+            child, prev, found = tree.first_child[node], NO_NODE, NO_NODE
+            while child != NO_NODE:
+                if first[child] != NO_NODE and first[child] <= ta and tb <= last[child]:
+                    found = child
+                    break
+                prev, child = child, tree.next_sibling[child]
+            node, parent, previous = found, node, prev
+        return best
+
+    def _reparse_statement(self, start: int, end: int, new_text: str, new_full: str) -> bool:
+        offsets = self.token_offsets
+        ta = bisect_right(offsets, start) - 1
+        tb = max(ta, bisect_right(offsets, max(start, end - 1)) - 1)
+        if ta < 0 or self.statement_kind == NO_NODE:
+            return False
+        node, parent, previous = self._find_statement(ta, tb)
+        if node == NO_NODE:
+            return False
+
+        f, l = self.span_first[node], self.span_last[node]
+        region_start = offsets[f]
+        region_end = offsets[l + 1] if l + 1 < len(offsets) else len(self.text)
+        if start < region_start or end > region_end:
+            return False
+        char_delta = len(new_text) - (end - start)
+        new_end = region_end + char_delta
+        fragment = new_full[region_start:new_end]
+
+        # фрагмент не должен сливаться с соседними лексемами и обрывать комментарий
+        if fragment.rfind('{') > fragment.rfind('}'):
+            return False
+        # ':', '<' и '>' в самом конце текста лексер не выдает (ждет '=' следующим символом)
+        if fragment.endswith((":", "<", ">")):
+            return False
+        if region_start > 0 and may_join(new_full[region_start - 1], new_full[region_start]):
+            return False
+        if new_end < len(new_full) and may_join(new_full[new_end - 1], new_full[new_end]):
+            return False
+
+        lexed = self.lexer.tokenize(fragment)
+        if not lexed.tokens:
+            return False
+        follow = self.tokens[l + 1] if l + 1 < len(self.tokens) else "$"
+        try:
+            subtree = self.parser.parse_to_tree(lexed.tokens, self.statement_symbol, follow)
+        except SyntaxError:
+            return False
+
+        # токены и смещения
+        token_delta = len(lexed.tokens) - (l - f + 1)
+        self.tokens[f:l + 1] = lexed.tokens
+        offsets[f:l + 1] = [region_start + offset for offset in lexed.token_offsets]
+        if char_delta:
+            for k in range(f + len(lexed.tokens), len(offsets)):
+                offsets[k] += char_delta
+        self.identifier_table.update(lexed.identifier_table)
+        self.text = new_full
+
+        # сдвиг номеров токенов после оператора
+        tree = self.tree
+        if token_delta:
+            token_index, first, last = tree.token_index, self.span_first, self.span_last
+            for k in range(len(tree)):
+                if token_index[k] > l:
+                    token_index[k] += token_delta
+                if first[k] > l:
+                    first[k] += token_delta
+                if last[k] >= l:
+                    last[k] += token_delta
+
+        # новое поддерево дописывается в арену и подменяет старый оператор
+        base = len(tree)
+        for k in range(len(subtree)):
+            tree.add_node(subtree.kind[k])
+            child, sibling, index = subtree.first_child[k], subtree.next_sibling[k], subtree.token_index[k]
+            tree.first_child[base + k] = child + base if child != NO_NODE else NO_NODE
+            tree.next_sibling[base + k] = sibling + base if sibling != NO_NODE else NO_NODE
+            tree.token_index[base + k] = index + f if index != NO_NODE else NO_NODE
+        new_root = base + subtree.root
+        tree.next_sibling[new_root] = tree.next_sibling[node]
+        if previous != NO_NODE:
+            tree.next_sibling[previous] = new_root
+        elif parent != NO_NODE:
+            tree.first_child[parent] = new_root
+        else:
+            tree.root = new_root
+        self._compute_spans(base)
+
+        self.garbage += sum(1 for _ in tree.preorder(node))
+        if self.garbage > len(tree) // 2:
+            self.tree = tree.compacted()
+            self.garbage = 0
+            self.span_first = array('i')
+            self.span_last = array('i')
+            self._compute_spans(0)
+        return True
+
+
+# ---------- LALR(1) Parser ----------
+# Конфликт таблицы действий: все действия, претендующие на ячейку action[state][terminal]
+LALRConflict = namedtuple("LALRConflict", ["state", "terminal", "actions"])
+
+SHIFT, REDUCE, ACCEPT = 's', 'r', 'acc'
+
+
+class LALR1Parser:
+    """
+    LALR(1)-анализатор (перенос-свертка). Принимает тот же формат, что и LL1Parser
+    (Grammar.toDict()), в том числе леворекурсивные правила, поэтому грамматику
+    не нужно факторизовать и освобождать от левой рекурсии.
+
+    Таблица строится по алгоритму распространения предпросмотров:
+    LR(0)-ядра -> спонтанные и распространяемые предпросмотры -> неподвижная точка.
+    Конфликты собираются в self.conflicts; политика 'yacc' предпочитает перенос
+    при конфликте перенос/свертка (висячий else) и правило с меньшим номером при
+    конфликте свертка/свертка, политика 'error' выбрасывает ValueError.
+    """
+
+    def __init__(self, grammar: Dict, conflict_policy="yacc"):
+        if conflict_policy not in ("yacc", "error"):
+            raise ValueError(f"Неизвестная политика разрешения конфликтов: {conflict_policy}")
+        self.productions = grammar['productions']
+        self.nonterminals = ordered_symbols(grammar['nonterminals'], self.productions)
+        self.terminals = ordered_symbols(grammar['terminals'], self.productions)
+        self.start_symbol = grammar['start_symbol']
+        self.conflict_policy = conflict_policy
+
+        # Правило 0 - пополнение грамматики S' -> S
+        self.augmented_start = f"{self.start_symbol}'"
+        self.rules = [(self.augmented_start, [self.start_symbol])]
+        self.rules_by_lhs = defaultdict(list)
+        for nt in self.nonterminals:
+            for prod in self.productions.get(nt, []):
+                self.rules_by_lhs[nt].append(len(self.rules))
+                self.rules.append((nt, prod))
+
+        self.first = defaultdict(set)
+        self.nullable = set()
+        self.states = []           # ядра состояний: кортежи пунктов (rule, dot)
+        self.transitions = []      # transitions[state][symbol] = state
+        self.action = []           # action[state][terminal] = (SHIFT, state) | (REDUCE, rule) | (ACCEPT, None)
+        self.goto = []             # goto[state][nonterminal] = state
+        self.conflicts = []
+        self.build()
+
+    def build(self):
+        self.compute_first_sets()
+        self.build_suffix_index()
+        self.build_lr0_automaton()
+        lookaheads = self.compute_lookaheads()
+        self.build_tables(lookaheads)
+
+    def compute_first_sets(self):
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.rules:
+                before = len(self.first[lhs])
+                was_nullable = lhs in self.nullable
+                for symbol in rhs:
+                    if symbol in self.nonterminals:
+                        self.first[lhs] |= self.first[symbol]
+                        if symbol not in self.nullable:
+                            break
+                    else:
+                        self.first[lhs].add(symbol)
+                        break
+                else:
+                    self.nullable.add(lhs)
+                if len(self.first[lhs]) > before or (lhs in self.nullable) != was_nullable:
+                    changed = True
+
+    def build_suffix_index(self):
+        """
+        suffix_first[rule][dot] = (FIRST(rhs[dot:]) в порядке sorted, rhs[dot:] =>* ε):
+        предпросмотры замыкания LR(1) берутся из индекса, а не вычисляются заново
+        для каждого пункта.
+        """
+        self.suffix_first = []
+        for _, rhs in self.rules:
+            suffixes = [((), True)]
+            for symbol in reversed(rhs):
+                if symbol in self.nonterminals:
+                    following, nullable = suffixes[-1]
+                    if symbol in self.nullable:
+                        suffixes.append((tuple(sorted(self.first[symbol].union(following))), nullable))
+                    else:
+                        suffixes.append((tuple(sorted(self.first[symbol])), False))
+                else:
+                    suffixes.append(((symbol,), False))
+            suffixes.reverse()
+            self.suffix_first.append(suffixes)
+
+    def first_of_sequence(self, symbols, lookahead):
+        """FIRST(symbols lookahead) для предпросмотра пункта LR(1)"""
+        result = set()
+        for symbol in symbols:
+            if symbol in self.nonterminals:
+                result |= self.first[symbol]
+                if symbol not in self.nullable:
+                    return result
+            else:
+                result.add(symbol)
+                return result
+        result.add(lookahead)
+        return result
+
+    def closure_lr0(self, kernel):
+        items = list(kernel)
+        seen = set(kernel)
+        for rule, dot in items:
+            rhs = self.rules[rule][1]
+            if dot < len(rhs) and rhs[dot] in self.nonterminals:
+                for sub_rule in self.rules_by_lhs[rhs[dot]]:
+                    if (sub_rule, 0) not in seen:
+                        seen.add((sub_rule, 0))
+                        items.append((sub_rule, 0))
+        return items
+
+    def closure_lr1(self, items):
+        """Замыкание множества пунктов LR(1) вида (rule, dot, lookahead)"""
+        items = list(items)
+        seen = set(items)
+        for rule, dot, lookahead in items:
+            rhs = self.rules[rule][1]
+            if dot < len(rhs) and rhs[dot] in self.nonterminals:
+                lookaheads, nullable = self.suffix_first[rule][dot + 1]
+                if nullable and lookahead not in lookaheads:
+                    lookaheads = sorted((*lookaheads, lookahead))
+                for sub_rule in self.rules_by_lhs[rhs[dot]]:
+                    for b in lookaheads:
+                        item = (sub_rule, 0, b)
+                        if item not in seen:
+                            seen.add(item)
+                            items.append(item)
+        return items
+
+    def build_lr0_automaton(self):
+        start_kernel = ((0, 0),)
+        state_index = {start_kernel: 0}
+        self.states = [start_kernel]
+        self.transitions = []
+        for kernel in self.states:
+            moves = {}
+            for rule, dot in self.closure_lr0(kernel):
+                rhs = self.rules[rule][1]
+                if dot < len(rhs):
+                    moves.setdefault(rhs[dot], []).append((rule, dot + 1))
+            row = {}
+            for symbol, items in moves.items():
+                target = tuple(sorted(set(items)))
+                if target not in state_index:
+                    state_index[target] = len(self.states)
+                    self.states.append(target)
+                row[symbol] = state_index[target]
+            self.transitions.append(row)
+
+    def compute_lookaheads(self):
+        """
+        Предпросмотры ядерных пунктов: для каждого ядерного пункта строится замыкание
+        с фиктивным предпросмотром dummy (строка из '#', не совпадающая ни с одним
+        символом грамматики); остальные предпросмотры порождаются спонтанно, а dummy
+        означает распространение из исходного пункта.
+        """
+        dummy = '#'
+        while dummy in self.terminals or dummy in self.nonterminals or dummy in self.rules_by_lhs:
+            dummy += '#'
+        lookaheads = [{item: set() for item in kernel} for kernel in self.states]
+        lookaheads[0][(0, 0)].add('$')
+        propagate = defaultdict(list)
+
+        for state, kernel in enumerate(self.states):
+            for kernel_item in kernel:
+                for rule, dot, lookahead in self.closure_lr1([(kernel_item[0], kernel_item[1], dummy)]):
+                    rhs = self.rules[rule][1]
+                    if dot == len(rhs):
+                        continue
+                    target = self.transitions[state][rhs[dot]]
+                    target_item = (rule, dot + 1)
+                    if lookahead == dummy:
+                        propagate[(state, kernel_item)].append((target, target_item))
+                    else:
+                        lookaheads[target][target_item].add(lookahead)
+
+        changed = True
+        while changed:
+            changed = False
+            for (state, item), targets in propagate.items():
+                source = lookaheads[state][item]
+                for target, target_item in targets:
+                    dest = lookaheads[target][target_item]
+                    before = len(dest)
+                    dest |= source
+                    if len(dest) > before:
+                        changed = True
+        return lookaheads
+
+    def build_tables(self, lookaheads):
+        self.action = []
+        self.goto = []
+        self.conflicts = []
+        for state, kernel in enumerate(self.states):
+            row = {}
+            conflicts = {}
+            for symbol, target in self.transitions[state].items():
+                if symbol not in self.nonterminals:
+                    row[symbol] = (SHIFT, target)
+            self.goto.append({symbol: target for symbol, target in self.transitions[state].items()
+                              if symbol in self.nonterminals})
+
+            kernel_items = [(rule, dot, la) for rule, dot in kernel
+                            for la in sorted(lookaheads[state][(rule, dot)])]
+            for rule, dot, lookahead in self.closure_lr1(kernel_items):
+                if dot != len(self.rules[rule][1]):
+                    continue
+                action = (ACCEPT, None) if rule == 0 else (REDUCE, rule)
+                existing = row.get(lookahead)
+                if existing is None:
+                    row[lookahead] = action
+                elif existing != action:
+                    conflict = conflicts.get(lookahead)
+                    if conflict is None:
+                        conflict = LALRConflict(state, lookahead, [existing])
+                        conflicts[lookahead] = conflict
+                        self.conflicts.append(conflict)
+                    if action not in conflict.actions:
+                        conflict.actions.append(action)
+                    # yacc: перенос важнее свертки, из сверток - правило с меньшим номером
+                    if existing[0] == REDUCE and action[0] == REDUCE and action[1] < existing[1]:
+                        row[lookahead] = action
+            self.action.append(row)
+
+        if self.conflicts and self.conflict_policy == "error":
+            raise ValueError("Грамматика не является LALR(1):\n" + self.format_conflicts())
+
+    def format_action(self, action) -> str:
+        kind, arg = action
+        if kind == SHIFT:
+            return f"перенос, состояние {arg}"
+        if kind == REDUCE:
+            lhs, rhs = self.rules[arg]
+            return f"свертка {lhs} -> {' '.join(rhs) if rhs else 'ε'}"
+        return "допуск"
+
+    def format_conflicts(self) -> str:
+        """Текстовый отчет о конфликтах таблицы действий"""
+        lines = []
+        for conflict in self.conflicts:
+            chosen = self.action[conflict.state].get(conflict.terminal) if conflict.state < len(self.action) else None
+            lines.append(f" состояние {conflict.state} при '{conflict.terminal}':")
+            for action in conflict.actions:
+                mark = "*" if action == chosen else " "
+                lines.append(f"  {mark} {self.format_action(action)}")
+        return "\n".join(lines)
+
+    def print_conflicts(self):
+        """Выводит конфликты таблицы действий (выбранное действие помечено *)"""
+        if not self.conflicts:
+            print("\nКонфликты в таблице LALR(1) отсутствуют")
+            return
+        print(f"\nКонфликты в таблице LALR(1) ({len(self.conflicts)}), политика '{self.conflict_policy}':")
+        print(self.format_conflicts())
+
+    def parse(self, tokens: List[str]) -> List[Tuple[str, List[str]]]:
+        """
+        Разбор переносом-сверткой. Возвращает свертки (lhs, prod) в порядке
+        выполнения, т.е. правый вывод в обратном порядке. Список tokens не изменяется.
+        """
+        stack = [0]
+        output = []
+        cursor = 0
+        current_token = tokens[0] if tokens else '$'
+
+        while True:
+            action = self.action[stack[-1]].get(current_token)
+            if action is None:
+                expected = list(self.action[stack[-1]].keys())
+                raise SyntaxError(f"Unexpected token: {current_token} at position {cursor}, expected: {expected}")
+            kind, arg = action
+            if kind == SHIFT:
+                stack.append(arg)
+                cursor += 1
+                current_token = tokens[cursor] if cursor < len(tokens) else '$'
+            elif kind == REDUCE:
+                lhs, rhs = self.rules[arg]
+                if rhs:
+                    del stack[-len(rhs):]
+                stack.append(self.goto[stack[-1]][lhs])
+                output.append((lhs, rhs))
+            else:
+                return output
+
+
+# ---------- CYK ----------
+class CYKRecognizer:
+    """
+    Распознаватель Кока-Янгера-Касами для грамматики в нормальной форме Хомского
+    (Grammar.to_cnf()): подходит для неоднозначных и не LL(1)-грамматик.
+
+    Таблица хранится битовыми множествами по начальным позициям: spans[l][A] - целое
+    число, бит i которого означает, что A порождает лексемы i..i+l-1. Правило A -> B C
+    при разбиении k обрабатывает сразу все начальные позиции:
+        spans[l][A] |= spans[k][B] & (spans[l-k][C] >> k)
+    поэтому число операций в Python - O(n^2 * |правил|), а не O(n^3 * |правил|).
+    """
+
+    def __init__(self, grammar: Dict):
+        self.start_symbol = grammar["start_symbol"]
+        productions = grammar["productions"]
+        self.nonterminals = list(ordered_set([self.start_symbol, *productions]))
+        self.index = {nt: i for i, nt in enumerate(self.nonterminals)}
+
+        self.nullable = False
+        self.terminal_rules = defaultdict(list)    # терминал -> нетерминалы A с правилом A -> a
+        self.rules_by_left = defaultdict(list)     # B -> [(C, A)] для правил A -> B C
+        for A, prods in productions.items():
+            for prod in prods:
+                if not prod and A == self.start_symbol:
+                    self.nullable = True
+                elif len(prod) == 1 and prod[0] not in self.index:
+                    self.terminal_rules[prod[0]].append(self.index[A])
+                elif len(prod) == 2 and all(sym in self.index for sym in prod):
+                    self.rules_by_left[self.index[prod[0]]].append((self.index[prod[1]], self.index[A]))
+                else:
+                    raise ValueError(f"Grammar is not in CNF: {A} -> {' '.join(prod) or 'ε'}")
+
+    def recognize(self, tokens: List[str]) -> bool:
+        """Принадлежит ли цепочка лексем языку грамматики"""
+        if not tokens:
+            return self.nullable
+        if any(token not in self.terminal_rules for token in tokens):
+            return False
+        n = len(tokens)
+        count = len(self.nonterminals)
+        spans = [None, [0] * count]
+        for i, token in enumerate(tokens):
+            for A in self.terminal_rules[token]:
+                spans[1][A] |= 1 << i
+        rules_by_left = list(self.rules_by_left.items())
+        for length in range(2, n + 1):
+            row = [0] * count
+            for k in range(1, length):
+                left = spans[k]
+                right = spans[length - k]
+                for B, rules in rules_by_left:
+                    left_bits = left[B]
+                    if not left_bits:
+                        continue
+                    for C, A in rules:
+                        if right[C]:
+                            row[A] |= left_bits & (right[C] >> k)
+            spans.append(row)
+        return bool(spans[n][self.index[self.start_symbol]] & 1)
+
+
+# ---------- Грамматика языка ----------
+LANGUAGE_GRAMMAR = {
     "nonterminals": {
         "программа", "описание", "тело", "оператор", "присваивания", "условный",
         "цикла", "цикла_фиксированный", "составной", "ввода", "вывода", "выражение", 
         "сумма", "произведение", "множитель", "унарное", 
         "логическая_константа", "описание_хвост", "оператор_список", "тип",
         "знак_сравнения", "сумма_хвост", "произведение_хвост", "ид_хвост",
-        "ввода_хвост", "вывода_хвост", "буква", "цифра", "комментарий"
+        "ввода_хвост", "вывода_хвост", "буква", "цифра", "комментарий",
+        "операция_сложения", "операция_умножения", "текст_комментария", "символ"
     },
     "terminals": {
         "program", "var", "begin", "end", "%", "!", "$", "read", "write", "if", "then",
@@ -785,23 +3265,375 @@ if __name__ == '__main__':
         "текст_комментария": [["символ", "текст_комментария"], []],
         "символ": [[c] for c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_ \t\n"]
     }
-    }
+}
 
-    grammar222 = Grammar(grammar)
-    grammar222.print_grammar()
-    grammar222.check_language_existence()
-    grammar222.remove_epsilon_rules()
-    grammar222.eliminate_unreachable()
-    grammar222.eliminate_non_generating()
-    grammar222.eliminate_chain_rules()
-    grammar222.eliminate_left_factoring()
-    grammar222.eliminate_immediate_left_recursion()
+
+def build_language_grammar(grammar: Dict = LANGUAGE_GRAMMAR, verbose=True) -> Grammar:
+    """Цепочка преобразований грамматики языка для LL(1)-анализатора (как в __main__)"""
+    import contextlib
+    # print при sys.stdout = None ничего не выводит
+    with contextlib.redirect_stdout(None) if not verbose else contextlib.nullcontext():
+        transformed = Grammar(grammar)
+        transformed.check_language_existence()
+        transformed.remove_epsilon_rules()
+        transformed.eliminate_unreachable()
+        transformed.eliminate_non_generating()
+        transformed.eliminate_chain_rules()
+        transformed.eliminate_left_factoring()
+        transformed.eliminate_left_recursion()
+        transformed.eliminate_unreachable()
+        # "оператор" - единица повторного разбора IncrementalParser
+        transformed.compact(keep=("оператор",))
+        # подстановка при сжатии открывает общие префиксы (сумма и произведение в выражении)
+        transformed.eliminate_left_factoring()
+        transformed.compact(keep=("оператор",))
+    return transformed
+
+
+# ---------- Предвычисленные таблицы ----------
+# Модуль с таблицами LL(1) для LANGUAGE_GRAMMAR генерируется командой
+#   python tyap.py --generate-tables
+# и загружается load_language_parser() без преобразований грамматики и построения таблицы.
+TABLES_MODULE = "tyap_tables"
+TABLES_FORMAT = 2
+
+
+def _source_block(lines, start) -> str:
+    """
+    Текст определения функции, начинающегося со строки start (нумерация с 1): декораторы,
+    заголовок и все следующие строки с большим отступом; пустые строки в конце не входят
+    """
+    while lines[start - 1].lstrip().startswith("@"):
+        start += 1
+    header = lines[start - 1]
+    indent = len(header) - len(header.lstrip())
+    end = start
+    while end < len(lines) and (not lines[end].strip() or len(lines[end]) - len(lines[end].lstrip()) > indent):
+        end += 1
+    return "\n".join(lines[start - 1:end]).rstrip()
+
+
+def transformation_signature() -> list:
+    """
+    Код, от которого зависят таблицы: преобразования грамматики и построение таблицы
+    LL(1). Его изменение меняет grammar_hash, и устаревшие tyap_tables/tyap_descent
+    строятся заново без ручного увеличения TABLES_FORMAT. Учитывается текст функций,
+    а не байт-код: байт-код разный в разных версиях Python, и сгенерированные модули
+    считались бы устаревшими везде, кроме версии, в которой их построили.
+    """
+    functions = [ordered_set, ordered_symbols, build_language_grammar]
+    functions += [f for f in vars(Grammar).values() if hasattr(f, "__code__")]
+    functions += [LL1Parser.build, LL1Parser.build_symbol_table, LL1Parser.compute_first_sets,
+                  LL1Parser.build_suffix_index, LL1Parser.compute_follow_sets,
+                  LL1Parser.build_parse_table, LL1Parser._set_table_entry, is_dangling_else]
+    try:
+        with open(__file__, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        # исходный текст недоступен (например, только .pyc): таблицы будут построены заново
+        return [f.__qualname__ for f in functions]
+    return [_source_block(lines, f.__code__.co_firstlineno) for f in functions]
+
+
+def grammar_hash(grammar: Dict, conflict_policy=None) -> str:
+    """
+    Контрольная сумма канонического представления грамматики (множества символов
+    сортируются, порядок правил сохраняется) вместе с версией формата таблиц, кодом
+    преобразований (transformation_signature) и, если задана, политикой разрешения конфликтов.
+    Используется crc32: hashlib и json заметно увеличивают время запуска.
+    """
+    import zlib
+    canonical = (
+        TABLES_FORMAT,
+        conflict_policy,
+        sorted(grammar['nonterminals']),
+        sorted(grammar['terminals']),
+        grammar['start_symbol'],
+        [(nt, grammar['productions'][nt]) for nt in grammar['productions']],
+        transformation_signature(),
+    )
+    return f"{zlib.crc32(repr(canonical).encode()):08x}"
+
+
+def generate_language_tables(path: str, grammar: Dict = LANGUAGE_GRAMMAR, conflict_policy="dangling_else") -> LL1Parser:
+    """Строит LL(1)-анализатор для grammar и записывает его таблицы модулем Python в path"""
+    from pprint import pformat
+
+    parser = LL1Parser(build_language_grammar(grammar, verbose=False).toDict(), conflict_policy)
+
+    def index_of(nt, prod):
+        return next(i for i, p in enumerate(parser.productions[nt]) if p is prod)
+
+    constants = [
+        ("GRAMMAR_HASH", grammar_hash(grammar, conflict_policy)),
+        ("CONFLICT_POLICY", conflict_policy),
+        ("START_SYMBOL", parser.start_symbol),
+        ("NONTERMINALS", list(parser.nonterminals)),
+        ("TERMINALS", list(parser.terminals)),
+        ("PRODUCTIONS", parser.productions),
+        ("FIRST", {symbol: sorted(first) for symbol, first in parser.first.items()}),
+        ("FOLLOW", {symbol: sorted(follow) for symbol, follow in parser.follow.items()}),
+        # номер правила в PRODUCTIONS[nt]
+        ("TABLE", {nt: {terminal: index_of(nt, prod) for terminal, prod in row.items()}
+                   for nt, row in parser.table.items()}),
+        ("CONFLICTS", [(c.nonterminal, c.terminal, [index_of(c.nonterminal, prod) for prod in c.productions])
+                       for c in parser.conflicts]),
+    ]
+    lines = ["# Сгенерировано: python tyap.py --generate-tables. Не редактировать вручную.", ""]
+    for name, value in constants:
+        lines.append(f"{name} = {pformat(value, width=120, sort_dicts=False)}")
+        lines.append("")
+    write_module(path, "\n".join(lines))
+    return parser
+
+
+def write_module(path: str, source: str):
+    """
+    Атомарная запись сгенерированного модуля: текст пишется во временный файл рядом
+    с path и переименовывается, поэтому параллельно запущенный процесс импортирует
+    либо прежний файл, либо новый целиком, но не недописанный
+    """
+    import os
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(source)
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
+
+
+def load_language_parser(conflict_policy="dangling_else") -> LL1Parser:
+    """
+    LL(1)-анализатор языка из предвычисленного модуля tyap_tables. Если модуль
+    отсутствует или построен для другой грамматики, политики или версии преобразований
+    (GRAMMAR_HASH), таблицы строятся заново.
+    """
+    import importlib
+    try:
+        tables = importlib.import_module(TABLES_MODULE)
+    except ImportError:
+        tables = None
+    if tables is not None and tables.GRAMMAR_HASH == grammar_hash(LANGUAGE_GRAMMAR, conflict_policy):
+        return LL1Parser.from_tables(tables)
+    return LL1Parser(build_language_grammar(verbose=False).toDict(), conflict_policy)
+
+
+# ---------- Сгенерированный рекурсивный спуск ----------
+# По таблице LL(1) генерируется модуль с функцией на каждый нетерминал: ветвление по
+# номеру правила из строки таблицы, индексируемой номером токена. Стек и поиск в
+# словарях на каждом шаге не нужны. Вывод и сообщения об ошибках - как у LL1Parser.parse;
+# вход, вложенность которого превышает предел рекурсии Python, разбирается тем же
+# алгоритмом с явным стеком.
+DESCENT_MODULE = "tyap_descent"
+DESCENT_FORMAT = 2
+
+
+def generate_descent_source(parser: LL1Parser, source_hash: str) -> str:
+    """
+    Текст модуля с функцией parse(tokens) для таблицы parser. Непосредственная правая
+    рекурсия (A -> ... A) превращается в цикл, поэтому длинные списки операторов не
+    увеличивают глубину рекурсии.
+    """
+    from pprint import pformat
+
+    terminals = parser.terminals
+    symbols = ["$"] + [symbol for symbol in parser.symbols if symbol not in ("$", "ε")]
+    symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+    unknown = len(symbols)
+    # функции для всех нетерминальных символов, в том числе без правил (строка таблицы пуста)
+    functions = {symbol: i for i, symbol in enumerate(s for s in symbols[1:] if s not in terminals)}
+
+    def index_of(nt, prod):
+        return next(i for i, p in enumerate(parser.productions[nt]) if p is prod)
+
+    def symbol_code(symbol, indent):
+        pad = " " * indent
+        if symbol in terminals:
+            return [f"{pad}if ids[cursor] != {symbol_ids[symbol]}:",
+                    f"{pad}    raise _Unexpected(cursor, {symbol!r}, True)",
+                    f"{pad}cursor += 1"]
+        return [f"{pad}if ids[cursor] == {symbol_ids[symbol]}:",
+                f"{pad}    cursor += 1",
+                f"{pad}else:",
+                f"{pad}    cursor = _parse_{functions[symbol]}(ids, cursor, output)"]
+
+    lines = [
+        f"# Сгенерировано: python tyap.py --generate-tables. Не редактировать вручную.",
+        f"# Если GRAMMAR_HASH устарел, load_language_descent() собирает модуль в памяти.",
+        "",
+        f"FORMAT = {DESCENT_FORMAT}",
+        f"GRAMMAR_HASH = {source_hash!r}",
+        "",
+        f"PRODUCTIONS = {pformat(parser.productions, width=120, sort_dicts=False)}",
+        "",
+        f"_SYMBOL_IDS = {pformat(symbol_ids, width=120, sort_dicts=False)}",
+        f"_UNKNOWN = {unknown}",
+        "",
+        "",
+        "class _Unexpected(Exception):",
+        "    def __init__(self, cursor, symbol, terminal):",
+        "        self.cursor = cursor",
+        "        self.symbol = symbol",
+        "        self.terminal = terminal",
+        "",
+    ]
+    for symbol, k in functions.items():
+        row = [-1] * (unknown + 1)
+        for terminal, prod in parser.table.get(symbol, {}).items():
+            if terminal in symbol_ids:
+                row[symbol_ids[terminal]] = index_of(symbol, prod)
+        lines.append("")
+        for i in sorted(set(row) - {-1}):
+            lines.append(f"_P_{k}_{i} = PRODUCTIONS[{symbol!r}][{i}]")
+        lines.append(f"_ROW_{k} = {tuple(row)!r}")
+        lines += ["", "", f"def _parse_{k}(ids, cursor, output):", f"    # {symbol}", "    while True:",
+                  f"        choice = _ROW_{k}[ids[cursor]]"]
+        for i in sorted(set(row) - {-1}):
+            body = [sym for sym in parser.productions[symbol][i] if sym != 'ε']
+            lines.append(f"        if choice == {i}:")
+            lines.append(f"            output.append(({symbol!r}, _P_{k}_{i}))")
+            tail = bool(body) and body[-1] == symbol
+            for sym in body[:-1] if tail else body:
+                lines += symbol_code(sym, 12)
+            if tail:
+                lines += [f"            if ids[cursor] == {symbol_ids[symbol]}:",
+                          "                return cursor + 1",
+                          "            continue"]
+            else:
+                lines.append("            return cursor")
+        lines.append(f"        raise _Unexpected(cursor, {symbol!r}, False)")
+        lines.append("")
+
+    lines += ["", f"_START = {parser.start_symbol!r}",
+              f"_TERMINALS = frozenset({sorted(terminals)!r})",
+              "_ROWS = {" + ", ".join(f"{symbol!r}: _ROW_{k}" for symbol, k in functions.items()) + "}",
+              "",
+              "",
+              "def _parse_with_stack(tokens):",
+              '    """Разбор с явным стеком по тем же строкам таблицы: шаги LL1Parser.parse"""',
+              "    stack = ['$', _START]",
+              "    end = len(tokens)",
+              "    cursor = 0",
+              "    output = []",
+              "    while stack:",
+              "        top = stack.pop()",
+              "        token = tokens[cursor] if cursor < end else '$'",
+              "        if top == token:",
+              "            cursor += 1",
+              "            continue",
+              "        if top in _TERMINALS:",
+              '            raise SyntaxError(f"Unexpected token: {token}, expected: {top}")',
+              "        choice = _ROWS[top][_SYMBOL_IDS.get(token, _UNKNOWN)]",
+              "        if choice < 0:",
+              '            raise SyntaxError(f"Unexpected token: {token} at {top}")',
+              "        prod = PRODUCTIONS[top][choice]",
+              "        output.append((top, prod))",
+              "        stack.extend(sym for sym in reversed(prod) if sym != 'ε')",
+              "    if cursor != end + 1:",
+              '        raise SyntaxError("Input not fully consumed")',
+              "    return output",
+              ""]
+
+    # За концом входа LL1Parser.parse видит "$" сколько угодно раз (а "$" может быть и
+    # терминалом грамматики), поэтому ids дополняется концевыми маркерами; если их не
+    # хватило, разбор повторяется с вдвое большим запасом.
+    lines += [
+        "",
+        "def parse(tokens):",
+        '    """Разбор, эквивалентный LL1Parser.parse: список (нетерминал, правило) левого вывода"""',
+        "    ids = [_SYMBOL_IDS.get(token, _UNKNOWN) for token in tokens]",
+        "    padding = 2",
+        "    while True:",
+        "        ids.extend([0] * padding)",
+        "        output = []",
+        "        cursor = 0",
+        "        try:",
+    ]
+    lines += symbol_code(parser.start_symbol, 12)
+    lines += [
+        "            if ids[cursor] != 0:",
+        f"                raise _Unexpected(cursor, '$', {'$' in terminals})",
+        "            cursor += 1",
+        "            break",
+        "        except _Unexpected as e:",
+        "            token = tokens[e.cursor] if e.cursor < len(tokens) else '$'",
+        "            if e.terminal:",
+        '                raise SyntaxError(f"Unexpected token: {token}, expected: {e.symbol}") from None',
+        '            raise SyntaxError(f"Unexpected token: {token} at {e.symbol}") from None',
+        "        except IndexError:",
+        "            padding *= 2",
+        "        except RecursionError:",
+        "            return _parse_with_stack(tokens)",
+        "    if cursor != len(tokens) + 1:",
+        '        raise SyntaxError("Input not fully consumed")',
+        "    return output",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_language_descent(path: str, conflict_policy="dangling_else"):
+    """Записывает модуль рекурсивного спуска для LANGUAGE_GRAMMAR в path"""
+    source_hash = grammar_hash(LANGUAGE_GRAMMAR, conflict_policy)
+    write_module(path, generate_descent_source(load_language_parser(conflict_policy), source_hash))
+
+
+def load_language_descent(conflict_policy="dangling_else"):
+    """
+    Модуль рекурсивного спуска для LANGUAGE_GRAMMAR (tyap_descent.py рядом с tyap.py).
+    Если модуля нет или он построен для другой грамматики, модуль собирается в памяти;
+    файлы пакета не перезаписываются - это делает только python tyap.py --generate-tables.
+    """
+    import importlib
+    import types
+
+    source_hash = grammar_hash(LANGUAGE_GRAMMAR, conflict_policy)
+    try:
+        module = importlib.import_module(DESCENT_MODULE)
+        if getattr(module, "FORMAT", None) == DESCENT_FORMAT and module.GRAMMAR_HASH == source_hash:
+            return module
+    except ImportError:
+        pass
+
+    source = generate_descent_source(load_language_parser(conflict_policy), source_hash)
+    module = types.ModuleType(DESCENT_MODULE)
+    module.__file__ = f"<{DESCENT_MODULE}>"
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+
+# ---------- Пример грамматики и тест ----------
+if __name__ == '__main__':
+    import os
+    import sys
+
+    if sys.argv[1:] == ["--generate-tables"]:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), TABLES_MODULE + ".py")
+        generate_language_tables(path)
+        print(f"Таблицы записаны в {path}")
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), DESCENT_MODULE + ".py")
+        generate_language_descent(path)
+        print(f"Рекурсивный спуск записан в {path}")
+        sys.exit(0)
+
+    grammar = LANGUAGE_GRAMMAR
+
+    Grammar(grammar).print_grammar()
+    grammar222 = build_language_grammar(grammar)
     grammar222.print_grammar()
 
 
 
 
     parser = LL1Parser(grammar222.toDict())
+    parser.print_conflicts()
+    # разбор и восстановление ниже работают со сжатой таблицей
+    print("\n[RESULT]", parser.compress_table().format_stats())
 
     code = "program var a, b: %; begin a ass 1; end."
     lexer = LexerFA()
@@ -820,3 +3652,40 @@ if __name__ == '__main__':
             print(f"{lhs} -> {' '.join(rhs)}")
     except SyntaxError as e:
         print("\n[ERROR]", e)
+
+    # Восстановление после ошибок: все синтаксические ошибки за один проход
+    _, errors = parser.parse_with_recovery(lexer.get_token_stream(), lexer.get_token_positions())
+    print(f"\n[RESULT] Syntax errors: {len(errors)}")
+    for error in errors:
+        print(f"  {error.position}: {error.message}")
+
+    # LALR(1) работает с исходной грамматикой, без факторизации и устранения левой рекурсии
+    lalr_parser = LALR1Parser(grammar)
+    lalr_parser.print_conflicts()
+    try:
+        result = lalr_parser.parse(tokens)
+        print("\n[SUCCESS] LALR(1) reductions:")
+        for lhs, rhs in result:
+            print(f"{lhs} -> {' '.join(rhs) if rhs else 'ε'}")
+    except SyntaxError as e:
+        print("\n[ERROR]", e)
+
+    # CYK по нормальной форме Хомского: грамматика не LL(1) (S -> A b C, A -> B, B -> b)
+    grammar2 = {
+        "nonterminals": {"S", "A", "B", "C", "D"},
+        "terminals": {"a", "b", "c", "d"},
+        "start_symbol": "S",
+        "productions": {
+            "S": [["A", "b", "C"], ["D"]],
+            "A": [["B"], ["a"]],
+            "B": [["C"], ["b"]],
+            "C": [["c"]],
+            "D": [["d", "A"]]
+        }
+    }
+    cnf = Grammar(grammar2).to_cnf()
+    cnf.print_grammar()
+    recognizer = CYKRecognizer(cnf.toDict())
+    for sentence in (["a", "b", "c"], ["b", "b", "c"], ["d", "c"], ["a", "b"]):
+        verdict = "принадлежит" if recognizer.recognize(sentence) else "не принадлежит"
+        print(f"[CYK] {' '.join(sentence)}: {verdict} языку")
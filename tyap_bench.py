@@ -0,0 +1,240 @@
+# Замер скорости лексического анализа: конечный автомат (backend="fa")
+# против общего шаблона re (backend="regex") и массивов NumPy (backend="numpy"; без NumPy
+# совпадает с "fa"), один процесс против пула (tokenize_parallel), и синтаксического
+# анализа: LL1Parser.parse со стеком против сгенерированного рекурсивного спуска
+# (tyap_descent.py); распознавание CYK длинных цепочек неоднозначной грамматики выражений;
+# группировка программ, отличающихся пробелами, комментариями и именами, по отпечаткам
+#
+#   python tyap_bench.py [--repeat 200] [--rounds 5] [--workers N] [--sentences 2000] [--cyk-length 1000] \
+#       [--variants 5000] > bench_output.txt
+import argparse
+import contextlib
+import os
+import random
+import time
+from collections import deque
+
+from tyap import (CYKRecognizer, Grammar, KEYWORDS, LEXER_BACKENDS, LexerFA, group_by_fingerprint,
+                  load_language_descent, load_language_parser)
+
+# неоднозначная грамматика (не LL(1) и с левой рекурсией) для замера CYK
+EXPRESSION_GRAMMAR = {
+    "nonterminals": {"E"},
+    "terminals": {"+", "*", "(", ")", "x"},
+    "start_symbol": "E",
+    "productions": {"E": [["E", "+", "E"], ["E", "*", "E"], ["(", "E", ")"], ["x"]]},
+}
+
+
+def load_source(path: str, repeat: int) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read() * repeat
+
+
+def best_time(func, text, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_lexers(text: str, rounds: int):
+    lexers = {backend: LexerFA(verbose=False, backend=backend) for backend in LEXER_BACKENDS}
+    results = {backend: lexer.tokenize(text) for backend, lexer in lexers.items()}
+    reference = results["fa"]
+    for backend, result in results.items():
+        if (result.tokens, result.token_types, result.token_offsets) != \
+                (reference.tokens, reference.token_types, reference.token_offsets):
+            raise AssertionError(f"backend {backend}: token stream differs from fa")
+
+    timings = {backend: best_time(lexer.tokenize, text, rounds) for backend, lexer in lexers.items()}
+    print(f"Текст: {len(text)} символов, {len(reference.tokens)} лексем, лучший из {rounds} замеров")
+    for backend, seconds in timings.items():
+        rate = len(reference.tokens) / seconds / 1e6
+        print(f"  {backend:6} {seconds * 1000:9.2f} мс  {rate:6.2f} млн лексем/с  "
+              f"x{timings['fa'] / seconds:.2f}")
+    return timings
+
+
+def bench_parallel_lexer(text: str, rounds: int, workers: int = None):
+    """Один процесс против пула из workers процессов (по умолчанию - по числу ядер)"""
+    workers = workers or os.cpu_count()
+    lexer = LexerFA(verbose=False, backend="numpy")
+    chunk_size = len(text) // (4 * workers) + 1
+    reference = lexer.tokenize(text)
+    result = lexer.tokenize_parallel(text, workers, chunk_size)
+    if (result.tokens, result.token_values, result.token_offsets, result.constants) != \
+            (reference.tokens, reference.token_values, reference.token_offsets, reference.constants):
+        raise AssertionError("tokenize_parallel: token stream differs from tokenize")
+
+    timings = {"1": best_time(lexer.tokenize, text, rounds),
+               str(workers): best_time(lambda t: lexer.tokenize_parallel(t, workers, chunk_size), text, rounds)}
+    print(f"Текст: {len(text)} символов, {len(reference.tokens)} лексем, лучший из {rounds} замеров")
+    for name, seconds in timings.items():
+        print(f"  процессов: {name:3} {seconds * 1000:9.2f} мс  x{timings['1'] / seconds:.2f}")
+    return timings
+
+
+def sample_sentence(parser, rng: random.Random, limit: int):
+    """
+    Случайная цепочка терминалов, порождаемая по таблице: для нетерминала на вершине
+    стека выбирается терминал из его строки, затем правило из этой ячейки. После limit
+    терминалов предпочитаются ε-правила. None - если обход зашел в тупик.
+    """
+    stack = deque(["$", parser.start_symbol])
+    sentence = []
+    lookahead = None
+    for _ in range(50 * limit):
+        top = stack.pop()
+        if top == "$":
+            return sentence if lookahead in (None, "$") else None
+        if top in parser.terminals:
+            if lookahead not in (None, top):
+                return None
+            sentence.append(top)
+            lookahead = None
+            continue
+        row = parser.table.get(top, {})
+        if lookahead is None:
+            choices = list(row)
+            if len(sentence) > limit:
+                choices = [t for t in choices if all(s == 'ε' for s in row[t])] or choices
+            if not choices:
+                return None
+            lookahead = rng.choice(choices)
+        if lookahead not in row:
+            return None
+        stack.extend(s for s in reversed(row[lookahead]) if s != 'ε')
+    return None
+
+
+def outcome(parse, tokens):
+    """Вывод анализатора или текст синтаксической ошибки"""
+    try:
+        return parse(tokens)
+    except SyntaxError as e:
+        return str(e)
+
+
+def bench_parsers(count: int, rounds: int, seed: int = 1):
+    parser = load_language_parser()
+    descent = load_language_descent()
+    rng = random.Random(seed)
+    sentences = []
+    while len(sentences) < count:
+        sentence = sample_sentence(parser, rng, 400)
+        if sentence is None:
+            continue
+        try:
+            reference = parser.parse(sentence)
+        except SyntaxError:
+            continue
+        if descent.parse(sentence) != reference:
+            raise AssertionError(f"descent parse differs from LL1Parser.parse: {sentence}")
+        sentences.append(sentence)
+
+    # вложенность глубже предела рекурсии: спуск переходит на явный стек
+    for depth in (10, 5000):
+        for body in ("(" * depth + "1" + ")" * depth, "(" * depth + "1" + ")" * (depth - 1)):
+            deep = LexerFA(verbose=False).tokenize(f"program var a: %; begin a ass {body}; end.").tokens
+            if outcome(descent.parse, deep) != outcome(parser.parse, deep):
+                raise AssertionError(f"descent parse differs from LL1Parser.parse at nesting depth {depth}")
+
+    def run(parse):
+        return lambda batch: [parse(sentence) for sentence in batch]
+
+    timings = {name: best_time(run(parse), sentences, rounds)
+               for name, parse in (("ll1", parser.parse), ("descent", descent.parse))}
+    total = sum(map(len, sentences))
+    print(f"Цепочки: {len(sentences)}, {total} лексем, лучший из {rounds} замеров")
+    for name, seconds in timings.items():
+        rate = total / seconds / 1e6
+        print(f"  {name:8} {seconds * 1000:9.2f} мс  {rate:6.2f} млн лексем/с  "
+              f"x{timings['ll1'] / seconds:.2f}")
+    return timings
+
+
+def bench_cyk(length: int, rounds: int, seed: int = 1):
+    with contextlib.redirect_stdout(None):
+        cnf = Grammar(EXPRESSION_GRAMMAR).to_cnf()
+    recognizer = CYKRecognizer(cnf.toDict())
+    rng = random.Random(seed)
+    sentence = ["x"]
+    while len(sentence) < length:
+        sentence = sentence + [rng.choice("+*"), "x"] if rng.random() < 0.8 else ["(", *sentence, ")"]
+    if not recognizer.recognize(sentence) or recognizer.recognize(sentence + ["+"]):
+        raise AssertionError("CYK result differs from the expression grammar")
+    seconds = best_time(recognizer.recognize, sentence, rounds)
+    print(f"Цепочка: {len(sentence)} лексем, правил в НФХ: "
+          f"{sum(map(len, cnf.productions.values()))}, лучший из {rounds} замеров")
+    print(f"  cyk      {seconds * 1000:9.2f} мс")
+    return seconds
+
+
+def program_variant(program: str, rng: random.Random) -> str:
+    """Та же программа с другими именами, пробелами и комментариями"""
+    import re
+    names = {}
+
+    def rename(m):
+        word = m.group()
+        if word in KEYWORDS:
+            return word
+        if word not in names:
+            names[word] = f"v{len(names)}_{rng.randrange(10 ** 6)}"
+        return names[word]
+
+    program = re.sub(r"[^\W\d_]\w*", rename, program)
+    return re.sub(r"\s+", lambda m: rng.choice([" ", "\n  ", " {комментарий} ", m.group()]), program)
+
+
+def bench_fingerprints(source: str, count: int, rounds: int, seed: int = 1):
+    programs = ["program" + p for p in source.split("program")[1:]]
+    rng = random.Random(seed)
+    picks = [rng.randrange(len(programs)) for _ in range(count)]
+    texts = [program_variant(programs[i], rng) for i in picks]
+    lexer = LexerFA(verbose=False)
+    groups = group_by_fingerprint(texts, lexer)
+    expected = len(group_by_fingerprint([programs[i] for i in set(picks)], lexer))
+    if len(groups) != expected:
+        raise AssertionError(f"fingerprints: {len(groups)} groups, expected {expected}")
+
+    seconds = best_time(lambda batch: group_by_fingerprint(batch, lexer), texts, rounds)
+    print(f"Программ: {len(texts)}, групп: {len(groups)}, лучший из {rounds} замеров")
+    print(f"  отпечатки {seconds * 1000:9.2f} мс  {len(texts) / seconds:9.0f} программ/с  "
+          f"анализ не нужен для {(1 - len(groups) / len(texts)) * 100:.1f}%")
+    return seconds
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Сравнение скорости бэкендов лексера")
+    arg_parser.add_argument("--source", default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                             "test_programs.tyap"))
+    arg_parser.add_argument("--repeat", type=int, default=200, help="сколько раз повторить исходный текст")
+    arg_parser.add_argument("--rounds", type=int, default=5, help="число замеров")
+    arg_parser.add_argument("--workers", type=int, default=None,
+                            help="число процессов параллельного лексического анализа")
+    arg_parser.add_argument("--sentences", type=int, default=2000,
+                            help="число случайных цепочек для синтаксического анализа")
+    arg_parser.add_argument("--cyk-length", type=int, default=1000, help="длина цепочки для CYK")
+    arg_parser.add_argument("--variants", type=int, default=5000,
+                            help="число измененных копий программ для группировки по отпечаткам")
+    args = arg_parser.parse_args(argv)
+
+    print("=== Лексический анализ ===")
+    text = load_source(args.source, args.repeat)
+    bench_lexers(text, args.rounds)
+    print("=== Параллельный лексический анализ ===")
+    bench_parallel_lexer(text, args.rounds, args.workers)
+    print("=== Синтаксический анализ ===")
+    bench_parsers(args.sentences, args.rounds)
+    print("=== CYK ===")
+    bench_cyk(args.cyk_length, args.rounds)
+    print("=== Отпечатки программ ===")
+    bench_fingerprints(load_source(args.source, 1), args.variants, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
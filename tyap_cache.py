@@ -0,0 +1,174 @@
+# Кэш результатов лексического и синтаксического анализа программ на диске
+#
+# Ключ - хеш текста программы вместе с пространством имен (анализатор и контрольная
+# сумма грамматики вместе с политикой разрешения конфликтов, форматом таблиц и кодом
+# преобразований, grammar_hash), значение - LexResult и вывод анализатора (или текст
+# ошибки разбора), сериализованные pickle. Записи хранятся в SQLite: файл можно
+# использовать из нескольких процессов сразу (процессы пула tyap_server).
+#
+# Для запросов только лексического анализа разбор не выполняется: запись хранит один
+# LexResult, а разбор добавляется в нее при первом запросе разбора той же программы.
+#
+# Вытеснение - по давности использования (LRU): когда общий размер значений превышает
+# max_bytes, удаляются записи, к которым дольше всего не обращались. Время обращения
+# при попадании обновляется не сразу, а пачкой (при записи, при накоплении TOUCH_BATCH
+# обращений и при закрытии): иначе каждое попадание было бы транзакцией записи.
+import contextlib
+import hashlib
+import pickle
+import sqlite3
+import time
+from collections import namedtuple
+
+from tyap import LANGUAGE_GRAMMAR, grammar_hash
+
+# версия формата значений: при изменении LexResult или вывода анализатора старые записи
+# становятся недоступны (ключ включает CACHE_FORMAT)
+CACHE_FORMAT = 2
+
+TOUCH_BATCH = 64
+
+# error - текст SyntaxError или None; parse и error оба None - разбор еще не выполнялся
+FrontendResult = namedtuple("FrontendResult", ["lexed", "parse", "error"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key   TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size  INTEGER NOT NULL,
+    used  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL);
+INSERT OR IGNORE INTO totals VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+    BEGIN UPDATE totals SET size = size + NEW.size; END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+    BEGIN UPDATE totals SET size = size - OLD.size; END;
+"""
+
+
+def frontend_namespace(engine: str, conflict_policy: str, grammar=LANGUAGE_GRAMMAR) -> str:
+    """
+    Пространство имен ключей: результаты разных анализаторов, политик разрешения
+    конфликтов и грамматик (а также таблиц, построенных другим кодом) не смешиваются
+    """
+    return f"{CACHE_FORMAT}-{engine}-{grammar_hash(grammar, conflict_policy)}"
+
+
+class FrontendCache:
+    """
+    Кэш на диске: get/put по тексту программы, analyze - разбор с кэшированием.
+    Соединение SQLite нельзя передавать между процессами: каждый процесс открывает кэш сам.
+    """
+
+    def __init__(self, path: str, namespace: str, max_bytes: int = 256 * 2 ** 20):
+        self.path = path
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.touched = {}    # ключ -> время обращения, еще не записанное в базу
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def key(self, text: str) -> str:
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=20).hexdigest()
+        return f"{self.namespace}:{digest}"
+
+    def get(self, text: str):
+        """FrontendResult из кэша или None"""
+        key = self.key(text)
+        row = self.db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.touched[key] = time.time()
+        if len(self.touched) >= TOUCH_BATCH:
+            self.flush()
+        return pickle.loads(row[0])
+
+    def put(self, text: str, result: FrontendResult):
+        value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(value) > self.max_bytes:
+            return
+        key = self.key(text)
+        with self.transaction():
+            self.write_touched()
+            # не INSERT OR REPLACE: при замене триггер удаления не срабатывает
+            self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.db.execute("INSERT INTO entries VALUES (?, ?, ?, ?)", (key, value, len(value), time.time()))
+            self.evict()
+
+    def analyze(self, text: str, lexer, parser=None) -> FrontendResult:
+        """
+        Лексический и синтаксический анализ text; при попадании в кэш анализ не выполняется.
+        parser=None - только лексический анализ (parse и error в результате могут быть None).
+        """
+        result = self.get(text)
+        if result is None:
+            result = FrontendResult(lexer.tokenize(text), None, None)
+        elif parser is None or result.parse is not None or result.error is not None:
+            return result
+        if parser is not None:
+            try:
+                result = result._replace(parse=parser.parse(result.lexed.tokens))
+            except SyntaxError as e:
+                result = result._replace(error=str(e))
+        self.put(text, result)
+        return result
+
+    def evict(self):
+        """Удаляет самые давно использованные записи, пока размер не уложится в max_bytes"""
+        while self.size() > self.max_bytes:
+            self.db.execute("DELETE FROM entries WHERE key IN "
+                            "(SELECT key FROM entries ORDER BY used LIMIT 16)")
+
+    def size(self) -> int:
+        """Общий размер значений в байтах"""
+        return self.db.execute("SELECT size FROM totals").fetchone()[0]
+
+    def __len__(self):
+        return self.db.execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT: запись и вытеснение не перемежаются с другими процессами"""
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        self.db.execute("COMMIT")
+
+    def write_touched(self):
+        if self.touched:
+            self.db.executemany("UPDATE entries SET used = max(used, ?) WHERE key = ?",
+                                [(used, key) for key, used in self.touched.items()])
+            self.touched.clear()
+
+    def flush(self):
+        """Записывает накопленные времена обращений"""
+        if self.touched:
+            with self.transaction():
+                self.write_touched()
+
+    def format_stats(self) -> str:
+        requests = self.hits + self.misses
+        rate = self.hits / requests * 100 if requests else 0.0
+        return (f"Кэш {self.path}: записей {len(self)}, {self.size()} байт из {self.max_bytes}, "
+                f"попаданий {self.hits} из {requests} ({rate:.1f}%)")
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,1535 @@
+# Сгенерировано: python tyap.py --generate-tables. Не редактировать вручную.
+# Если GRAMMAR_HASH устарел, load_language_descent() собирает модуль в памяти.
+
+FORMAT = 2
+GRAMMAR_HASH = '35c9cfcf'
+
+PRODUCTIONS = {'программа': [['program', 'var', 'идентификатор', 'описание_хвост', ';', 'тело', '.'],
+               ['{', 'текст_комментария', '}', 'program', 'var', 'идентификатор', 'описание_хвост', ';', 'тело', '.']],
+ 'описание_хвост': [[',', 'идентификатор', 'описание_хвост'], [':', 'тип']],
+ 'тип': [['%'], ['!'], ['$']],
+ 'тело': [['begin', 'оператор_список', 'end'], ['{', 'текст_комментария', '}', 'begin', 'оператор_список', 'end']],
+ 'оператор_список': [['оператор', ';', 'оператор_список'], []],
+ 'оператор': [['идентификатор', 'ass', 'выражение'],
+              ['while', 'выражение', 'do', 'оператор'],
+              ['for', 'идентификатор', 'ass', 'выражение', 'to', 'выражение', 'do', 'оператор'],
+              ['begin', 'оператор_список', 'end'],
+              ['read', '(', 'идентификатор', 'ввода_хвост', ')'],
+              ['write', '(', 'выражение', 'вывода_хвост', ')'],
+              ['{', 'текст_комментария', '}'],
+              ['if', 'выражение', 'then', 'оператор', 'оператор_fact0']],
+ 'ввода_хвост': [[',', 'идентификатор', 'ввода_хвост'], []],
+ 'вывода_хвост': [[',', 'выражение', 'вывода_хвост'], []],
+ 'выражение': [['not', 'множитель'], ['множитель', 'произведение_хвост', 'сумма_хвост', 'выражение_fact0']],
+ 'знак_сравнения': [['='], ['<'], ['>'], ['<='], ['>=']],
+ 'сумма_хвост': [['операция_сложения', 'множитель', 'произведение_хвост', 'сумма_хвост'], []],
+ 'операция_сложения': [['+'], ['-'], ['or']],
+ 'произведение_хвост': [['операция_умножения', 'множитель', 'произведение_хвост'], []],
+ 'операция_умножения': [['*'], ['/'], ['and']],
+ 'множитель': [['идентификатор'], ['число'], ['(', 'выражение', ')'], ['true'], ['false']],
+ 'текст_комментария': [['символ', 'текст_комментария'], []],
+ 'символ': [['a'],
+            ['b'],
+            ['c'],
+            ['d'],
+            ['e'],
+            ['f'],
+            ['g'],
+            ['h'],
+            ['i'],
+            ['j'],
+            ['k'],
+            ['l'],
+            ['m'],
+            ['n'],
+            ['o'],
+            ['p'],
+            ['q'],
+            ['r'],
+            ['s'],
+            ['t'],
+            ['u'],
+            ['v'],
+            ['w'],
+            ['x'],
+            ['y'],
+            ['z'],
+            ['A'],
+            ['B'],
+            ['C'],
+            ['D'],
+            ['E'],
+            ['F'],
+            ['G'],
+            ['H'],
+            ['I'],
+            ['J'],
+            ['K'],
+            ['L'],
+            ['M'],
+            ['N'],
+            ['O'],
+            ['P'],
+            ['Q'],
+            ['R'],
+            ['S'],
+            ['T'],
+            ['U'],
+            ['V'],
+            ['W'],
+            ['X'],
+            ['Y'],
+            ['Z'],
+            ['0'],
+            ['1'],
+            ['2'],
+            ['3'],
+            ['4'],
+            ['5'],
+            ['6'],
+            ['7'],
+            ['8'],
+            ['9'],
+            ['_'],
+            [' '],
+            ['\t'],
+            ['\n']],
+ 'оператор_fact0': [['else', 'оператор'], []],
+ 'выражение_fact0': [['знак_сравнения', 'множитель', 'произведение_хвост', 'сумма_хвост'], []]}
+
+_SYMBOL_IDS = {'$': 0,
+ 'программа': 1,
+ 'описание_хвост': 2,
+ 'тип': 3,
+ 'тело': 4,
+ 'оператор_список': 5,
+ 'оператор': 6,
+ 'ввода_хвост': 7,
+ 'вывода_хвост': 8,
+ 'выражение': 9,
+ 'знак_сравнения': 10,
+ 'сумма_хвост': 11,
+ 'операция_сложения': 12,
+ 'произведение_хвост': 13,
+ 'операция_умножения': 14,
+ 'множитель': 15,
+ 'текст_комментария': 16,
+ 'символ': 17,
+ 'оператор_fact0': 18,
+ 'выражение_fact0': 19,
+ 'program': 20,
+ 'var': 21,
+ 'идентификатор': 22,
+ ';': 23,
+ '.': 24,
+ '{': 25,
+ '}': 26,
+ ',': 27,
+ ':': 28,
+ '%': 29,
+ '!': 30,
+ 'begin': 31,
+ 'end': 32,
+ 'ass': 33,
+ 'while': 34,
+ 'do': 35,
+ 'for': 36,
+ 'to': 37,
+ 'read': 38,
+ '(': 39,
+ ')': 40,
+ 'write': 41,
+ 'if': 42,
+ 'then': 43,
+ 'not': 44,
+ '=': 45,
+ '<': 46,
+ '>': 47,
+ '<=': 48,
+ '>=': 49,
+ '+': 50,
+ '-': 51,
+ 'or': 52,
+ '*': 53,
+ '/': 54,
+ 'and': 55,
+ 'число': 56,
+ 'true': 57,
+ 'false': 58,
+ 'a': 59,
+ 'b': 60,
+ 'c': 61,
+ 'd': 62,
+ 'e': 63,
+ 'f': 64,
+ 'g': 65,
+ 'h': 66,
+ 'i': 67,
+ 'j': 68,
+ 'k': 69,
+ 'l': 70,
+ 'm': 71,
+ 'n': 72,
+ 'o': 73,
+ 'p': 74,
+ 'q': 75,
+ 'r': 76,
+ 's': 77,
+ 't': 78,
+ 'u': 79,
+ 'v': 80,
+ 'w': 81,
+ 'x': 82,
+ 'y': 83,
+ 'z': 84,
+ 'A': 85,
+ 'B': 86,
+ 'C': 87,
+ 'D': 88,
+ 'E': 89,
+ 'F': 90,
+ 'G': 91,
+ 'H': 92,
+ 'I': 93,
+ 'J': 94,
+ 'K': 95,
+ 'L': 96,
+ 'M': 97,
+ 'N': 98,
+ 'O': 99,
+ 'P': 100,
+ 'Q': 101,
+ 'R': 102,
+ 'S': 103,
+ 'T': 104,
+ 'U': 105,
+ 'V': 106,
+ 'W': 107,
+ 'X': 108,
+ 'Y': 109,
+ 'Z': 110,
+ '0': 111,
+ '1': 112,
+ '2': 113,
+ '3': 114,
+ '4': 115,
+ '5': 116,
+ '6': 117,
+ '7': 118,
+ '8': 119,
+ '9': 120,
+ '_': 121,
+ ' ': 122,
+ '\t': 123,
+ '\n': 124,
+ 'else': 125}
+_UNKNOWN = 126
+
+
+class _Unexpected(Exception):
+    def __init__(self, cursor, symbol, terminal):
+        self.cursor = cursor
+        self.symbol = symbol
+        self.terminal = terminal
+
+
+_P_0_0 = PRODUCTIONS['программа'][0]
+_P_0_1 = PRODUCTIONS['программа'][1]
+_ROW_0 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_0(ids, cursor, output):
+    # программа
+    while True:
+        choice = _ROW_0[ids[cursor]]
+        if choice == 0:
+            output.append(('программа', _P_0_0))
+            if ids[cursor] != 20:
+                raise _Unexpected(cursor, 'program', True)
+            cursor += 1
+            if ids[cursor] != 21:
+                raise _Unexpected(cursor, 'var', True)
+            cursor += 1
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            if ids[cursor] == 2:
+                cursor += 1
+            else:
+                cursor = _parse_1(ids, cursor, output)
+            if ids[cursor] != 23:
+                raise _Unexpected(cursor, ';', True)
+            cursor += 1
+            if ids[cursor] == 4:
+                cursor += 1
+            else:
+                cursor = _parse_3(ids, cursor, output)
+            if ids[cursor] != 24:
+                raise _Unexpected(cursor, '.', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('программа', _P_0_1))
+            if ids[cursor] != 25:
+                raise _Unexpected(cursor, '{', True)
+            cursor += 1
+            if ids[cursor] == 16:
+                cursor += 1
+            else:
+                cursor = _parse_15(ids, cursor, output)
+            if ids[cursor] != 26:
+                raise _Unexpected(cursor, '}', True)
+            cursor += 1
+            if ids[cursor] != 20:
+                raise _Unexpected(cursor, 'program', True)
+            cursor += 1
+            if ids[cursor] != 21:
+                raise _Unexpected(cursor, 'var', True)
+            cursor += 1
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            if ids[cursor] == 2:
+                cursor += 1
+            else:
+                cursor = _parse_1(ids, cursor, output)
+            if ids[cursor] != 23:
+                raise _Unexpected(cursor, ';', True)
+            cursor += 1
+            if ids[cursor] == 4:
+                cursor += 1
+            else:
+                cursor = _parse_3(ids, cursor, output)
+            if ids[cursor] != 24:
+                raise _Unexpected(cursor, '.', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'программа', False)
+
+
+_P_1_0 = PRODUCTIONS['описание_хвост'][0]
+_P_1_1 = PRODUCTIONS['описание_хвост'][1]
+_ROW_1 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_1(ids, cursor, output):
+    # описание_хвост
+    while True:
+        choice = _ROW_1[ids[cursor]]
+        if choice == 0:
+            output.append(('описание_хвост', _P_1_0))
+            if ids[cursor] != 27:
+                raise _Unexpected(cursor, ',', True)
+            cursor += 1
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            if ids[cursor] == 2:
+                return cursor + 1
+            continue
+        if choice == 1:
+            output.append(('описание_хвост', _P_1_1))
+            if ids[cursor] != 28:
+                raise _Unexpected(cursor, ':', True)
+            cursor += 1
+            if ids[cursor] == 3:
+                cursor += 1
+            else:
+                cursor = _parse_2(ids, cursor, output)
+            return cursor
+        raise _Unexpected(cursor, 'описание_хвост', False)
+
+
+_P_2_0 = PRODUCTIONS['тип'][0]
+_P_2_1 = PRODUCTIONS['тип'][1]
+_P_2_2 = PRODUCTIONS['тип'][2]
+_ROW_2 = (2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_2(ids, cursor, output):
+    # тип
+    while True:
+        choice = _ROW_2[ids[cursor]]
+        if choice == 0:
+            output.append(('тип', _P_2_0))
+            if ids[cursor] != 29:
+                raise _Unexpected(cursor, '%', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('тип', _P_2_1))
+            if ids[cursor] != 30:
+                raise _Unexpected(cursor, '!', True)
+            cursor += 1
+            return cursor
+        if choice == 2:
+            output.append(('тип', _P_2_2))
+            if ids[cursor] != 0:
+                raise _Unexpected(cursor, '$', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'тип', False)
+
+
+_P_3_0 = PRODUCTIONS['тело'][0]
+_P_3_1 = PRODUCTIONS['тело'][1]
+_ROW_3 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_3(ids, cursor, output):
+    # тело
+    while True:
+        choice = _ROW_3[ids[cursor]]
+        if choice == 0:
+            output.append(('тело', _P_3_0))
+            if ids[cursor] != 31:
+                raise _Unexpected(cursor, 'begin', True)
+            cursor += 1
+            if ids[cursor] == 5:
+                cursor += 1
+            else:
+                cursor = _parse_4(ids, cursor, output)
+            if ids[cursor] != 32:
+                raise _Unexpected(cursor, 'end', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('тело', _P_3_1))
+            if ids[cursor] != 25:
+                raise _Unexpected(cursor, '{', True)
+            cursor += 1
+            if ids[cursor] == 16:
+                cursor += 1
+            else:
+                cursor = _parse_15(ids, cursor, output)
+            if ids[cursor] != 26:
+                raise _Unexpected(cursor, '}', True)
+            cursor += 1
+            if ids[cursor] != 31:
+                raise _Unexpected(cursor, 'begin', True)
+            cursor += 1
+            if ids[cursor] == 5:
+                cursor += 1
+            else:
+                cursor = _parse_4(ids, cursor, output)
+            if ids[cursor] != 32:
+                raise _Unexpected(cursor, 'end', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'тело', False)
+
+
+_P_4_0 = PRODUCTIONS['оператор_список'][0]
+_P_4_1 = PRODUCTIONS['оператор_список'][1]
+_ROW_4 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, 0, -1, -1, -1, -1, -1, 0, 1, -1, 0, -1, 0, -1, 0, -1, -1, 0, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_4(ids, cursor, output):
+    # оператор_список
+    while True:
+        choice = _ROW_4[ids[cursor]]
+        if choice == 0:
+            output.append(('оператор_список', _P_4_0))
+            if ids[cursor] == 6:
+                cursor += 1
+            else:
+                cursor = _parse_5(ids, cursor, output)
+            if ids[cursor] != 23:
+                raise _Unexpected(cursor, ';', True)
+            cursor += 1
+            if ids[cursor] == 5:
+                return cursor + 1
+            continue
+        if choice == 1:
+            output.append(('оператор_список', _P_4_1))
+            return cursor
+        raise _Unexpected(cursor, 'оператор_список', False)
+
+
+_P_5_0 = PRODUCTIONS['оператор'][0]
+_P_5_1 = PRODUCTIONS['оператор'][1]
+_P_5_2 = PRODUCTIONS['оператор'][2]
+_P_5_3 = PRODUCTIONS['оператор'][3]
+_P_5_4 = PRODUCTIONS['оператор'][4]
+_P_5_5 = PRODUCTIONS['оператор'][5]
+_P_5_6 = PRODUCTIONS['оператор'][6]
+_P_5_7 = PRODUCTIONS['оператор'][7]
+_ROW_5 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, 6, -1, -1, -1, -1, -1, 3, -1, -1, 1, -1, 2, -1, 4, -1, -1, 5, 7, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_5(ids, cursor, output):
+    # оператор
+    while True:
+        choice = _ROW_5[ids[cursor]]
+        if choice == 0:
+            output.append(('оператор', _P_5_0))
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            if ids[cursor] != 33:
+                raise _Unexpected(cursor, 'ass', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            return cursor
+        if choice == 1:
+            output.append(('оператор', _P_5_1))
+            if ids[cursor] != 34:
+                raise _Unexpected(cursor, 'while', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            if ids[cursor] != 35:
+                raise _Unexpected(cursor, 'do', True)
+            cursor += 1
+            if ids[cursor] == 6:
+                return cursor + 1
+            continue
+        if choice == 2:
+            output.append(('оператор', _P_5_2))
+            if ids[cursor] != 36:
+                raise _Unexpected(cursor, 'for', True)
+            cursor += 1
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            if ids[cursor] != 33:
+                raise _Unexpected(cursor, 'ass', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            if ids[cursor] != 37:
+                raise _Unexpected(cursor, 'to', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            if ids[cursor] != 35:
+                raise _Unexpected(cursor, 'do', True)
+            cursor += 1
+            if ids[cursor] == 6:
+                return cursor + 1
+            continue
+        if choice == 3:
+            output.append(('оператор', _P_5_3))
+            if ids[cursor] != 31:
+                raise _Unexpected(cursor, 'begin', True)
+            cursor += 1
+            if ids[cursor] == 5:
+                cursor += 1
+            else:
+                cursor = _parse_4(ids, cursor, output)
+            if ids[cursor] != 32:
+                raise _Unexpected(cursor, 'end', True)
+            cursor += 1
+            return cursor
+        if choice == 4:
+            output.append(('оператор', _P_5_4))
+            if ids[cursor] != 38:
+                raise _Unexpected(cursor, 'read', True)
+            cursor += 1
+            if ids[cursor] != 39:
+                raise _Unexpected(cursor, '(', True)
+            cursor += 1
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            if ids[cursor] == 7:
+                cursor += 1
+            else:
+                cursor = _parse_6(ids, cursor, output)
+            if ids[cursor] != 40:
+                raise _Unexpected(cursor, ')', True)
+            cursor += 1
+            return cursor
+        if choice == 5:
+            output.append(('оператор', _P_5_5))
+            if ids[cursor] != 41:
+                raise _Unexpected(cursor, 'write', True)
+            cursor += 1
+            if ids[cursor] != 39:
+                raise _Unexpected(cursor, '(', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            if ids[cursor] == 8:
+                cursor += 1
+            else:
+                cursor = _parse_7(ids, cursor, output)
+            if ids[cursor] != 40:
+                raise _Unexpected(cursor, ')', True)
+            cursor += 1
+            return cursor
+        if choice == 6:
+            output.append(('оператор', _P_5_6))
+            if ids[cursor] != 25:
+                raise _Unexpected(cursor, '{', True)
+            cursor += 1
+            if ids[cursor] == 16:
+                cursor += 1
+            else:
+                cursor = _parse_15(ids, cursor, output)
+            if ids[cursor] != 26:
+                raise _Unexpected(cursor, '}', True)
+            cursor += 1
+            return cursor
+        if choice == 7:
+            output.append(('оператор', _P_5_7))
+            if ids[cursor] != 42:
+                raise _Unexpected(cursor, 'if', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            if ids[cursor] != 43:
+                raise _Unexpected(cursor, 'then', True)
+            cursor += 1
+            if ids[cursor] == 6:
+                cursor += 1
+            else:
+                cursor = _parse_5(ids, cursor, output)
+            if ids[cursor] == 18:
+                cursor += 1
+            else:
+                cursor = _parse_17(ids, cursor, output)
+            return cursor
+        raise _Unexpected(cursor, 'оператор', False)
+
+
+_P_6_0 = PRODUCTIONS['ввода_хвост'][0]
+_P_6_1 = PRODUCTIONS['ввода_хвост'][1]
+_ROW_6 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_6(ids, cursor, output):
+    # ввода_хвост
+    while True:
+        choice = _ROW_6[ids[cursor]]
+        if choice == 0:
+            output.append(('ввода_хвост', _P_6_0))
+            if ids[cursor] != 27:
+                raise _Unexpected(cursor, ',', True)
+            cursor += 1
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            if ids[cursor] == 7:
+                return cursor + 1
+            continue
+        if choice == 1:
+            output.append(('ввода_хвост', _P_6_1))
+            return cursor
+        raise _Unexpected(cursor, 'ввода_хвост', False)
+
+
+_P_7_0 = PRODUCTIONS['вывода_хвост'][0]
+_P_7_1 = PRODUCTIONS['вывода_хвост'][1]
+_ROW_7 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_7(ids, cursor, output):
+    # вывода_хвост
+    while True:
+        choice = _ROW_7[ids[cursor]]
+        if choice == 0:
+            output.append(('вывода_хвост', _P_7_0))
+            if ids[cursor] != 27:
+                raise _Unexpected(cursor, ',', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            if ids[cursor] == 8:
+                return cursor + 1
+            continue
+        if choice == 1:
+            output.append(('вывода_хвост', _P_7_1))
+            return cursor
+        raise _Unexpected(cursor, 'вывода_хвост', False)
+
+
+_P_8_0 = PRODUCTIONS['выражение'][0]
+_P_8_1 = PRODUCTIONS['выражение'][1]
+_ROW_8 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, 1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_8(ids, cursor, output):
+    # выражение
+    while True:
+        choice = _ROW_8[ids[cursor]]
+        if choice == 0:
+            output.append(('выражение', _P_8_0))
+            if ids[cursor] != 44:
+                raise _Unexpected(cursor, 'not', True)
+            cursor += 1
+            if ids[cursor] == 15:
+                cursor += 1
+            else:
+                cursor = _parse_14(ids, cursor, output)
+            return cursor
+        if choice == 1:
+            output.append(('выражение', _P_8_1))
+            if ids[cursor] == 15:
+                cursor += 1
+            else:
+                cursor = _parse_14(ids, cursor, output)
+            if ids[cursor] == 13:
+                cursor += 1
+            else:
+                cursor = _parse_12(ids, cursor, output)
+            if ids[cursor] == 11:
+                cursor += 1
+            else:
+                cursor = _parse_10(ids, cursor, output)
+            if ids[cursor] == 19:
+                cursor += 1
+            else:
+                cursor = _parse_18(ids, cursor, output)
+            return cursor
+        raise _Unexpected(cursor, 'выражение', False)
+
+
+_P_9_0 = PRODUCTIONS['знак_сравнения'][0]
+_P_9_1 = PRODUCTIONS['знак_сравнения'][1]
+_P_9_2 = PRODUCTIONS['знак_сравнения'][2]
+_P_9_3 = PRODUCTIONS['знак_сравнения'][3]
+_P_9_4 = PRODUCTIONS['знак_сравнения'][4]
+_ROW_9 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 1, 2, 3, 4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_9(ids, cursor, output):
+    # знак_сравнения
+    while True:
+        choice = _ROW_9[ids[cursor]]
+        if choice == 0:
+            output.append(('знак_сравнения', _P_9_0))
+            if ids[cursor] != 45:
+                raise _Unexpected(cursor, '=', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('знак_сравнения', _P_9_1))
+            if ids[cursor] != 46:
+                raise _Unexpected(cursor, '<', True)
+            cursor += 1
+            return cursor
+        if choice == 2:
+            output.append(('знак_сравнения', _P_9_2))
+            if ids[cursor] != 47:
+                raise _Unexpected(cursor, '>', True)
+            cursor += 1
+            return cursor
+        if choice == 3:
+            output.append(('знак_сравнения', _P_9_3))
+            if ids[cursor] != 48:
+                raise _Unexpected(cursor, '<=', True)
+            cursor += 1
+            return cursor
+        if choice == 4:
+            output.append(('знак_сравнения', _P_9_4))
+            if ids[cursor] != 49:
+                raise _Unexpected(cursor, '>=', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'знак_сравнения', False)
+
+
+_P_10_0 = PRODUCTIONS['сумма_хвост'][0]
+_P_10_1 = PRODUCTIONS['сумма_хвост'][1]
+_ROW_10 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, 1, -1, 1, -1, -1, 1, -1, -1, 1, -1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1)
+
+
+def _parse_10(ids, cursor, output):
+    # сумма_хвост
+    while True:
+        choice = _ROW_10[ids[cursor]]
+        if choice == 0:
+            output.append(('сумма_хвост', _P_10_0))
+            if ids[cursor] == 12:
+                cursor += 1
+            else:
+                cursor = _parse_11(ids, cursor, output)
+            if ids[cursor] == 15:
+                cursor += 1
+            else:
+                cursor = _parse_14(ids, cursor, output)
+            if ids[cursor] == 13:
+                cursor += 1
+            else:
+                cursor = _parse_12(ids, cursor, output)
+            if ids[cursor] == 11:
+                return cursor + 1
+            continue
+        if choice == 1:
+            output.append(('сумма_хвост', _P_10_1))
+            return cursor
+        raise _Unexpected(cursor, 'сумма_хвост', False)
+
+
+_P_11_0 = PRODUCTIONS['операция_сложения'][0]
+_P_11_1 = PRODUCTIONS['операция_сложения'][1]
+_P_11_2 = PRODUCTIONS['операция_сложения'][2]
+_ROW_11 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 1, 2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_11(ids, cursor, output):
+    # операция_сложения
+    while True:
+        choice = _ROW_11[ids[cursor]]
+        if choice == 0:
+            output.append(('операция_сложения', _P_11_0))
+            if ids[cursor] != 50:
+                raise _Unexpected(cursor, '+', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('операция_сложения', _P_11_1))
+            if ids[cursor] != 51:
+                raise _Unexpected(cursor, '-', True)
+            cursor += 1
+            return cursor
+        if choice == 2:
+            output.append(('операция_сложения', _P_11_2))
+            if ids[cursor] != 52:
+                raise _Unexpected(cursor, 'or', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'операция_сложения', False)
+
+
+_P_12_0 = PRODUCTIONS['произведение_хвост'][0]
+_P_12_1 = PRODUCTIONS['произведение_хвост'][1]
+_ROW_12 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, 1, -1, 1, -1, -1, 1, -1, -1, 1, -1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1)
+
+
+def _parse_12(ids, cursor, output):
+    # произведение_хвост
+    while True:
+        choice = _ROW_12[ids[cursor]]
+        if choice == 0:
+            output.append(('произведение_хвост', _P_12_0))
+            if ids[cursor] == 14:
+                cursor += 1
+            else:
+                cursor = _parse_13(ids, cursor, output)
+            if ids[cursor] == 15:
+                cursor += 1
+            else:
+                cursor = _parse_14(ids, cursor, output)
+            if ids[cursor] == 13:
+                return cursor + 1
+            continue
+        if choice == 1:
+            output.append(('произведение_хвост', _P_12_1))
+            return cursor
+        raise _Unexpected(cursor, 'произведение_хвост', False)
+
+
+_P_13_0 = PRODUCTIONS['операция_умножения'][0]
+_P_13_1 = PRODUCTIONS['операция_умножения'][1]
+_P_13_2 = PRODUCTIONS['операция_умножения'][2]
+_ROW_13 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 1, 2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_13(ids, cursor, output):
+    # операция_умножения
+    while True:
+        choice = _ROW_13[ids[cursor]]
+        if choice == 0:
+            output.append(('операция_умножения', _P_13_0))
+            if ids[cursor] != 53:
+                raise _Unexpected(cursor, '*', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('операция_умножения', _P_13_1))
+            if ids[cursor] != 54:
+                raise _Unexpected(cursor, '/', True)
+            cursor += 1
+            return cursor
+        if choice == 2:
+            output.append(('операция_умножения', _P_13_2))
+            if ids[cursor] != 55:
+                raise _Unexpected(cursor, 'and', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'операция_умножения', False)
+
+
+_P_14_0 = PRODUCTIONS['множитель'][0]
+_P_14_1 = PRODUCTIONS['множитель'][1]
+_P_14_2 = PRODUCTIONS['множитель'][2]
+_P_14_3 = PRODUCTIONS['множитель'][3]
+_P_14_4 = PRODUCTIONS['множитель'][4]
+_ROW_14 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, 3, 4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def _parse_14(ids, cursor, output):
+    # множитель
+    while True:
+        choice = _ROW_14[ids[cursor]]
+        if choice == 0:
+            output.append(('множитель', _P_14_0))
+            if ids[cursor] != 22:
+                raise _Unexpected(cursor, 'идентификатор', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('множитель', _P_14_1))
+            if ids[cursor] != 56:
+                raise _Unexpected(cursor, 'число', True)
+            cursor += 1
+            return cursor
+        if choice == 2:
+            output.append(('множитель', _P_14_2))
+            if ids[cursor] != 39:
+                raise _Unexpected(cursor, '(', True)
+            cursor += 1
+            if ids[cursor] == 9:
+                cursor += 1
+            else:
+                cursor = _parse_8(ids, cursor, output)
+            if ids[cursor] != 40:
+                raise _Unexpected(cursor, ')', True)
+            cursor += 1
+            return cursor
+        if choice == 3:
+            output.append(('множитель', _P_14_3))
+            if ids[cursor] != 57:
+                raise _Unexpected(cursor, 'true', True)
+            cursor += 1
+            return cursor
+        if choice == 4:
+            output.append(('множитель', _P_14_4))
+            if ids[cursor] != 58:
+                raise _Unexpected(cursor, 'false', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'множитель', False)
+
+
+_P_15_0 = PRODUCTIONS['текст_комментария'][0]
+_P_15_1 = PRODUCTIONS['текст_комментария'][1]
+_ROW_15 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, -1)
+
+
+def _parse_15(ids, cursor, output):
+    # текст_комментария
+    while True:
+        choice = _ROW_15[ids[cursor]]
+        if choice == 0:
+            output.append(('текст_комментария', _P_15_0))
+            if ids[cursor] == 17:
+                cursor += 1
+            else:
+                cursor = _parse_16(ids, cursor, output)
+            if ids[cursor] == 16:
+                return cursor + 1
+            continue
+        if choice == 1:
+            output.append(('текст_комментария', _P_15_1))
+            return cursor
+        raise _Unexpected(cursor, 'текст_комментария', False)
+
+
+_P_16_0 = PRODUCTIONS['символ'][0]
+_P_16_1 = PRODUCTIONS['символ'][1]
+_P_16_2 = PRODUCTIONS['символ'][2]
+_P_16_3 = PRODUCTIONS['символ'][3]
+_P_16_4 = PRODUCTIONS['символ'][4]
+_P_16_5 = PRODUCTIONS['символ'][5]
+_P_16_6 = PRODUCTIONS['символ'][6]
+_P_16_7 = PRODUCTIONS['символ'][7]
+_P_16_8 = PRODUCTIONS['символ'][8]
+_P_16_9 = PRODUCTIONS['символ'][9]
+_P_16_10 = PRODUCTIONS['символ'][10]
+_P_16_11 = PRODUCTIONS['символ'][11]
+_P_16_12 = PRODUCTIONS['символ'][12]
+_P_16_13 = PRODUCTIONS['символ'][13]
+_P_16_14 = PRODUCTIONS['символ'][14]
+_P_16_15 = PRODUCTIONS['символ'][15]
+_P_16_16 = PRODUCTIONS['символ'][16]
+_P_16_17 = PRODUCTIONS['символ'][17]
+_P_16_18 = PRODUCTIONS['символ'][18]
+_P_16_19 = PRODUCTIONS['символ'][19]
+_P_16_20 = PRODUCTIONS['символ'][20]
+_P_16_21 = PRODUCTIONS['символ'][21]
+_P_16_22 = PRODUCTIONS['символ'][22]
+_P_16_23 = PRODUCTIONS['символ'][23]
+_P_16_24 = PRODUCTIONS['символ'][24]
+_P_16_25 = PRODUCTIONS['символ'][25]
+_P_16_26 = PRODUCTIONS['символ'][26]
+_P_16_27 = PRODUCTIONS['символ'][27]
+_P_16_28 = PRODUCTIONS['символ'][28]
+_P_16_29 = PRODUCTIONS['символ'][29]
+_P_16_30 = PRODUCTIONS['символ'][30]
+_P_16_31 = PRODUCTIONS['символ'][31]
+_P_16_32 = PRODUCTIONS['символ'][32]
+_P_16_33 = PRODUCTIONS['символ'][33]
+_P_16_34 = PRODUCTIONS['символ'][34]
+_P_16_35 = PRODUCTIONS['символ'][35]
+_P_16_36 = PRODUCTIONS['символ'][36]
+_P_16_37 = PRODUCTIONS['символ'][37]
+_P_16_38 = PRODUCTIONS['символ'][38]
+_P_16_39 = PRODUCTIONS['символ'][39]
+_P_16_40 = PRODUCTIONS['символ'][40]
+_P_16_41 = PRODUCTIONS['символ'][41]
+_P_16_42 = PRODUCTIONS['символ'][42]
+_P_16_43 = PRODUCTIONS['символ'][43]
+_P_16_44 = PRODUCTIONS['символ'][44]
+_P_16_45 = PRODUCTIONS['символ'][45]
+_P_16_46 = PRODUCTIONS['символ'][46]
+_P_16_47 = PRODUCTIONS['символ'][47]
+_P_16_48 = PRODUCTIONS['символ'][48]
+_P_16_49 = PRODUCTIONS['символ'][49]
+_P_16_50 = PRODUCTIONS['символ'][50]
+_P_16_51 = PRODUCTIONS['символ'][51]
+_P_16_52 = PRODUCTIONS['символ'][52]
+_P_16_53 = PRODUCTIONS['символ'][53]
+_P_16_54 = PRODUCTIONS['символ'][54]
+_P_16_55 = PRODUCTIONS['символ'][55]
+_P_16_56 = PRODUCTIONS['символ'][56]
+_P_16_57 = PRODUCTIONS['символ'][57]
+_P_16_58 = PRODUCTIONS['символ'][58]
+_P_16_59 = PRODUCTIONS['символ'][59]
+_P_16_60 = PRODUCTIONS['символ'][60]
+_P_16_61 = PRODUCTIONS['символ'][61]
+_P_16_62 = PRODUCTIONS['символ'][62]
+_P_16_63 = PRODUCTIONS['символ'][63]
+_P_16_64 = PRODUCTIONS['символ'][64]
+_P_16_65 = PRODUCTIONS['символ'][65]
+_ROW_16 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, -1, -1)
+
+
+def _parse_16(ids, cursor, output):
+    # символ
+    while True:
+        choice = _ROW_16[ids[cursor]]
+        if choice == 0:
+            output.append(('символ', _P_16_0))
+            if ids[cursor] != 59:
+                raise _Unexpected(cursor, 'a', True)
+            cursor += 1
+            return cursor
+        if choice == 1:
+            output.append(('символ', _P_16_1))
+            if ids[cursor] != 60:
+                raise _Unexpected(cursor, 'b', True)
+            cursor += 1
+            return cursor
+        if choice == 2:
+            output.append(('символ', _P_16_2))
+            if ids[cursor] != 61:
+                raise _Unexpected(cursor, 'c', True)
+            cursor += 1
+            return cursor
+        if choice == 3:
+            output.append(('символ', _P_16_3))
+            if ids[cursor] != 62:
+                raise _Unexpected(cursor, 'd', True)
+            cursor += 1
+            return cursor
+        if choice == 4:
+            output.append(('символ', _P_16_4))
+            if ids[cursor] != 63:
+                raise _Unexpected(cursor, 'e', True)
+            cursor += 1
+            return cursor
+        if choice == 5:
+            output.append(('символ', _P_16_5))
+            if ids[cursor] != 64:
+                raise _Unexpected(cursor, 'f', True)
+            cursor += 1
+            return cursor
+        if choice == 6:
+            output.append(('символ', _P_16_6))
+            if ids[cursor] != 65:
+                raise _Unexpected(cursor, 'g', True)
+            cursor += 1
+            return cursor
+        if choice == 7:
+            output.append(('символ', _P_16_7))
+            if ids[cursor] != 66:
+                raise _Unexpected(cursor, 'h', True)
+            cursor += 1
+            return cursor
+        if choice == 8:
+            output.append(('символ', _P_16_8))
+            if ids[cursor] != 67:
+                raise _Unexpected(cursor, 'i', True)
+            cursor += 1
+            return cursor
+        if choice == 9:
+            output.append(('символ', _P_16_9))
+            if ids[cursor] != 68:
+                raise _Unexpected(cursor, 'j', True)
+            cursor += 1
+            return cursor
+        if choice == 10:
+            output.append(('символ', _P_16_10))
+            if ids[cursor] != 69:
+                raise _Unexpected(cursor, 'k', True)
+            cursor += 1
+            return cursor
+        if choice == 11:
+            output.append(('символ', _P_16_11))
+            if ids[cursor] != 70:
+                raise _Unexpected(cursor, 'l', True)
+            cursor += 1
+            return cursor
+        if choice == 12:
+            output.append(('символ', _P_16_12))
+            if ids[cursor] != 71:
+                raise _Unexpected(cursor, 'm', True)
+            cursor += 1
+            return cursor
+        if choice == 13:
+            output.append(('символ', _P_16_13))
+            if ids[cursor] != 72:
+                raise _Unexpected(cursor, 'n', True)
+            cursor += 1
+            return cursor
+        if choice == 14:
+            output.append(('символ', _P_16_14))
+            if ids[cursor] != 73:
+                raise _Unexpected(cursor, 'o', True)
+            cursor += 1
+            return cursor
+        if choice == 15:
+            output.append(('символ', _P_16_15))
+            if ids[cursor] != 74:
+                raise _Unexpected(cursor, 'p', True)
+            cursor += 1
+            return cursor
+        if choice == 16:
+            output.append(('символ', _P_16_16))
+            if ids[cursor] != 75:
+                raise _Unexpected(cursor, 'q', True)
+            cursor += 1
+            return cursor
+        if choice == 17:
+            output.append(('символ', _P_16_17))
+            if ids[cursor] != 76:
+                raise _Unexpected(cursor, 'r', True)
+            cursor += 1
+            return cursor
+        if choice == 18:
+            output.append(('символ', _P_16_18))
+            if ids[cursor] != 77:
+                raise _Unexpected(cursor, 's', True)
+            cursor += 1
+            return cursor
+        if choice == 19:
+            output.append(('символ', _P_16_19))
+            if ids[cursor] != 78:
+                raise _Unexpected(cursor, 't', True)
+            cursor += 1
+            return cursor
+        if choice == 20:
+            output.append(('символ', _P_16_20))
+            if ids[cursor] != 79:
+                raise _Unexpected(cursor, 'u', True)
+            cursor += 1
+            return cursor
+        if choice == 21:
+            output.append(('символ', _P_16_21))
+            if ids[cursor] != 80:
+                raise _Unexpected(cursor, 'v', True)
+            cursor += 1
+            return cursor
+        if choice == 22:
+            output.append(('символ', _P_16_22))
+            if ids[cursor] != 81:
+                raise _Unexpected(cursor, 'w', True)
+            cursor += 1
+            return cursor
+        if choice == 23:
+            output.append(('символ', _P_16_23))
+            if ids[cursor] != 82:
+                raise _Unexpected(cursor, 'x', True)
+            cursor += 1
+            return cursor
+        if choice == 24:
+            output.append(('символ', _P_16_24))
+            if ids[cursor] != 83:
+                raise _Unexpected(cursor, 'y', True)
+            cursor += 1
+            return cursor
+        if choice == 25:
+            output.append(('символ', _P_16_25))
+            if ids[cursor] != 84:
+                raise _Unexpected(cursor, 'z', True)
+            cursor += 1
+            return cursor
+        if choice == 26:
+            output.append(('символ', _P_16_26))
+            if ids[cursor] != 85:
+                raise _Unexpected(cursor, 'A', True)
+            cursor += 1
+            return cursor
+        if choice == 27:
+            output.append(('символ', _P_16_27))
+            if ids[cursor] != 86:
+                raise _Unexpected(cursor, 'B', True)
+            cursor += 1
+            return cursor
+        if choice == 28:
+            output.append(('символ', _P_16_28))
+            if ids[cursor] != 87:
+                raise _Unexpected(cursor, 'C', True)
+            cursor += 1
+            return cursor
+        if choice == 29:
+            output.append(('символ', _P_16_29))
+            if ids[cursor] != 88:
+                raise _Unexpected(cursor, 'D', True)
+            cursor += 1
+            return cursor
+        if choice == 30:
+            output.append(('символ', _P_16_30))
+            if ids[cursor] != 89:
+                raise _Unexpected(cursor, 'E', True)
+            cursor += 1
+            return cursor
+        if choice == 31:
+            output.append(('символ', _P_16_31))
+            if ids[cursor] != 90:
+                raise _Unexpected(cursor, 'F', True)
+            cursor += 1
+            return cursor
+        if choice == 32:
+            output.append(('символ', _P_16_32))
+            if ids[cursor] != 91:
+                raise _Unexpected(cursor, 'G', True)
+            cursor += 1
+            return cursor
+        if choice == 33:
+            output.append(('символ', _P_16_33))
+            if ids[cursor] != 92:
+                raise _Unexpected(cursor, 'H', True)
+            cursor += 1
+            return cursor
+        if choice == 34:
+            output.append(('символ', _P_16_34))
+            if ids[cursor] != 93:
+                raise _Unexpected(cursor, 'I', True)
+            cursor += 1
+            return cursor
+        if choice == 35:
+            output.append(('символ', _P_16_35))
+            if ids[cursor] != 94:
+                raise _Unexpected(cursor, 'J', True)
+            cursor += 1
+            return cursor
+        if choice == 36:
+            output.append(('символ', _P_16_36))
+            if ids[cursor] != 95:
+                raise _Unexpected(cursor, 'K', True)
+            cursor += 1
+            return cursor
+        if choice == 37:
+            output.append(('символ', _P_16_37))
+            if ids[cursor] != 96:
+                raise _Unexpected(cursor, 'L', True)
+            cursor += 1
+            return cursor
+        if choice == 38:
+            output.append(('символ', _P_16_38))
+            if ids[cursor] != 97:
+                raise _Unexpected(cursor, 'M', True)
+            cursor += 1
+            return cursor
+        if choice == 39:
+            output.append(('символ', _P_16_39))
+            if ids[cursor] != 98:
+                raise _Unexpected(cursor, 'N', True)
+            cursor += 1
+            return cursor
+        if choice == 40:
+            output.append(('символ', _P_16_40))
+            if ids[cursor] != 99:
+                raise _Unexpected(cursor, 'O', True)
+            cursor += 1
+            return cursor
+        if choice == 41:
+            output.append(('символ', _P_16_41))
+            if ids[cursor] != 100:
+                raise _Unexpected(cursor, 'P', True)
+            cursor += 1
+            return cursor
+        if choice == 42:
+            output.append(('символ', _P_16_42))
+            if ids[cursor] != 101:
+                raise _Unexpected(cursor, 'Q', True)
+            cursor += 1
+            return cursor
+        if choice == 43:
+            output.append(('символ', _P_16_43))
+            if ids[cursor] != 102:
+                raise _Unexpected(cursor, 'R', True)
+            cursor += 1
+            return cursor
+        if choice == 44:
+            output.append(('символ', _P_16_44))
+            if ids[cursor] != 103:
+                raise _Unexpected(cursor, 'S', True)
+            cursor += 1
+            return cursor
+        if choice == 45:
+            output.append(('символ', _P_16_45))
+            if ids[cursor] != 104:
+                raise _Unexpected(cursor, 'T', True)
+            cursor += 1
+            return cursor
+        if choice == 46:
+            output.append(('символ', _P_16_46))
+            if ids[cursor] != 105:
+                raise _Unexpected(cursor, 'U', True)
+            cursor += 1
+            return cursor
+        if choice == 47:
+            output.append(('символ', _P_16_47))
+            if ids[cursor] != 106:
+                raise _Unexpected(cursor, 'V', True)
+            cursor += 1
+            return cursor
+        if choice == 48:
+            output.append(('символ', _P_16_48))
+            if ids[cursor] != 107:
+                raise _Unexpected(cursor, 'W', True)
+            cursor += 1
+            return cursor
+        if choice == 49:
+            output.append(('символ', _P_16_49))
+            if ids[cursor] != 108:
+                raise _Unexpected(cursor, 'X', True)
+            cursor += 1
+            return cursor
+        if choice == 50:
+            output.append(('символ', _P_16_50))
+            if ids[cursor] != 109:
+                raise _Unexpected(cursor, 'Y', True)
+            cursor += 1
+            return cursor
+        if choice == 51:
+            output.append(('символ', _P_16_51))
+            if ids[cursor] != 110:
+                raise _Unexpected(cursor, 'Z', True)
+            cursor += 1
+            return cursor
+        if choice == 52:
+            output.append(('символ', _P_16_52))
+            if ids[cursor] != 111:
+                raise _Unexpected(cursor, '0', True)
+            cursor += 1
+            return cursor
+        if choice == 53:
+            output.append(('символ', _P_16_53))
+            if ids[cursor] != 112:
+                raise _Unexpected(cursor, '1', True)
+            cursor += 1
+            return cursor
+        if choice == 54:
+            output.append(('символ', _P_16_54))
+            if ids[cursor] != 113:
+                raise _Unexpected(cursor, '2', True)
+            cursor += 1
+            return cursor
+        if choice == 55:
+            output.append(('символ', _P_16_55))
+            if ids[cursor] != 114:
+                raise _Unexpected(cursor, '3', True)
+            cursor += 1
+            return cursor
+        if choice == 56:
+            output.append(('символ', _P_16_56))
+            if ids[cursor] != 115:
+                raise _Unexpected(cursor, '4', True)
+            cursor += 1
+            return cursor
+        if choice == 57:
+            output.append(('символ', _P_16_57))
+            if ids[cursor] != 116:
+                raise _Unexpected(cursor, '5', True)
+            cursor += 1
+            return cursor
+        if choice == 58:
+            output.append(('символ', _P_16_58))
+            if ids[cursor] != 117:
+                raise _Unexpected(cursor, '6', True)
+            cursor += 1
+            return cursor
+        if choice == 59:
+            output.append(('символ', _P_16_59))
+            if ids[cursor] != 118:
+                raise _Unexpected(cursor, '7', True)
+            cursor += 1
+            return cursor
+        if choice == 60:
+            output.append(('символ', _P_16_60))
+            if ids[cursor] != 119:
+                raise _Unexpected(cursor, '8', True)
+            cursor += 1
+            return cursor
+        if choice == 61:
+            output.append(('символ', _P_16_61))
+            if ids[cursor] != 120:
+                raise _Unexpected(cursor, '9', True)
+            cursor += 1
+            return cursor
+        if choice == 62:
+            output.append(('символ', _P_16_62))
+            if ids[cursor] != 121:
+                raise _Unexpected(cursor, '_', True)
+            cursor += 1
+            return cursor
+        if choice == 63:
+            output.append(('символ', _P_16_63))
+            if ids[cursor] != 122:
+                raise _Unexpected(cursor, ' ', True)
+            cursor += 1
+            return cursor
+        if choice == 64:
+            output.append(('символ', _P_16_64))
+            if ids[cursor] != 123:
+                raise _Unexpected(cursor, '\t', True)
+            cursor += 1
+            return cursor
+        if choice == 65:
+            output.append(('символ', _P_16_65))
+            if ids[cursor] != 124:
+                raise _Unexpected(cursor, '\n', True)
+            cursor += 1
+            return cursor
+        raise _Unexpected(cursor, 'символ', False)
+
+
+_P_17_0 = PRODUCTIONS['оператор_fact0'][0]
+_P_17_1 = PRODUCTIONS['оператор_fact0'][1]
+_ROW_17 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1)
+
+
+def _parse_17(ids, cursor, output):
+    # оператор_fact0
+    while True:
+        choice = _ROW_17[ids[cursor]]
+        if choice == 0:
+            output.append(('оператор_fact0', _P_17_0))
+            if ids[cursor] != 125:
+                raise _Unexpected(cursor, 'else', True)
+            cursor += 1
+            if ids[cursor] == 6:
+                cursor += 1
+            else:
+                cursor = _parse_5(ids, cursor, output)
+            return cursor
+        if choice == 1:
+            output.append(('оператор_fact0', _P_17_1))
+            return cursor
+        raise _Unexpected(cursor, 'оператор_fact0', False)
+
+
+_P_18_0 = PRODUCTIONS['выражение_fact0'][0]
+_P_18_1 = PRODUCTIONS['выражение_fact0'][1]
+_ROW_18 = (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1, -1, -1, 1, -1, -1, -1, -1, -1, -1, -1, 1, -1, 1, -1, -1, 1, -1, -1, 1, -1, 0, 0, 0, 0, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, -1)
+
+
+def _parse_18(ids, cursor, output):
+    # выражение_fact0
+    while True:
+        choice = _ROW_18[ids[cursor]]
+        if choice == 0:
+            output.append(('выражение_fact0', _P_18_0))
+            if ids[cursor] == 10:
+                cursor += 1
+            else:
+                cursor = _parse_9(ids, cursor, output)
+            if ids[cursor] == 15:
+                cursor += 1
+            else:
+                cursor = _parse_14(ids, cursor, output)
+            if ids[cursor] == 13:
+                cursor += 1
+            else:
+                cursor = _parse_12(ids, cursor, output)
+            if ids[cursor] == 11:
+                cursor += 1
+            else:
+                cursor = _parse_10(ids, cursor, output)
+            return cursor
+        if choice == 1:
+            output.append(('выражение_fact0', _P_18_1))
+            return cursor
+        raise _Unexpected(cursor, 'выражение_fact0', False)
+
+
+_START = 'программа'
+_TERMINALS = frozenset(['\t', '\n', ' ', '!', '$', '%', '(', ')', '*', '+', ',', '-', '.', '/', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', ':', ';', '<', '<=', '=', '>', '>=', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', '_', 'a', 'and', 'ass', 'b', 'begin', 'c', 'd', 'do', 'e', 'else', 'end', 'f', 'false', 'for', 'g', 'h', 'i', 'if', 'j', 'k', 'l', 'm', 'n', 'not', 'o', 'or', 'p', 'program', 'q', 'r', 'read', 's', 't', 'then', 'to', 'true', 'u', 'v', 'var', 'w', 'while', 'write', 'x', 'y', 'z', '{', '}', 'идентификатор', 'число'])
+_ROWS = {'программа': _ROW_0, 'описание_хвост': _ROW_1, 'тип': _ROW_2, 'тело': _ROW_3, 'оператор_список': _ROW_4, 'оператор': _ROW_5, 'ввода_хвост': _ROW_6, 'вывода_хвост': _ROW_7, 'выражение': _ROW_8, 'знак_сравнения': _ROW_9, 'сумма_хвост': _ROW_10, 'операция_сложения': _ROW_11, 'произведение_хвост': _ROW_12, 'операция_умножения': _ROW_13, 'множитель': _ROW_14, 'текст_комментария': _ROW_15, 'символ': _ROW_16, 'оператор_fact0': _ROW_17, 'выражение_fact0': _ROW_18}
+
+
+def _parse_with_stack(tokens):
+    """Разбор с явным стеком по тем же строкам таблицы: шаги LL1Parser.parse"""
+    stack = ['$', _START]
+    end = len(tokens)
+    cursor = 0
+    output = []
+    while stack:
+        top = stack.pop()
+        token = tokens[cursor] if cursor < end else '$'
+        if top == token:
+            cursor += 1
+            continue
+        if top in _TERMINALS:
+            raise SyntaxError(f"Unexpected token: {token}, expected: {top}")
+        choice = _ROWS[top][_SYMBOL_IDS.get(token, _UNKNOWN)]
+        if choice < 0:
+            raise SyntaxError(f"Unexpected token: {token} at {top}")
+        prod = PRODUCTIONS[top][choice]
+        output.append((top, prod))
+        stack.extend(sym for sym in reversed(prod) if sym != 'ε')
+    if cursor != end + 1:
+        raise SyntaxError("Input not fully consumed")
+    return output
+
+
+def parse(tokens):
+    """Разбор, эквивалентный LL1Parser.parse: список (нетерминал, правило) левого вывода"""
+    ids = [_SYMBOL_IDS.get(token, _UNKNOWN) for token in tokens]
+    padding = 2
+    while True:
+        ids.extend([0] * padding)
+        output = []
+        cursor = 0
+        try:
+            if ids[cursor] == 1:
+                cursor += 1
+            else:
+                cursor = _parse_0(ids, cursor, output)
+            if ids[cursor] != 0:
+                raise _Unexpected(cursor, '$', True)
+            cursor += 1
+            break
+        except _Unexpected as e:
+            token = tokens[e.cursor] if e.cursor < len(tokens) else '$'
+            if e.terminal:
+                raise SyntaxError(f"Unexpected token: {token}, expected: {e.symbol}") from None
+            raise SyntaxError(f"Unexpected token: {token} at {e.symbol}") from None
+        except IndexError:
+            padding *= 2
+        except RecursionError:
+            return _parse_with_stack(tokens)
+    if cursor != len(tokens) + 1:
+        raise SyntaxError("Input not fully consumed")
+    return output
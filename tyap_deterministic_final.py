@@ -1,23 +1,16 @@
 from collections import defaultdict, deque
-from typing import List, Dict, Tuple, Set
-import sys
-from enum import Enum, auto
 from copy import deepcopy
-from typing import List, Dict, Set
-from itertools import zip_longest
-from itertools import chain, combinations
-import copy
+from typing import Dict, List, Set, Tuple
+
+from tyap import ConflictTable, ordered_set, ordered_symbols
 
-from copy import deepcopy
-from typing import Dict, List, Set
-from itertools import zip_longest
 
 class Grammar:
     def __init__(self, grammar: Dict):
-        self.non_terminals = set(grammar['nonterminals'])
-        self.terminals = set(grammar['terminals'])
-        self.start_symbol = grammar['start_symbol']
         self.productions = deepcopy(grammar['productions'])
+        self.non_terminals = ordered_symbols(grammar['nonterminals'], self.productions)
+        self.terminals = ordered_symbols(grammar['terminals'], self.productions)
+        self.start_symbol = grammar['start_symbol']
 
     def toDict(self):
         return {
@@ -28,13 +21,13 @@ class Grammar:
         }
         
     def _collect_terminals(self):
-        """Собирает все терминальные символы из правил"""
-        terminals = set()
+        """Собирает все терминальные символы из правил (в порядке появления)"""
+        terminals = ordered_set()
         for rhs_list in self.productions.values():
             for rhs in rhs_list:
                 for symbol in rhs:
                     if symbol not in self.non_terminals and symbol:
-                        terminals.add(symbol)
+                        terminals.setdefault(symbol)
         return terminals
     
     def check_language_existence(self):
@@ -91,7 +84,9 @@ class Grammar:
                             break
         
         new_productions = {}
-        for A in generating:
+        for A in self.non_terminals:
+            if A not in generating:
+                continue
             new_rhs = []
             for production in self.productions[A]:
                 if all((sym not in self.non_terminals) or (sym in generating) for sym in production):
@@ -122,7 +117,7 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = generating
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
     def eliminate_unreachable(self):
@@ -134,7 +129,7 @@ class Grammar:
         print("\nУстранение недостижимых символов:")
         unreachable_before = set(self.non_terminals)
         
-        reachable = set([self.start_symbol])
+        reachable = ordered_set([self.start_symbol])
         changed = True
         
         while changed:
@@ -143,12 +138,14 @@ class Grammar:
                 for production in self.productions.get(A, []):
                     for sym in production:
                         if sym in self.non_terminals and sym not in reachable:
-                            reachable.add(sym)
+                            reachable.setdefault(sym)
                             changed = True
         
         # Удаляем недостижимые нетерминалы и правила
         new_productions = {}
-        for A in reachable:
+        for A in self.non_terminals:
+            if A not in reachable:
+                continue
             new_rhs = []
             for production in self.productions[A]:
                 if all((sym not in self.non_terminals) or (sym in reachable) for sym in production):
@@ -180,7 +177,7 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = set(new_productions.keys())
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
     def remove_epsilon_rules(self):
@@ -206,11 +203,12 @@ class Grammar:
 
         new_productions = {}
         for head, bodies in self.productions.items():
-            new_bodies = set()
+            # упорядоченное множество: порядок правил не зависит от хеширования кортежей
+            new_bodies = ordered_set()
             for body in bodies:
                 if not body:
                     if head in preserve_nullable:
-                        new_bodies.add(tuple())
+                        new_bodies.setdefault(tuple())
                     continue
                 
                 nullable_indices = [i for i, sym in enumerate(body) if sym in nullable]
@@ -221,7 +219,7 @@ class Grammar:
                         if i not in nullable_indices or include[nullable_indices.index(i)]:
                             new_body.append(sym)
                     if new_body or head in preserve_nullable:
-                        new_bodies.add(tuple(new_body))
+                        new_bodies.setdefault(tuple(new_body))
             
             new_productions[head] = [list(b) for b in new_bodies if b or head in preserve_nullable]
 
@@ -254,19 +252,19 @@ class Grammar:
         # Шаг 1: для каждого A вычислить множество N_A
         N_sets = {}
         for A in self.non_terminals:
-            N_current = set([A])
+            N_current = ordered_set([A])
             changed = True
             while changed:
                 changed = False
-                to_add = set()
+                to_add = ordered_set()
                 for B in N_current:
                     for production in self.productions.get(B, []):
                         if len(production) == 1 and production[0] in self.non_terminals:
                             C = production[0]
                             if C not in N_current:
-                                to_add.add(C)
+                                to_add.setdefault(C)
                 if to_add:
-                    N_current |= to_add
+                    N_current.update(to_add)
                     changed = True
             N_sets[A] = N_current
         
@@ -296,7 +294,7 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = set(new_productions.keys())
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
         
     def eliminate_mixed_rules(self):
@@ -304,7 +302,7 @@ class Grammar:
         #S -> A, a, B преобразуется в S -> A, N_a, B; N_a -> a
 
         new_productions = {}
-        new_non_terminals = set(self.non_terminals)
+        new_non_terminals = ordered_set(self.non_terminals)
         terminal_to_nt = {}
 
         for A in self.non_terminals:
@@ -313,7 +311,7 @@ class Grammar:
                     if symbol in self.terminals and symbol not in terminal_to_nt:
                         new_nt = f"N_{symbol}"
                         terminal_to_nt[symbol] = new_nt
-                        new_non_terminals.add(new_nt)
+                        new_non_terminals.setdefault(new_nt)
 
         for A in self.non_terminals:
             new_productions[A] = []
@@ -349,7 +347,7 @@ class Grammar:
             print("\nУстранение левой факторизации:")
             # Сбрасываем индекс для новых нетерминалов
             new_nt_index = 0  # <-- Добавлено: сброс индекса
-            new_productions = copy.deepcopy(self.productions)  # <-- Используем глубокую копию
+            new_productions = deepcopy(self.productions)  # <-- Используем глубокую копию
             changed = True
 
             def longest_common_prefix(productions):
@@ -414,7 +412,7 @@ class Grammar:
 
             # Обновляем грамматику
             self.productions = new_productions
-            self.non_terminals = set(new_productions.keys())
+            self.non_terminals = ordered_set(new_productions)
             self.terminals = self._collect_terminals()
 
             # Вывод результатов
@@ -444,7 +442,6 @@ class Grammar:
         productions_count_before = sum(len(prods) for prods in self.productions.values())
         nonterminals_count_before = len(self.non_terminals)
         
-        import copy
         new_productions = {}
         new_nt_index = 0
         
@@ -486,7 +483,7 @@ class Grammar:
             print()
         
         self.productions = new_productions
-        self.non_terminals = set(new_productions.keys())
+        self.non_terminals = ordered_set(new_productions)
         self.terminals = self._collect_terminals()
 
     def print_grammar(self):
@@ -528,7 +525,9 @@ class LexerFA:
         self.token_types = []
 
     def hash_id(self, ident):
-        return hash(ident) % 997
+        # hash() строк зависит от PYTHONHASHSEED, sha1 - нет
+        import hashlib  # отложенный импорт: нужен только при первом новом идентификаторе
+        return int(hashlib.sha1(ident.encode()).hexdigest(), 16) % 997
 
     def add_identifier(self, ident):
         idx = self.hash_id(ident)
@@ -539,6 +538,11 @@ class LexerFA:
         return idx
 
     def lex(self, text):
+        # Каждый вызов начинается с чистого состояния: токены не накапливаются между вызовами
+        self.identifier_table = {}
+        self.identifier_hash = {}
+        self.tokens = []
+        self.token_types = []
         i = 0
         state = 'START'
         buffer = ''
@@ -648,15 +652,19 @@ class LexerFA:
 
 
 # ---------- LL(1) Parser ----------
-class LL1Parser:
-    def __init__(self, grammar: Dict):
-        self.nonterminals = grammar['nonterminals']
-        self.terminals = grammar['terminals']
-        self.start_symbol = grammar['start_symbol']
+class LL1Parser(ConflictTable):
+    def __init__(self, grammar: Dict, conflict_policy="dangling_else"):
+        self.validate_policy(conflict_policy)
         self.productions = grammar['productions']
+        # фиксированный порядок обхода: таблица и отчет о конфликтах не зависят от PYTHONHASHSEED
+        self.nonterminals = ordered_symbols(grammar['nonterminals'], self.productions)
+        self.terminals = ordered_symbols(grammar['terminals'], self.productions)
+        self.start_symbol = grammar['start_symbol']
+        self.conflict_policy = conflict_policy
         self.first = defaultdict(set)
         self.follow = defaultdict(set)
         self.table = defaultdict(dict)
+        self.conflicts = []
         self.build()
 
     def build(self):
@@ -702,7 +710,7 @@ class LL1Parser:
         changed = True
         while changed:
             changed = False
-            for nt in list(self.nonterminals):  # Используем list для фиксированного порядка
+            for nt in self.nonterminals:
                 for prod in self.productions.get(nt, []):
                     trailer = set(self.follow[nt])
                     
@@ -722,27 +730,27 @@ class LL1Parser:
                             trailer = set(self.first[symbol])
 
     def build_parse_table(self):
+        """
+        Строит таблицу разбора. Конфликты не перезаписываются молча, а собираются
+        в self.conflicts (по одной записи LL1Conflict на ячейку) и разрешаются
+        согласно self.conflict_policy.
+        """
         self.table = defaultdict(dict)
-        
+        self.conflicts = []
+        conflict_index = {}
+
         for nt in self.nonterminals:
             for prod in self.productions.get(nt, []):
                 first_alpha = self.first_of_sequence(prod)
-                
-                # Для каждого терминала в FIRST(α)
-                for terminal in first_alpha - {'ε'}:
-                    # if terminal in self.table[nt]:
-                        # Вместо вызова ошибки, выбираем последнее правило (можно изменить логику)
-                        # print(f"Предупреждение: конфликт в таблице разбора для {nt} -> {terminal}")
-                        # print(f"Существующее: {self.table[nt][terminal]}, новое: {prod}")
-                    self.table[nt][terminal] = prod
-                
-                # Если ε в FIRST(α), добавляем для всех терминалов из FOLLOW(A)
+
+                # Терминалы из FIRST(α), а если ε в FIRST(α) - еще и из FOLLOW(A)
+                cells = first_alpha - {'ε'}
                 if 'ε' in first_alpha:
-                    for terminal in self.follow[nt]:
-                        # if terminal in self.table[nt]:
-                        #     print(f"Предупреждение: конфликт в таблице разбора для {nt} -> {terminal}")
-                        #     print(f"Существующее: {self.table[nt][terminal]}, новое: {prod}")
-                        self.table[nt][terminal] = prod
+                    cells |= self.follow[nt]
+                for terminal in sorted(cells):
+                    self._set_table_entry(nt, terminal, prod, conflict_index)
+
+        self.check_conflicts()
 
     def first_of_sequence(self, symbols: List[str]) -> Set[str]:
         result = set()
@@ -754,14 +762,15 @@ class LL1Parser:
         return result
 
     def parse(self, tokens: List[str]) -> List[Tuple[str, List[str]]]:
+        # Список tokens не изменяется: маркер конца '$' подставляется при выходе за его границу
         stack = deque(["$", self.start_symbol])
-        tokens.append("$")
+        end = len(tokens)
         cursor = 0
         output = []
         
         while stack:
             top = stack.pop()
-            current_token = tokens[cursor]
+            current_token = tokens[cursor] if cursor < end else "$"
             
             if top == current_token:
                 cursor += 1
@@ -777,7 +786,7 @@ class LL1Parser:
                 expected = list(self.table[top].keys())
                 raise SyntaxError(f"Неожиданный токен: {current_token} при разборе {top}. Ожидалось: {expected}")
         
-        if cursor != len(tokens):
+        if cursor != end + 1:
             raise SyntaxError("Входные данные не полностью обработаны")
         return output
 
@@ -875,6 +884,7 @@ if __name__ == '__main__':
     test = ["a", "b", "c"]
     
     parser = LL1Parser(grammar22.toDict())
+    parser.print_conflicts()
     
     try:
         result = parser.parse(test)
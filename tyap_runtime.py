@@ -0,0 +1,990 @@
+# Исполнение программ: построение дерева программы, скалярный интерпретатор
+# и пакетное (векторное) исполнение одной программы на множестве входных наборов
+#
+# Дерево программы строится по дереву разбора LL(1)-анализатора языка (parse_to_tree),
+# поэтому синтаксис определяется только LANGUAGE_GRAMMAR: значения чисел берутся из
+# пула констант, имена - из текста программы, приоритеты операций - из грамматики.
+#
+# Пакетный режим использует NumPy, если он установлен: переменные - массивы по всем
+# наборам входных данных, if/while исполняются с маской активных наборов.
+import sys
+import time
+from collections import namedtuple
+
+from tyap import LANGUAGE_GRAMMAR, LexerFA, load_language_parser, number_value
+
+# ---------- Дерево программы ----------
+Program = namedtuple("Program", ["variables", "body"])    # variables: имя -> тип ('%', '!', '$')
+Block = namedtuple("Block", ["statements"])
+Assign = namedtuple("Assign", ["name", "expr"])
+If = namedtuple("If", ["cond", "then", "otherwise"])       # otherwise = None без else
+While = namedtuple("While", ["cond", "body"])
+For = namedtuple("For", ["name", "start", "stop", "body"])
+Read = namedtuple("Read", ["names"])
+Write = namedtuple("Write", ["exprs"])
+Const = namedtuple("Const", ["value"])
+Var = namedtuple("Var", ["name"])
+Unary = namedtuple("Unary", ["op", "operand"])
+Binary = namedtuple("Binary", ["op", "left", "right"])
+
+RELATIONS = ("=", "<", ">", "<=", ">=")
+
+# приведение значения к объявленному типу переменной при присваивании и вводе
+COERCE = {"%": int, "!": float, "$": bool}
+
+
+class ExecutionError(Exception):
+    """Ошибка времени исполнения (деление на ноль, нехватка входных данных)"""
+
+
+class LimitExceeded(ExecutionError):
+    """Превышен бюджет исполнения: limit - 'instructions', 'seconds' или 'memory'"""
+
+    def __init__(self, limit, used, budget):
+        super().__init__(f"Limit exceeded: {limit} {used} > {budget}")
+        self.limit = limit
+        self.used = used
+        self.budget = budget
+
+
+class ProgramBuilder:
+    """
+    Дерево программы по дереву разбора LL1Parser.parse_to_tree. Нетерминалы, которых
+    нет в LANGUAGE_GRAMMAR (хвосты после левой факторизации вроде оператор_fact0),
+    раскрываются в родителе, поэтому правые части совпадают с правилами исходной
+    грамматики, в которые подставлены сумма, произведение и присваивания.
+    """
+
+    def __init__(self, text, lexed, tree):
+        self.text = text
+        self.tree = tree
+        self.token_offsets = lexed.token_offsets
+        self.token_values = lexed.token_values
+        self.constants = lexed.constants
+        self.variables = {}
+
+    def children(self, node):
+        """Потомки node с раскрытыми вспомогательными нетерминалами"""
+        tree = self.tree
+        result = []
+        for child in tree.children(node):
+            symbol = tree.symbol(child)
+            if symbol in LANGUAGE_GRAMMAR["nonterminals"] or symbol in LANGUAGE_GRAMMAR["terminals"]:
+                result.append(child)
+            else:
+                result.extend(self.children(child))
+        return result
+
+    def identifier(self, node):
+        """Имя идентификатора берется из текста: индексы в таблице идентификаторов могут совпадать"""
+        start = end = self.token_offsets[self.tree.token_index[node]]
+        while end < len(self.text) and (self.text[end].isalnum() or self.text[end] == "_"):
+            end += 1
+        return self.text[start:end]
+
+    def variable(self, node):
+        name = self.identifier(node)
+        if name not in self.variables:
+            raise SyntaxError(f"Undeclared identifier: {name} at position {self.tree.token_index[node]}")
+        return name
+
+    def program(self) -> Program:
+        # program var идентификатор описание_хвост ; тело . (перед ним - комментарий)
+        tree = self.tree
+        children = self.children(tree.root)
+        names = []
+        for child in children:
+            symbol = tree.symbol(child)
+            if symbol == "идентификатор":
+                names.append(self.identifier(child))
+            elif symbol == "описание_хвост":
+                kind = self.declaration_tail(child, names)
+                self.variables = dict.fromkeys(names, kind)
+            elif symbol == "тело":
+                body = self.statement_list(self.children(child)[-2])
+        return Program(self.variables, body)
+
+    def declaration_tail(self, node, names):
+        """Имена описания добавляются в names; возвращает тип ('%', '!', '$')"""
+        tree = self.tree
+        while True:
+            children = self.children(node)
+            if tree.symbol(children[0]) == ":":
+                return tree.symbol(self.children(children[1])[0])
+            names.append(self.identifier(children[1]))
+            node = children[2]
+
+    def statement_list(self, node) -> Block:
+        statements = []
+        children = self.children(node)
+        while children:
+            statement = self.statement(children[0])
+            if statement is not None:
+                statements.append(statement)
+            children = self.children(children[2])
+        return Block(statements)
+
+    def statement(self, node):
+        tree = self.tree
+        children = self.children(node)
+        token = tree.symbol(children[0])
+        if token == "идентификатор":
+            return Assign(self.variable(children[0]), self.expression(children[2]))
+        if token == "if":
+            otherwise = self.statement(children[5]) if len(children) > 4 else None
+            return If(self.expression(children[1]), self.statement(children[3]), otherwise)
+        if token == "while":
+            return While(self.expression(children[1]), self.statement(children[3]))
+        if token == "for":
+            # for идентификатор ass выражение to выражение do оператор
+            return For(self.variable(children[1]), self.expression(children[3]),
+                       self.expression(children[5]), self.statement(children[7]))
+        if token == "begin":
+            return self.statement_list(children[1])
+        if token == "read":
+            names = [self.variable(children[2])]
+            tail = self.children(children[3])
+            while tail:
+                names.append(self.variable(tail[1]))
+                tail = self.children(tail[2])
+            return Read(names)
+        if token == "write":
+            exprs = [self.expression(children[2])]
+            tail = self.children(children[3])
+            while tail:
+                exprs.append(self.expression(tail[1]))
+                tail = self.children(tail[2])
+            return Write(exprs)
+        # комментарий
+        return None
+
+    def expression(self, node):
+        # not множитель | множитель произведение_хвост сумма_хвост [знак_сравнения множитель ...]
+        tree = self.tree
+        children = self.children(node)
+        if tree.symbol(children[0]) == "not":
+            return Unary("not", self.factor(children[1]))
+        left = self.sum(children[:3])
+        if len(children) > 3:
+            op = tree.symbol(self.children(children[3])[0])
+            left = Binary(op, left, self.sum(children[4:]))
+        return left
+
+    def sum(self, children):
+        """множитель произведение_хвост сумма_хвост; операции левоассоциативны"""
+        left = self.product(children[0], children[1])
+        tail = self.children(children[2])
+        while tail:
+            op = self.tree.symbol(self.children(tail[0])[0])
+            left = Binary(op, left, self.product(tail[1], tail[2]))
+            tail = self.children(tail[3])
+        return left
+
+    def product(self, factor, tail):
+        left = self.factor(factor)
+        tail = self.children(tail)
+        while tail:
+            op = self.tree.symbol(self.children(tail[0])[0])
+            left = Binary(op, left, self.factor(tail[1]))
+            tail = self.children(tail[2])
+        return left
+
+    def factor(self, node):
+        tree = self.tree
+        children = self.children(node)
+        token = tree.symbol(children[0])
+        if token == "идентификатор":
+            return Var(self.variable(children[0]))
+        if token == "число":
+            return Const(self.constants[self.token_values[tree.token_index[children[0]]]])
+        if token in ("true", "false"):
+            return Const(token == "true")
+        return self.expression(children[1])
+
+
+_language_parser = None
+
+
+def language_parser():
+    """LL(1)-анализатор языка (tyap_tables); загружается при первой компиляции"""
+    global _language_parser
+    if _language_parser is None:
+        _language_parser = load_language_parser()
+    return _language_parser
+
+
+def compile_program(text, lexer=None, parser=None) -> Program:
+    """
+    Лексический и синтаксический анализ (parser - LL1Parser языка, по умолчанию
+    language_parser()) и построение дерева программы по дереву разбора
+    """
+    lexer = lexer or LexerFA(verbose=False)
+    parser = parser or language_parser()
+    lexed = lexer.tokenize(text)
+    return ProgramBuilder(text, lexed, parser.parse_to_tree(lexed.tokens)).program()
+
+
+# ---------- Ввод-вывод ----------
+# read берет значения из источника (InputBuffer), write передает кортеж значений приемнику:
+# CollectSink сохраняет их для проверки, OutputBuffer пишет текст в поток крупными блоками
+OUTPUT_BUFFER_SIZE = 1 << 16    # символов
+
+
+def parse_input_value(word):
+    if word == "true":
+        return True
+    if word == "false":
+        return False
+    try:
+        return number_value(word)
+    except ValueError:
+        raise ExecutionError(f"Invalid input value: {word}") from None
+
+
+def format_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def coerce_value(kind, name, value):
+    """
+    Приведение значения к типу kind переменной name. int(inf), int(nan) и float от
+    слишком большого целого - ошибка исполнения, а не исключение Python
+    """
+    try:
+        return COERCE[kind](value)
+    except OverflowError:
+        raise ExecutionError(f"Value out of range for variable {name}") from None
+    except ValueError:
+        raise ExecutionError(f"Cannot assign {format_value(value)} to variable {name}") from None
+
+
+class InputBuffer:
+    """Источник для read: ввод читается целиком один раз и заранее разбирается на значения"""
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.position = 0
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(parse_input_value(word) for word in text.split())
+
+    @classmethod
+    def from_stream(cls, stream):
+        return cls.from_text(stream.read())
+
+    def next_value(self):
+        if self.position >= len(self.values):
+            raise ExecutionError("Input exhausted")
+        value = self.values[self.position]
+        self.position += 1
+        return value
+
+
+def as_source(inputs):
+    return inputs if isinstance(inputs, InputBuffer) else InputBuffer(inputs)
+
+
+class CollectSink:
+    """Приемник write, сохраняющий строки вывода кортежами значений"""
+
+    def __init__(self):
+        self.rows = []
+        self.written = 0    # оценка занятой памяти в байтах
+
+    def write(self, row):
+        self.rows.append(row)
+        self.written += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+
+    def flush(self):
+        pass
+
+
+class OutputBuffer:
+    """
+    Приемник write в текстовый поток: строка на каждый write, значения через пробел.
+    Строки копятся в буфере и передаются потоку одним вызовом, когда набирается size
+    символов, и при flush() в конце программы.
+    """
+
+    def __init__(self, stream, size=OUTPUT_BUFFER_SIZE):
+        self.stream = stream
+        self.size = size
+        self.chunks = []
+        self.pending = 0
+        self.written = 0    # всего выведено символов
+
+    def write(self, row):
+        line = " ".join(map(format_value, row)) + "\n"
+        self.chunks.append(line)
+        self.pending += len(line)
+        self.written += len(line)
+        if self.pending >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self.chunks:
+            self.stream.write("".join(self.chunks))
+            self.chunks = []
+            self.pending = 0
+
+
+# ---------- Ограничения исполнения ----------
+# Бюджет проверяется только на обратных дугах циклов: без циклов время исполнения
+# ограничено размером программы. Число "инструкций" итерации - число узлов дерева
+# в условии и теле цикла (вложенные циклы учитываются на своих обратных дугах),
+# оно вычисляется один раз при подготовке программы.
+Limits = namedtuple("Limits", ["instructions", "seconds", "memory"], defaults=(None, None, None))
+
+
+def static_cost(node):
+    """Число узлов дерева node без тел вложенных циклов"""
+    kind = type(node)
+    if kind is Const or kind is Var:
+        return 1
+    if kind is Unary:
+        return 1 + static_cost(node.operand)
+    if kind is Binary:
+        return 1 + static_cost(node.left) + static_cost(node.right)
+    if kind is Block:
+        return 1 + sum(static_cost(statement) for statement in node.statements)
+    if kind is Assign:
+        return 1 + static_cost(node.expr)
+    if kind is If:
+        otherwise = 0 if node.otherwise is None else static_cost(node.otherwise)
+        return 1 + static_cost(node.cond) + static_cost(node.then) + otherwise
+    if kind is While:
+        return 1 + static_cost(node.cond)
+    if kind is For:
+        return 1 + static_cost(node.start) + static_cost(node.stop)
+    if kind is Read:
+        return 1 + len(node.names)
+    return 1 + sum(static_cost(expr) for expr in node.exprs)
+
+
+def loop_costs(node, costs=None) -> dict:
+    """id(цикла) -> стоимость одной итерации для всех циклов программы"""
+    costs = {} if costs is None else costs
+    kind = type(node)
+    if kind is Block:
+        for statement in node.statements:
+            loop_costs(statement, costs)
+    elif kind is If:
+        loop_costs(node.then, costs)
+        if node.otherwise is not None:
+            loop_costs(node.otherwise, costs)
+    elif kind is While:
+        costs[id(node)] = static_cost(node.cond) + static_cost(node.body)
+        loop_costs(node.body, costs)
+    elif kind is For:
+        costs[id(node)] = static_cost(node.body) + 2    # сравнение с границей и шаг
+        loop_costs(node.body, costs)
+    return costs
+
+
+def memory_estimate(env, sink):
+    """Оценка памяти исполнения: значения переменных и накопленный вывод"""
+    return sum(sys.getsizeof(value) for value in env.values()) + getattr(sink, "written", 0)
+
+
+class Budget:
+    """Расход ресурсов одного исполнения"""
+
+    def __init__(self, limits: Limits, instructions=0, started=None):
+        self.limits = limits
+        self.instructions = instructions
+        self.started = time.monotonic() if started is None else started
+
+    def charge(self, cost, state):
+        """Обратная дуга цикла: cost инструкций итерации; LimitExceeded при превышении"""
+        limits = self.limits
+        self.instructions += cost
+        if limits.instructions is not None and self.instructions > limits.instructions:
+            raise LimitExceeded("instructions", self.instructions, limits.instructions)
+        if limits.seconds is not None:
+            elapsed = time.monotonic() - self.started
+            if elapsed > limits.seconds:
+                raise LimitExceeded("seconds", round(elapsed, 3), limits.seconds)
+        if limits.memory is not None:
+            used = memory_estimate(state.env, state.sink)
+            if used > limits.memory:
+                raise LimitExceeded("memory", used, limits.memory)
+
+
+# ---------- Скалярное исполнение ----------
+class ScalarState:
+    """
+    Состояние одного исполнения: значения переменных, источник ввода, приемник вывода
+    и бюджет (None без ограничений)
+    """
+
+    def __init__(self, env, source, sink, budget=None):
+        self.env = env
+        self.source = source
+        self.sink = sink
+        self.budget = budget
+
+
+def apply_operator(op, left, right):
+    if op == "+":
+        return left + right
+    if op == "-":
+        return left - right
+    if op == "*":
+        return left * right
+    if op == "/":
+        if right == 0:
+            raise ExecutionError("Division by zero")
+        return left / right
+    if op == "and":
+        return bool(left) and bool(right)
+    if op == "or":
+        return bool(left) or bool(right)
+    if op == "=":
+        return left == right
+    if op == "<":
+        return left < right
+    if op == ">":
+        return left > right
+    if op == "<=":
+        return left <= right
+    return left >= right
+
+
+class Interpreter:
+    """
+    Обход дерева программы. Экземпляр не хранит состояние исполнения (оно в ScalarState),
+    поэтому одна скомпилированная программа может исполняться параллельно.
+    limits - ограничения (Limits) каждого исполнения.
+    """
+
+    def __init__(self, program: Program, limits: Limits = None):
+        self.program = program
+        self.limits = limits
+        self.loop_costs = loop_costs(program.body)
+        self.dispatch = {
+            Block: self.exec_block, Assign: self.exec_assign, If: self.exec_if,
+            While: self.exec_while, For: self.exec_for, Read: self.exec_read, Write: self.exec_write,
+        }
+
+    def initial_env(self):
+        return {name: COERCE[kind]() for name, kind in self.program.variables.items()}
+
+    def coerce(self, name, value):
+        return coerce_value(self.program.variables[name], name, value)
+
+    def run(self, source=(), sink=None):
+        """
+        Исполняет программу: read берет значения из source (InputBuffer или
+        последовательность значений), write пишет в sink (по умолчанию CollectSink).
+        Возвращает sink; буфер вывода сбрасывается и при ошибке исполнения.
+        """
+        sink = CollectSink() if sink is None else sink
+        budget = None if self.limits is None else Budget(self.limits)
+        try:
+            self.execute(self.program.body, ScalarState(self.initial_env(), as_source(source), sink, budget))
+        finally:
+            sink.flush()
+        return sink
+
+    def execute(self, statement, state):
+        self.dispatch[type(statement)](statement, state)
+
+    def exec_block(self, block, state):
+        for statement in block.statements:
+            self.dispatch[type(statement)](statement, state)
+
+    def exec_assign(self, statement, state):
+        state.env[statement.name] = self.coerce(statement.name, self.evaluate(statement.expr, state.env))
+
+    def exec_if(self, statement, state):
+        if self.evaluate(statement.cond, state.env):
+            self.execute(statement.then, state)
+        elif statement.otherwise is not None:
+            self.execute(statement.otherwise, state)
+
+    def exec_while(self, statement, state):
+        budget = state.budget
+        cost = self.loop_costs[id(statement)]
+        while self.evaluate(statement.cond, state.env):
+            self.execute(statement.body, state)
+            if budget is not None:
+                budget.charge(cost, state)
+
+    def exec_for(self, statement, state):
+        # как в Паскале: граница вычисляется один раз, шаг 1 включительно
+        env = state.env
+        env[statement.name] = self.coerce(statement.name, self.evaluate(statement.start, env))
+        self.continue_for(statement, self.evaluate(statement.stop, env), state)
+
+    def continue_for(self, statement, stop, state):
+        """Итерации цикла for с текущего значения переменной до границы stop"""
+        coerce = COERCE[self.program.variables[statement.name]]
+        budget = state.budget
+        cost = self.loop_costs[id(statement)]
+        env = state.env
+        while env[statement.name] <= stop:
+            self.execute(statement.body, state)
+            env[statement.name] = coerce(env[statement.name] + 1)
+            if budget is not None:
+                budget.charge(cost, state)
+
+    def exec_read(self, statement, state):
+        for name in statement.names:
+            state.env[name] = self.coerce(name, state.source.next_value())
+
+    def exec_write(self, statement, state):
+        state.sink.write(tuple(self.evaluate(expr, state.env) for expr in statement.exprs))
+
+    def evaluate(self, expr, env):
+        kind = type(expr)
+        if kind is Var:
+            return env[expr.name]
+        if kind is Const:
+            return expr.value
+        if kind is Binary:
+            left = self.evaluate(expr.left, env)
+            right = self.evaluate(expr.right, env)
+            try:
+                return apply_operator(expr.op, left, right)
+            except OverflowError:
+                # целое, не представимое float: в смешанной арифметике и при делении
+                raise ExecutionError(f"Numeric overflow in operation {expr.op}") from None
+        return not self.evaluate(expr.operand, env)
+
+
+def run_program(program: Program, inputs=()) -> list:
+    """Вывод программы - по кортежу значений на каждый write"""
+    return Interpreter(program).run(inputs).rows
+
+
+# ---------- Пакетное исполнение ----------
+BatchResult = namedtuple("BatchResult", ["sink", "error"])    # error - ExecutionError или None
+
+# Целые в пакете - int64. Наборы, где значение может выйти за его пределы (или где
+# сравнение и деление через float64 могут разойтись с точной арифметикой int Python),
+# снимаются с пакета и исполняются заново скалярно; границы проверок взяты с запасом
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+INT_SAFE = 2 ** 62      # произведение меньше по модулю (оценка в float64) не переполняется
+FLOAT_EXACT = 2 ** 53   # целые не больше по модулю точно представимы в float64
+
+
+def int_constants_fit(node) -> bool:
+    """Все целые константы дерева node помещаются в int64"""
+    kind = type(node)
+    if kind is Const:
+        return type(node.value) is not int or INT64_MIN <= node.value <= INT64_MAX
+    if kind is Var:
+        return True
+    if kind is Unary:
+        return int_constants_fit(node.operand)
+    if kind is Binary:
+        return int_constants_fit(node.left) and int_constants_fit(node.right)
+    if kind is Block:
+        return all(int_constants_fit(statement) for statement in node.statements)
+    if kind is Assign:
+        return int_constants_fit(node.expr)
+    if kind is If:
+        return (int_constants_fit(node.cond) and int_constants_fit(node.then)
+                and (node.otherwise is None or int_constants_fit(node.otherwise)))
+    if kind is While:
+        return int_constants_fit(node.cond) and int_constants_fit(node.body)
+    if kind is For:
+        return int_constants_fit(node.start) and int_constants_fit(node.stop) and int_constants_fit(node.body)
+    if kind is Read:
+        return True
+    return all(int_constants_fit(expr) for expr in node.exprs)
+
+
+class ReplaySink:
+    """
+    Приемник набора в пакетном режиме: считает строки вывода. Набор, снятый с пакета,
+    исполняется заново с skip - числом уже выведенных строк: их он выводит так же и
+    повторно не передает
+    """
+
+    def __init__(self, sink, skip=0):
+        self.sink = sink
+        self.skip = skip
+        self.rows = 0
+
+    @property
+    def written(self):
+        # пропускаемый вывод уже прошел проверки памяти при исполнении в пакете
+        return getattr(self.sink, "written", 0) if self.rows >= self.skip else 0
+
+    def write(self, row):
+        self.rows += 1
+        if self.rows > self.skip:
+            self.sink.write(row)
+
+    def flush(self):
+        self.sink.flush()
+
+
+def _numpy():
+    """NumPy - необязательная зависимость: без него пакет исполняется скалярно"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class BatchInterpreter:
+    """
+    Исполнение одной программы сразу на n наборах входных данных. Переменные - массивы
+    длины n, операторы исполняются под маской активных наборов: присваивание меняет
+    только элементы под маской, if делит маску по условию, while повторяет тело, пока
+    условие истинно хотя бы для одного набора.
+
+    Когда в цикле остаётся не больше scalar_threshold * n активных наборов, операции над
+    целыми массивами становятся дороже скалярного исполнения, и цикл для оставшихся
+    наборов дорабатывает Interpreter, после чего их значения возвращаются в массивы.
+
+    Ограничения limits действуют на каждый набор отдельно, кроме времени: оно
+    отсчитывается от начала всего пакета.
+
+    Целые хранятся в int64. Набор, где целое может выйти за пределы int64 (константа,
+    ввод, результат операции или перевод float в целое), снимается с пакета и после
+    него исполняется Interpreter с начала; уже выведенные им строки не повторяются.
+    Программа с целыми константами вне int64 исполняется скалярно целиком.
+    """
+
+    def __init__(self, program: Program, scalar_threshold=0.05, limits: Limits = None):
+        self.np = _numpy()
+        self.program = program
+        self.limits = limits
+        self.scalar = Interpreter(program, limits)
+        self.loop_costs = self.scalar.loop_costs
+        self.scalar_threshold = scalar_threshold
+        self.dispatch = {
+            Block: self.exec_block, Assign: self.exec_assign, If: self.exec_if,
+            While: self.exec_while, For: self.exec_for, Read: self.exec_read, Write: self.exec_write,
+        }
+        if self.np is not None:
+            np = self.np
+            self.dtypes = {"%": np.int64, "!": np.float64, "$": np.bool_}
+        self.vectorised = self.np is not None and int_constants_fit(program.body)
+
+    def run(self, sources, sinks=None) -> list:
+        """
+        Исполняет программу для каждого источника ввода из sources (InputBuffer или
+        последовательность значений); sinks - приемники вывода по наборам (по умолчанию
+        CollectSink). Возвращает BatchResult по каждому набору; при ошибке в приемнике
+        остается вывод, сделанный до нее.
+        """
+        sources = [as_source(source) for source in sources]
+        sinks = [CollectSink() for _ in sources] if sinks is None else list(sinks)
+        if not self.vectorised:
+            return [self._run_scalar(source, sink) for source, sink in zip(sources, sinks)]
+        np = self.np
+        n = len(sources)
+        self.n = n
+        self.sources = sources
+        self.sinks = [ReplaySink(sink) for sink in sinks]
+        starts = [source.position for source in sources]
+        self.positions = np.array([source.position for source in sources], dtype=np.int64)
+        self.lengths = np.array([len(source.values) for source in sources], dtype=np.int64)
+        self.alive = np.ones(n, dtype=bool)
+        self.errors = [None] * n
+        self.escaped = np.zeros(n, dtype=bool)
+        self.instructions = np.zeros(n, dtype=np.int64)
+        self.started = time.monotonic()
+        self.env = {name: np.zeros(n, dtype=self.dtypes[kind]) for name, kind in self.program.variables.items()}
+        try:
+            with np.errstate(all="ignore"):
+                self.execute(self.program.body, self.alive.copy())
+        finally:
+            for source, position, sink in zip(sources, self.positions.tolist(), sinks):
+                source.position = position
+                sink.flush()
+        results = [BatchResult(sink, error) for sink, error in zip(sinks, self.errors)]
+        for lane in np.flatnonzero(self.escaped).tolist():
+            sources[lane].position = starts[lane]
+            result = self._run_scalar(sources[lane], ReplaySink(sinks[lane], self.sinks[lane].rows))
+            results[lane] = BatchResult(sinks[lane], result.error)
+        return results
+
+    def _run_scalar(self, source, sink):
+        try:
+            return BatchResult(self.scalar.run(source, sink), None)
+        except ExecutionError as e:
+            return BatchResult(sink, e)
+
+    def fail(self, lanes, error):
+        """Снимает наборы lanes (маска) с исполнения; error - ошибка или функция номера набора"""
+        for lane in self.np.flatnonzero(lanes).tolist():
+            self.errors[lane] = error(lane) if callable(error) else error
+        self.alive &= ~lanes
+
+    def escape(self, risky, mask):
+        """Снимает с пакета наборы из mask, где risky: они будут исполнены скалярно"""
+        if not risky.any():
+            return
+        lanes = mask & self.alive & risky
+        if lanes.any():
+            self.escaped |= lanes
+            self.alive &= ~lanes
+
+    def charge(self, cost, active):
+        """Обратная дуга цикла для наборов active: те же проверки, что в Budget.charge"""
+        limits = self.limits
+        if limits is None:
+            return
+        np = self.np
+        active = active & self.alive
+        instructions = self.instructions
+        instructions[active] += cost
+        if limits.instructions is not None:
+            over = active & (instructions > limits.instructions)
+            if over.any():
+                self.fail(over, lambda lane: LimitExceeded("instructions", int(instructions[lane]),
+                                                           limits.instructions))
+        if limits.seconds is not None:
+            elapsed = time.monotonic() - self.started
+            if elapsed > limits.seconds:
+                self.fail(self.alive.copy(), LimitExceeded("seconds", round(elapsed, 3), limits.seconds))
+        if limits.memory is not None:
+            # та же оценка, что у Interpreter: по значениям переменных набора как объектам Python
+            for lane in np.flatnonzero(active & self.alive).tolist():
+                env = {name: values[lane].item() for name, values in self.env.items()}
+                used = memory_estimate(env, self.sinks[lane])
+                if used > limits.memory:
+                    self.errors[lane] = LimitExceeded("memory", used, limits.memory)
+                    self.alive[lane] = False
+
+    def execute(self, statement, mask):
+        self.dispatch[type(statement)](statement, mask)
+
+    def exec_block(self, block, mask):
+        for statement in block.statements:
+            mask = mask & self.alive
+            if not mask.any():
+                return
+            self.dispatch[type(statement)](statement, mask)
+
+    def assign(self, name, value, mask):
+        np = self.np
+        target = self.env[name]
+        value = np.asarray(value)
+        if target.dtype == np.int64 and value.dtype.kind == "f":
+            # int(inf), int(nan) и целые вне int64 - в скалярном исполнении
+            self.escape(~(np.abs(value) < INT64_MAX), mask)
+        value = value.astype(target.dtype)
+        self.env[name] = np.where(mask & self.alive, value, target)
+
+    def exec_assign(self, statement, mask):
+        self.assign(statement.name, self.evaluate(statement.expr, mask), mask)
+
+    def truth(self, value, mask):
+        return mask & self.alive & self.np.asarray(value).astype(bool)
+
+    def exec_if(self, statement, mask):
+        cond = self.truth(self.evaluate(statement.cond, mask), mask)
+        if cond.any():
+            self.execute(statement.then, cond)
+        if statement.otherwise is not None:
+            rest = mask & self.alive & ~cond
+            if rest.any():
+                self.execute(statement.otherwise, rest)
+
+    def loop(self, statement, cond_of, body, finish, mask):
+        """
+        Общий цикл while/for: cond_of(active) - условие продолжения, body(active) - итерация,
+        finish(lane, state) - скалярное продолжение цикла для одного набора
+        """
+        cost = self.loop_costs[id(statement)]
+        active = mask
+        while True:
+            active = self.truth(cond_of(active), active)
+            count = int(active.sum())
+            if count == 0:
+                return
+            if count <= self.scalar_threshold * self.n:
+                self.finish_scalar(finish, active)
+                return
+            body(active)
+            self.charge(cost, active)
+
+    def exec_while(self, statement, mask):
+        self.loop(statement, lambda active: self.evaluate(statement.cond, active),
+                  lambda active: self.execute(statement.body, active),
+                  lambda lane, state: self.scalar.exec_while(statement, state), mask)
+
+    def exec_for(self, statement, mask):
+        np = self.np
+        name = statement.name
+        self.assign(name, self.evaluate(statement.start, mask), mask)
+        stop = np.broadcast_to(self.evaluate(statement.stop, mask), (self.n,)).copy()
+        if {stop.dtype.kind, self.env[name].dtype.kind} == {"i", "f"}:
+            # сравнение целого с float, как в evaluate; переменная растет до stop + 1
+            self.escape(~((-FLOAT_EXACT < stop) & (stop < FLOAT_EXACT)), mask)
+        increment = Binary("+", Var(name), Const(1))
+
+        def step(active):
+            self.execute(statement.body, active)
+            self.assign(name, self.evaluate(increment, active), active)
+
+        def finish(lane, state):
+            # граница - вычисленная при входе в цикл
+            self.scalar.continue_for(statement, stop[lane].item(), state)
+
+        self.loop(statement, lambda active: self.env[name] <= stop, step, finish, mask)
+
+    def finish_scalar(self, finish, active):
+        """Дорабатывает цикл скалярно для каждого набора из маски active"""
+        for lane in self.np.flatnonzero(active).tolist():
+            env = {name: values[lane].item() for name, values in self.env.items()}
+            source = self.sources[lane]
+            source.position = int(self.positions[lane])
+            budget = None
+            if self.limits is not None:
+                budget = Budget(self.limits, int(self.instructions[lane]), self.started)
+            try:
+                finish(lane, ScalarState(env, source, self.sinks[lane], budget))
+            except ExecutionError as e:
+                self.errors[lane] = e
+                self.alive[lane] = False
+            else:
+                if any(type(value) is int and not INT64_MIN <= value <= INT64_MAX for value in env.values()):
+                    self.escaped[lane] = True
+                    self.alive[lane] = False
+                else:
+                    for name, value in env.items():
+                        self.env[name][lane] = value
+            self.positions[lane] = source.position
+            if budget is not None:
+                self.instructions[lane] = budget.instructions
+
+    def exec_read(self, statement, mask):
+        np = self.np
+        for name in statement.names:
+            mask = mask & self.alive
+            exhausted = mask & (self.positions >= self.lengths)
+            if exhausted.any():
+                self.fail(exhausted, ExecutionError("Input exhausted"))
+                mask = mask & ~exhausted
+            lanes = np.flatnonzero(mask)
+            if not len(lanes):
+                return
+            kind = self.program.variables[name]
+            positions = self.positions[lanes].tolist()
+            values = []
+            for lane, position in zip(lanes.tolist(), positions):
+                try:
+                    value = coerce_value(kind, name, self.sources[lane].values[position])
+                except ExecutionError as e:
+                    # как в скалярном исполнении: набор останавливается, значение не прочитано
+                    self.errors[lane] = e
+                    self.alive[lane] = False
+                    continue
+                if type(value) is int and not INT64_MIN <= value <= INT64_MAX:
+                    self.escaped[lane] = True
+                    self.alive[lane] = False
+                    continue
+                values.append(value)
+            if not self.alive[lanes].all():
+                lanes = lanes[self.alive[lanes]]
+            target = self.env[name].copy()
+            target[lanes] = np.array(values, dtype=target.dtype)
+            self.env[name] = target
+            self.positions[lanes] += 1
+
+    def exec_write(self, statement, mask):
+        np = self.np
+        values = [np.broadcast_to(self.evaluate(expr, mask), (self.n,)) for expr in statement.exprs]
+        mask = mask & self.alive
+        lanes = np.flatnonzero(mask)
+        columns = [column[lanes].tolist() for column in values]
+        sinks = self.sinks
+        for lane, row in zip(lanes.tolist(), zip(*columns)):
+            sinks[lane].write(row)
+
+    def evaluate(self, expr, mask):
+        """Значение выражения по всем наборам (вне маски - произвольное)"""
+        np = self.np
+        kind = type(expr)
+        if kind is Var:
+            return self.env[expr.name]
+        if kind is Const:
+            return np.asarray(expr.value)
+        if kind is Unary:
+            return np.logical_not(self.evaluate(expr.operand, mask))
+        left = self.evaluate(expr.left, mask)
+        right = self.evaluate(expr.right, mask)
+        op = expr.op
+        kinds = {left.dtype.kind, right.dtype.kind}
+        if op in ("+", "-", "*"):
+            # логические значения в арифметике - 0/1, как у bool в Python
+            if left.dtype == bool:
+                left = left.astype(np.int64)
+            if right.dtype == bool:
+                right = right.astype(np.int64)
+            exact = left.dtype.kind == "i" and right.dtype.kind == "i"
+            if op == "+":
+                result = left + right
+                if exact:
+                    # переполнение: знак суммы отличается от знаков обоих слагаемых
+                    self.escape(((left ^ result) & (right ^ result)) < 0, mask)
+            elif op == "-":
+                result = left - right
+                if exact:
+                    self.escape(((left ^ right) & (left ^ result)) < 0, mask)
+            else:
+                result = left * right
+                if exact:
+                    self.escape(~(np.abs(np.multiply(left, right, dtype=np.float64)) < INT_SAFE), mask)
+            return result
+        if op == "/":
+            zero = mask & self.alive & (right == 0)
+            if zero.any():
+                self.fail(zero, ExecutionError("Division by zero"))
+            if kinds == {"i"}:
+                # int / int в Python - точное частное, округленное один раз
+                self.escape(self.inexact(left) | self.inexact(right), mask)
+            return np.true_divide(left, right)
+        if op in RELATIONS and kinds == {"i", "f"}:
+            # Python сравнивает целое с float точно, NumPy - после перевода целого в float64
+            self.escape(self.inexact(left) | self.inexact(right), mask)
+        if op == "and":
+            return np.logical_and(left, right)
+        if op == "or":
+            return np.logical_or(left, right)
+        if op == "=":
+            return left == right
+        if op == "<":
+            return left < right
+        if op == ">":
+            return left > right
+        if op == "<=":
+            return left <= right
+        return left >= right
+
+    def inexact(self, values):
+        """Целые значения, не представимые в float64 точно (для float - False)"""
+        np = self.np
+        if values.dtype.kind != "i":
+            return np.zeros(values.shape, dtype=bool)
+        # модуль INT64_MIN в int64 отрицателен, а как uint64 он равен 2 ** 63
+        return np.abs(values).view(np.uint64) > FLOAT_EXACT
+
+
+def run_batch(program: Program, sources, sinks=None, scalar_threshold=0.05, limits: Limits = None) -> list:
+    return BatchInterpreter(program, scalar_threshold, limits).run(sources, sinks)
+
+
+if __name__ == '__main__':
+    # python tyap_runtime.py program.tyap < input.txt
+    import sys
+
+    with open(sys.argv[1], encoding="utf-8") as f:
+        compiled = compile_program(f.read())
+    try:
+        Interpreter(compiled).run(InputBuffer.from_stream(sys.stdin), OutputBuffer(sys.stdout))
+    except ExecutionError as e:
+        sys.stdout.flush()
+        print(f"[RUNTIME] {e}", file=sys.stderr)
+        sys.exit(1)
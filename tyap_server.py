@@ -0,0 +1,252 @@
+# Резидентный сервис: лексический и синтаксический анализ программ по запросам
+#
+# Грамматика компилируется один раз при старте, запросы принимаются построчно в JSON
+# (stdin/stdout, unix-сокет или TCP на localhost), работа выполняется в пуле процессов.
+# С --cache результаты lex/parse сохраняются на диске (tyap_cache) и для уже
+# встречавшихся программ не вычисляются заново.
+#
+# Запрос:  {"id": 1, "op": "lex" | "parse", "program": "program var ... end."}
+#          {"id": 1, "op": "run", "program": "...", "input": "3 4",
+#           "limits": {"instructions": 1000000, "seconds": 1, "memory": 1048576}}
+# Ответ:   {"id": 1, "ok": true, "tokens": [...], "identifiers": {...}, "constants": [...],
+#           "parse": [[lhs, rhs], ...]}
+#          {"id": 1, "ok": true, "output": "7\n"}
+#          {"id": 1, "ok": false, "error": "...", "limit": "instructions"}
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing.util
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from tyap import (LANGUAGE_GRAMMAR, LALR1Parser, LexerFA, SharedParserTables, load_language_descent,
+                  load_language_parser)
+from tyap_cache import FrontendCache, frontend_namespace
+from tyap_runtime import (ExecutionError, InputBuffer, Interpreter, LimitExceeded, Limits, OutputBuffer,
+                          compile_program)
+
+ENGINES = ("lalr", "ll1", "descent")
+# политика разрешения конфликтов таблицы каждого анализатора (входит в пространство имен кэша)
+ENGINE_CONFLICT_POLICY = {"lalr": "yacc", "ll1": "dangling_else", "descent": "dangling_else"}
+
+# ограничения op "run": программы исполняются в общих процессах пула, поэтому бесконечный
+# цикл должен завершаться ошибкой, а не занимать процесс; запрос может только уменьшить их
+RUN_LIMITS = Limits(instructions=10 ** 7, seconds=10.0, memory=64 * 2 ** 20)
+
+# Состояние процесса-обработчика: заполняется один раз (init_worker)
+_lexer = None
+_parser = None
+_cache = None
+
+
+def build_parser(engine: str):
+    """Компилирует анализатор языка; отладочный вывод преобразований уходит в stderr"""
+    conflict_policy = ENGINE_CONFLICT_POLICY[engine]
+    with contextlib.redirect_stdout(sys.stderr):
+        if engine == "ll1":
+            # сжатая таблица: процессы пула держат меньше памяти
+            parser = load_language_parser(conflict_policy)
+            parser.compress_table()
+            return parser
+        if engine == "descent":
+            return load_language_descent(conflict_policy)
+        return LALR1Parser(LANGUAGE_GRAMMAR, conflict_policy)
+
+
+def init_worker(engine: str, shared_name: str = None, cache_path: str = None, cache_bytes: int = None):
+    """
+    Инициализатор пула: при fork анализатор уже унаследован от родителя, при spawn
+    таблицы ll1 подключаются из разделяемой памяти, остальные движки строятся заново.
+    Кэш каждый процесс открывает сам: соединение SQLite не наследуется. При завершении
+    процесса кэш закрывается (записываются накопленные времена обращений): процессы пула
+    завершаются через os._exit, поэтому используется финализатор multiprocessing, а не atexit.
+    """
+    global _lexer, _parser, _cache
+    if _parser is None:
+        _parser = SharedParserTables.attach(shared_name) if shared_name else build_parser(engine)
+    _lexer = LexerFA(verbose=False)
+    if cache_path is not None:
+        _cache = FrontendCache(cache_path, frontend_namespace(engine, ENGINE_CONFLICT_POLICY[engine]), cache_bytes)
+        multiprocessing.util.Finalize(_cache, _cache.close, exitpriority=10)
+
+
+def process_request(request: dict) -> dict:
+    """Обработка одного запроса в процессе пула (только CPU-работа, без ввода-вывода)"""
+    response = {"id": request.get("id")}
+    op = request.get("op", "parse")
+    program = request.get("program")
+    if op not in ("lex", "parse", "run"):
+        return {**response, "ok": False, "error": f"Unknown op: {op}"}
+    if not isinstance(program, str):
+        return {**response, "ok": False, "error": "Field 'program' must be a string"}
+    if op == "run":
+        return run_request(request, response)
+
+    try:
+        if _cache is not None:
+            lexed, parse, error = _cache.analyze(program, _lexer, _parser if op == "parse" else None)
+        else:
+            lexed, parse, error = _lexer.tokenize(program), None, None
+        response["tokens"] = lexed.tokens
+        response["identifiers"] = {str(idx): name for idx, name in lexed.identifier_table.items()}
+        response["constants"] = lexed.constants
+        if op == "parse":
+            if _cache is None:
+                parse = _parser.parse(lexed.tokens)
+            elif error is not None:
+                raise SyntaxError(error)
+            response["parse"] = [[lhs, list(rhs)] for lhs, rhs in parse]
+    except SyntaxError as e:
+        return {**response, "ok": False, "error": str(e)}
+    except RecursionError:
+        return {**response, "ok": False, "error": "Program is nested too deeply"}
+    response["ok"] = True
+    return response
+
+
+def request_limits(request: dict) -> Limits:
+    requested = request.get("limits")
+    if not isinstance(requested, dict):
+        return RUN_LIMITS
+    limits = {}
+    for field, default in zip(Limits._fields, RUN_LIMITS):
+        value = requested.get(field)
+        limits[field] = min(value, default) if isinstance(value, (int, float)) and value >= 0 else default
+    return Limits(**limits)
+
+
+def run_request(request: dict, response: dict) -> dict:
+    """Исполнение программы; при ошибке в output остается вывод, сделанный до нее"""
+    output = io.StringIO()
+    try:
+        source = InputBuffer.from_text(str(request.get("input", "")))
+        program = compile_program(request["program"], _lexer)
+        Interpreter(program, request_limits(request)).run(source, OutputBuffer(output))
+    except (SyntaxError, ExecutionError) as e:
+        response = {**response, "ok": False, "error": str(e), "output": output.getvalue()}
+        if isinstance(e, LimitExceeded):
+            response["limit"] = e.limit
+        return response
+    except RecursionError:
+        return {**response, "ok": False, "error": "Program is nested too deeply", "output": output.getvalue()}
+    return {**response, "ok": True, "output": output.getvalue()}
+
+
+class Server:
+    def __init__(self, engine: str = "lalr", workers: int = None, cache_path: str = None,
+                 cache_bytes: int = 256 * 2 ** 20):
+        global _parser
+        _parser = build_parser(engine)
+        self.shared = SharedParserTables(_parser) if engine == "ll1" else None
+        self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=init_worker,
+                                        initargs=(engine, self.shared and self.shared.name, cache_path,
+                                                  cache_bytes))
+
+    async def handle_line(self, line: bytes) -> bytes:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            response = {"id": None, "ok": False, "error": f"Bad request: {e}"}
+        else:
+            loop = asyncio.get_running_loop()
+            try:
+                response = await loop.run_in_executor(self.pool, process_request, request)
+            except Exception as e:
+                # сбой процесса пула или непредвиденное исключение: ответ получает только этот запрос
+                response = {"id": request.get("id"), "ok": False, "error": f"Internal error: {e!r}"}
+        return json.dumps(response, ensure_ascii=False).encode() + b"\n"
+
+    async def serve_stream(self, reader: asyncio.StreamReader, write):
+        """
+        Читает запросы построчно и обрабатывает их параллельно; ответы пишутся по мере
+        готовности (соответствие запросу - по полю id).
+        """
+        pending = set()
+        lock = asyncio.Lock()
+
+        async def respond(line):
+            data = await self.handle_line(line)
+            async with lock:
+                await write(data)
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(respond(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def serve_stdio(self):
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=2 ** 26)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        stdout = sys.stdout.buffer
+
+        async def write(data):
+            stdout.write(data)
+            stdout.flush()
+
+        await self.serve_stream(reader, write)
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def write(data):
+            writer.write(data)
+            await writer.drain()
+
+        try:
+            await self.serve_stream(reader, write)
+        finally:
+            writer.close()
+
+    async def serve_socket(self, path: str = None, port: int = None):
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle_client, path=path, limit=2 ** 26)
+        else:
+            server = await asyncio.start_server(self.handle_client, host="127.0.0.1", port=port, limit=2 ** 26)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.pool.shutdown()
+        if self.shared is not None:
+            self.shared.close()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Сервис лексического и синтаксического анализа")
+    arg_parser.add_argument("--engine", choices=ENGINES, default="lalr",
+                            help="анализатор: lalr - по исходной грамматике, ll1 - по преобразованной, "
+                                 "descent - сгенерированный по ней рекурсивный спуск")
+    arg_parser.add_argument("--workers", type=int, default=None, help="число процессов пула")
+    arg_parser.add_argument("--cache", help="файл кэша результатов lex/parse (SQLite)")
+    arg_parser.add_argument("--cache-size", type=int, default=256,
+                            help="предельный размер кэша, МБ (вытесняются давно не использованные)")
+    transport = arg_parser.add_mutually_exclusive_group()
+    transport.add_argument("--socket", help="путь к unix-сокету (по умолчанию stdin/stdout)")
+    transport.add_argument("--port", type=int, help="TCP-порт на 127.0.0.1")
+    args = arg_parser.parse_args(argv)
+
+    server = Server(args.engine, args.workers, args.cache, args.cache_size * 2 ** 20)
+    try:
+        if args.socket is not None or args.port is not None:
+            asyncio.run(server.serve_socket(args.socket, args.port))
+        else:
+            asyncio.run(server.serve_stdio())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,775 @@
+# Сгенерировано: python tyap.py --generate-tables. Не редактировать вручную.
+
+GRAMMAR_HASH = '35c9cfcf'
+
+CONFLICT_POLICY = 'dangling_else'
+
+START_SYMBOL = 'программа'
+
+NONTERMINALS = ['программа',
+ 'описание_хвост',
+ 'тип',
+ 'тело',
+ 'оператор_список',
+ 'оператор',
+ 'ввода_хвост',
+ 'вывода_хвост',
+ 'выражение',
+ 'знак_сравнения',
+ 'сумма_хвост',
+ 'операция_сложения',
+ 'произведение_хвост',
+ 'операция_умножения',
+ 'множитель',
+ 'текст_комментария',
+ 'символ',
+ 'оператор_fact0',
+ 'выражение_fact0']
+
+TERMINALS = ['program',
+ 'var',
+ 'идентификатор',
+ ';',
+ '.',
+ '{',
+ '}',
+ ',',
+ ':',
+ '%',
+ '!',
+ '$',
+ 'begin',
+ 'end',
+ 'ass',
+ 'while',
+ 'do',
+ 'for',
+ 'to',
+ 'read',
+ '(',
+ ')',
+ 'write',
+ 'if',
+ 'then',
+ 'not',
+ '=',
+ '<',
+ '>',
+ '<=',
+ '>=',
+ '+',
+ '-',
+ 'or',
+ '*',
+ '/',
+ 'and',
+ 'число',
+ 'true',
+ 'false',
+ 'a',
+ 'b',
+ 'c',
+ 'd',
+ 'e',
+ 'f',
+ 'g',
+ 'h',
+ 'i',
+ 'j',
+ 'k',
+ 'l',
+ 'm',
+ 'n',
+ 'o',
+ 'p',
+ 'q',
+ 'r',
+ 's',
+ 't',
+ 'u',
+ 'v',
+ 'w',
+ 'x',
+ 'y',
+ 'z',
+ 'A',
+ 'B',
+ 'C',
+ 'D',
+ 'E',
+ 'F',
+ 'G',
+ 'H',
+ 'I',
+ 'J',
+ 'K',
+ 'L',
+ 'M',
+ 'N',
+ 'O',
+ 'P',
+ 'Q',
+ 'R',
+ 'S',
+ 'T',
+ 'U',
+ 'V',
+ 'W',
+ 'X',
+ 'Y',
+ 'Z',
+ '0',
+ '1',
+ '2',
+ '3',
+ '4',
+ '5',
+ '6',
+ '7',
+ '8',
+ '9',
+ '_',
+ ' ',
+ '\t',
+ '\n',
+ 'else']
+
+PRODUCTIONS = {'программа': [['program', 'var', 'идентификатор', 'описание_хвост', ';', 'тело', '.'],
+               ['{', 'текст_комментария', '}', 'program', 'var', 'идентификатор', 'описание_хвост', ';', 'тело', '.']],
+ 'описание_хвост': [[',', 'идентификатор', 'описание_хвост'], [':', 'тип']],
+ 'тип': [['%'], ['!'], ['$']],
+ 'тело': [['begin', 'оператор_список', 'end'], ['{', 'текст_комментария', '}', 'begin', 'оператор_список', 'end']],
+ 'оператор_список': [['оператор', ';', 'оператор_список'], []],
+ 'оператор': [['идентификатор', 'ass', 'выражение'],
+              ['while', 'выражение', 'do', 'оператор'],
+              ['for', 'идентификатор', 'ass', 'выражение', 'to', 'выражение', 'do', 'оператор'],
+              ['begin', 'оператор_список', 'end'],
+              ['read', '(', 'идентификатор', 'ввода_хвост', ')'],
+              ['write', '(', 'выражение', 'вывода_хвост', ')'],
+              ['{', 'текст_комментария', '}'],
+              ['if', 'выражение', 'then', 'оператор', 'оператор_fact0']],
+ 'ввода_хвост': [[',', 'идентификатор', 'ввода_хвост'], []],
+ 'вывода_хвост': [[',', 'выражение', 'вывода_хвост'], []],
+ 'выражение': [['not', 'множитель'], ['множитель', 'произведение_хвост', 'сумма_хвост', 'выражение_fact0']],
+ 'знак_сравнения': [['='], ['<'], ['>'], ['<='], ['>=']],
+ 'сумма_хвост': [['операция_сложения', 'множитель', 'произведение_хвост', 'сумма_хвост'], []],
+ 'операция_сложения': [['+'], ['-'], ['or']],
+ 'произведение_хвост': [['операция_умножения', 'множитель', 'произведение_хвост'], []],
+ 'операция_умножения': [['*'], ['/'], ['and']],
+ 'множитель': [['идентификатор'], ['число'], ['(', 'выражение', ')'], ['true'], ['false']],
+ 'текст_комментария': [['символ', 'текст_комментария'], []],
+ 'символ': [['a'],
+            ['b'],
+            ['c'],
+            ['d'],
+            ['e'],
+            ['f'],
+            ['g'],
+            ['h'],
+            ['i'],
+            ['j'],
+            ['k'],
+            ['l'],
+            ['m'],
+            ['n'],
+            ['o'],
+            ['p'],
+            ['q'],
+            ['r'],
+            ['s'],
+            ['t'],
+            ['u'],
+            ['v'],
+            ['w'],
+            ['x'],
+            ['y'],
+            ['z'],
+            ['A'],
+            ['B'],
+            ['C'],
+            ['D'],
+            ['E'],
+            ['F'],
+            ['G'],
+            ['H'],
+            ['I'],
+            ['J'],
+            ['K'],
+            ['L'],
+            ['M'],
+            ['N'],
+            ['O'],
+            ['P'],
+            ['Q'],
+            ['R'],
+            ['S'],
+            ['T'],
+            ['U'],
+            ['V'],
+            ['W'],
+            ['X'],
+            ['Y'],
+            ['Z'],
+            ['0'],
+            ['1'],
+            ['2'],
+            ['3'],
+            ['4'],
+            ['5'],
+            ['6'],
+            ['7'],
+            ['8'],
+            ['9'],
+            ['_'],
+            [' '],
+            ['\t'],
+            ['\n']],
+ 'оператор_fact0': [['else', 'оператор'], []],
+ 'выражение_fact0': [['знак_сравнения', 'множитель', 'произведение_хвост', 'сумма_хвост'], []]}
+
+FIRST = {'program': ['program'],
+ 'var': ['var'],
+ 'идентификатор': ['идентификатор'],
+ ';': [';'],
+ '.': ['.'],
+ '{': ['{'],
+ '}': ['}'],
+ ',': [','],
+ ':': [':'],
+ '%': ['%'],
+ '!': ['!'],
+ '$': ['$'],
+ 'begin': ['begin'],
+ 'end': ['end'],
+ 'ass': ['ass'],
+ 'while': ['while'],
+ 'do': ['do'],
+ 'for': ['for'],
+ 'to': ['to'],
+ 'read': ['read'],
+ '(': ['('],
+ ')': [')'],
+ 'write': ['write'],
+ 'if': ['if'],
+ 'then': ['then'],
+ 'not': ['not'],
+ '=': ['='],
+ '<': ['<'],
+ '>': ['>'],
+ '<=': ['<='],
+ '>=': ['>='],
+ '+': ['+'],
+ '-': ['-'],
+ 'or': ['or'],
+ '*': ['*'],
+ '/': ['/'],
+ 'and': ['and'],
+ 'число': ['число'],
+ 'true': ['true'],
+ 'false': ['false'],
+ 'a': ['a'],
+ 'b': ['b'],
+ 'c': ['c'],
+ 'd': ['d'],
+ 'e': ['e'],
+ 'f': ['f'],
+ 'g': ['g'],
+ 'h': ['h'],
+ 'i': ['i'],
+ 'j': ['j'],
+ 'k': ['k'],
+ 'l': ['l'],
+ 'm': ['m'],
+ 'n': ['n'],
+ 'o': ['o'],
+ 'p': ['p'],
+ 'q': ['q'],
+ 'r': ['r'],
+ 's': ['s'],
+ 't': ['t'],
+ 'u': ['u'],
+ 'v': ['v'],
+ 'w': ['w'],
+ 'x': ['x'],
+ 'y': ['y'],
+ 'z': ['z'],
+ 'A': ['A'],
+ 'B': ['B'],
+ 'C': ['C'],
+ 'D': ['D'],
+ 'E': ['E'],
+ 'F': ['F'],
+ 'G': ['G'],
+ 'H': ['H'],
+ 'I': ['I'],
+ 'J': ['J'],
+ 'K': ['K'],
+ 'L': ['L'],
+ 'M': ['M'],
+ 'N': ['N'],
+ 'O': ['O'],
+ 'P': ['P'],
+ 'Q': ['Q'],
+ 'R': ['R'],
+ 'S': ['S'],
+ 'T': ['T'],
+ 'U': ['U'],
+ 'V': ['V'],
+ 'W': ['W'],
+ 'X': ['X'],
+ 'Y': ['Y'],
+ 'Z': ['Z'],
+ '0': ['0'],
+ '1': ['1'],
+ '2': ['2'],
+ '3': ['3'],
+ '4': ['4'],
+ '5': ['5'],
+ '6': ['6'],
+ '7': ['7'],
+ '8': ['8'],
+ '9': ['9'],
+ '_': ['_'],
+ ' ': [' '],
+ '\t': ['\t'],
+ '\n': ['\n'],
+ 'else': ['else'],
+ 'программа': ['program', '{'],
+ 'описание_хвост': [',', ':'],
+ 'тип': ['!', '$', '%'],
+ 'тело': ['begin', '{'],
+ 'оператор_список': ['begin', 'for', 'if', 'read', 'while', 'write', '{', 'ε', 'идентификатор'],
+ 'оператор': ['begin', 'for', 'if', 'read', 'while', 'write', '{', 'идентификатор'],
+ 'ввода_хвост': [',', 'ε'],
+ 'вывода_хвост': [',', 'ε'],
+ 'выражение': ['(', 'false', 'not', 'true', 'идентификатор', 'число'],
+ 'множитель': ['(', 'false', 'true', 'идентификатор', 'число'],
+ 'знак_сравнения': ['<', '<=', '=', '>', '>='],
+ 'сумма_хвост': ['+', '-', 'or', 'ε'],
+ 'операция_сложения': ['+', '-', 'or'],
+ 'произведение_хвост': ['*', '/', 'and', 'ε'],
+ 'операция_умножения': ['*', '/', 'and'],
+ 'текст_комментария': ['\t',
+                       '\n',
+                       ' ',
+                       '0',
+                       '1',
+                       '2',
+                       '3',
+                       '4',
+                       '5',
+                       '6',
+                       '7',
+                       '8',
+                       '9',
+                       'A',
+                       'B',
+                       'C',
+                       'D',
+                       'E',
+                       'F',
+                       'G',
+                       'H',
+                       'I',
+                       'J',
+                       'K',
+                       'L',
+                       'M',
+                       'N',
+                       'O',
+                       'P',
+                       'Q',
+                       'R',
+                       'S',
+                       'T',
+                       'U',
+                       'V',
+                       'W',
+                       'X',
+                       'Y',
+                       'Z',
+                       '_',
+                       'a',
+                       'b',
+                       'c',
+                       'd',
+                       'e',
+                       'f',
+                       'g',
+                       'h',
+                       'i',
+                       'j',
+                       'k',
+                       'l',
+                       'm',
+                       'n',
+                       'o',
+                       'p',
+                       'q',
+                       'r',
+                       's',
+                       't',
+                       'u',
+                       'v',
+                       'w',
+                       'x',
+                       'y',
+                       'z',
+                       'ε'],
+ 'символ': ['\t',
+            '\n',
+            ' ',
+            '0',
+            '1',
+            '2',
+            '3',
+            '4',
+            '5',
+            '6',
+            '7',
+            '8',
+            '9',
+            'A',
+            'B',
+            'C',
+            'D',
+            'E',
+            'F',
+            'G',
+            'H',
+            'I',
+            'J',
+            'K',
+            'L',
+            'M',
+            'N',
+            'O',
+            'P',
+            'Q',
+            'R',
+            'S',
+            'T',
+            'U',
+            'V',
+            'W',
+            'X',
+            'Y',
+            'Z',
+            '_',
+            'a',
+            'b',
+            'c',
+            'd',
+            'e',
+            'f',
+            'g',
+            'h',
+            'i',
+            'j',
+            'k',
+            'l',
+            'm',
+            'n',
+            'o',
+            'p',
+            'q',
+            'r',
+            's',
+            't',
+            'u',
+            'v',
+            'w',
+            'x',
+            'y',
+            'z'],
+ 'оператор_fact0': ['else', 'ε'],
+ 'выражение_fact0': ['<', '<=', '=', '>', '>=', 'ε']}
+
+FOLLOW = {'программа': ['$'],
+ 'описание_хвост': [';'],
+ 'тип': [';'],
+ 'тело': ['.'],
+ 'оператор_список': ['end'],
+ 'оператор': [';', 'else'],
+ 'ввода_хвост': [')'],
+ 'вывода_хвост': [')'],
+ 'выражение': [')', ',', ';', 'do', 'else', 'then', 'to'],
+ 'знак_сравнения': ['(', 'false', 'true', 'идентификатор', 'число'],
+ 'сумма_хвост': [')', ',', ';', '<', '<=', '=', '>', '>=', 'do', 'else', 'then', 'to'],
+ 'операция_сложения': ['(', 'false', 'true', 'идентификатор', 'число'],
+ 'произведение_хвост': [')', '+', ',', '-', ';', '<', '<=', '=', '>', '>=', 'do', 'else', 'or', 'then', 'to'],
+ 'операция_умножения': ['(', 'false', 'true', 'идентификатор', 'число'],
+ 'множитель': [')', '*', '+', ',', '-', '/', ';', '<', '<=', '=', '>', '>=', 'and', 'do', 'else', 'or', 'then', 'to'],
+ 'текст_комментария': ['}'],
+ 'символ': ['\t',
+            '\n',
+            ' ',
+            '0',
+            '1',
+            '2',
+            '3',
+            '4',
+            '5',
+            '6',
+            '7',
+            '8',
+            '9',
+            'A',
+            'B',
+            'C',
+            'D',
+            'E',
+            'F',
+            'G',
+            'H',
+            'I',
+            'J',
+            'K',
+            'L',
+            'M',
+            'N',
+            'O',
+            'P',
+            'Q',
+            'R',
+            'S',
+            'T',
+            'U',
+            'V',
+            'W',
+            'X',
+            'Y',
+            'Z',
+            '_',
+            'a',
+            'b',
+            'c',
+            'd',
+            'e',
+            'f',
+            'g',
+            'h',
+            'i',
+            'j',
+            'k',
+            'l',
+            'm',
+            'n',
+            'o',
+            'p',
+            'q',
+            'r',
+            's',
+            't',
+            'u',
+            'v',
+            'w',
+            'x',
+            'y',
+            'z',
+            '}'],
+ 'оператор_fact0': [';', 'else'],
+ 'выражение_fact0': [')', ',', ';', 'do', 'else', 'then', 'to']}
+
+TABLE = {'программа': {'program': 0, '{': 1},
+ 'описание_хвост': {',': 0, ':': 1},
+ 'тип': {'%': 0, '!': 1, '$': 2},
+ 'тело': {'begin': 0, '{': 1},
+ 'оператор_список': {'begin': 0,
+                     'for': 0,
+                     'if': 0,
+                     'read': 0,
+                     'while': 0,
+                     'write': 0,
+                     '{': 0,
+                     'идентификатор': 0,
+                     'end': 1},
+ 'оператор': {'идентификатор': 0, 'while': 1, 'for': 2, 'begin': 3, 'read': 4, 'write': 5, '{': 6, 'if': 7},
+ 'ввода_хвост': {',': 0, ')': 1},
+ 'вывода_хвост': {',': 0, ')': 1},
+ 'выражение': {'not': 0, '(': 1, 'false': 1, 'true': 1, 'идентификатор': 1, 'число': 1},
+ 'знак_сравнения': {'=': 0, '<': 1, '>': 2, '<=': 3, '>=': 4},
+ 'сумма_хвост': {'+': 0,
+                 '-': 0,
+                 'or': 0,
+                 ')': 1,
+                 ',': 1,
+                 ';': 1,
+                 '<': 1,
+                 '<=': 1,
+                 '=': 1,
+                 '>': 1,
+                 '>=': 1,
+                 'do': 1,
+                 'else': 1,
+                 'then': 1,
+                 'to': 1},
+ 'операция_сложения': {'+': 0, '-': 1, 'or': 2},
+ 'произведение_хвост': {'*': 0,
+                        '/': 0,
+                        'and': 0,
+                        ')': 1,
+                        '+': 1,
+                        ',': 1,
+                        '-': 1,
+                        ';': 1,
+                        '<': 1,
+                        '<=': 1,
+                        '=': 1,
+                        '>': 1,
+                        '>=': 1,
+                        'do': 1,
+                        'else': 1,
+                        'or': 1,
+                        'then': 1,
+                        'to': 1},
+ 'операция_умножения': {'*': 0, '/': 1, 'and': 2},
+ 'множитель': {'идентификатор': 0, 'число': 1, '(': 2, 'true': 3, 'false': 4},
+ 'текст_комментария': {'\t': 0,
+                       '\n': 0,
+                       ' ': 0,
+                       '0': 0,
+                       '1': 0,
+                       '2': 0,
+                       '3': 0,
+                       '4': 0,
+                       '5': 0,
+                       '6': 0,
+                       '7': 0,
+                       '8': 0,
+                       '9': 0,
+                       'A': 0,
+                       'B': 0,
+                       'C': 0,
+                       'D': 0,
+                       'E': 0,
+                       'F': 0,
+                       'G': 0,
+                       'H': 0,
+                       'I': 0,
+                       'J': 0,
+                       'K': 0,
+                       'L': 0,
+                       'M': 0,
+                       'N': 0,
+                       'O': 0,
+                       'P': 0,
+                       'Q': 0,
+                       'R': 0,
+                       'S': 0,
+                       'T': 0,
+                       'U': 0,
+                       'V': 0,
+                       'W': 0,
+                       'X': 0,
+                       'Y': 0,
+                       'Z': 0,
+                       '_': 0,
+                       'a': 0,
+                       'b': 0,
+                       'c': 0,
+                       'd': 0,
+                       'e': 0,
+                       'f': 0,
+                       'g': 0,
+                       'h': 0,
+                       'i': 0,
+                       'j': 0,
+                       'k': 0,
+                       'l': 0,
+                       'm': 0,
+                       'n': 0,
+                       'o': 0,
+                       'p': 0,
+                       'q': 0,
+                       'r': 0,
+                       's': 0,
+                       't': 0,
+                       'u': 0,
+                       'v': 0,
+                       'w': 0,
+                       'x': 0,
+                       'y': 0,
+                       'z': 0,
+                       '}': 1},
+ 'символ': {'a': 0,
+            'b': 1,
+            'c': 2,
+            'd': 3,
+            'e': 4,
+            'f': 5,
+            'g': 6,
+            'h': 7,
+            'i': 8,
+            'j': 9,
+            'k': 10,
+            'l': 11,
+            'm': 12,
+            'n': 13,
+            'o': 14,
+            'p': 15,
+            'q': 16,
+            'r': 17,
+            's': 18,
+            't': 19,
+            'u': 20,
+            'v': 21,
+            'w': 22,
+            'x': 23,
+            'y': 24,
+            'z': 25,
+            'A': 26,
+            'B': 27,
+            'C': 28,
+            'D': 29,
+            'E': 30,
+            'F': 31,
+            'G': 32,
+            'H': 33,
+            'I': 34,
+            'J': 35,
+            'K': 36,
+            'L': 37,
+            'M': 38,
+            'N': 39,
+            'O': 40,
+            'P': 41,
+            'Q': 42,
+            'R': 43,
+            'S': 44,
+            'T': 45,
+            'U': 46,
+            'V': 47,
+            'W': 48,
+            'X': 49,
+            'Y': 50,
+            'Z': 51,
+            '0': 52,
+            '1': 53,
+            '2': 54,
+            '3': 55,
+            '4': 56,
+            '5': 57,
+            '6': 58,
+            '7': 59,
+            '8': 60,
+            '9': 61,
+            '_': 62,
+            ' ': 63,
+            '\t': 64,
+            '\n': 65},
+ 'оператор_fact0': {'else': 0, ';': 1},
+ 'выражение_fact0': {'<': 0,
+                     '<=': 0,
+                     '=': 0,
+                     '>': 0,
+                     '>=': 0,
+                     ')': 1,
+                     ',': 1,
+                     ';': 1,
+                     'do': 1,
+                     'else': 1,
+                     'then': 1,
+                     'to': 1}}
+
+CONFLICTS = [('оператор_fact0', 'else', [0, 1])]